@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Regenerate voice_mode/prompts/_manifest.py from the prompt modules on disk.
+Run this after adding, renaming or removing a prompt module.
+"""
+from pathlib import Path
+
+PROMPTS_DIR = Path(__file__).resolve().parent.parent / "voice_mode" / "prompts"
+
+TEMPLATE = '''"""Prompt module names, generated by scripts/gen-prompt-manifest.py. Do not edit."""
+
+_PROMPT_MODULES = (
+{entries})
+'''
+
+
+def find_prompt_modules(prompts_dir):
+    """Return sorted names of the prompt modules in prompts_dir."""
+    return sorted(
+        file.stem
+        for file in prompts_dir.glob("*.py")
+        if file.name != "__init__.py" and not file.name.startswith("_")
+    )
+
+
+def main():
+    entries = "".join(f'    "{name}",\n' for name in find_prompt_modules(PROMPTS_DIR))
+    manifest = PROMPTS_DIR / "_manifest.py"
+    manifest.write_text(TEMPLATE.format(entries=entries))
+    print(f"Wrote {manifest}")
+
+
+if __name__ == "__main__":
+    main()
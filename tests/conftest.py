@@ -124,6 +124,19 @@ def isolate_home_directory(tmp_path, monkeypatch):
     yield fake_home
 
 
+@pytest.fixture(autouse=True)
+def reset_provider_failures():
+    """Forget endpoint failures recorded by the global provider registry.
+
+    Failover skips local endpoints that failed a moment ago, so without this
+    a failure in one test would change which endpoints the next test tries.
+    """
+    yield
+    provider_discovery = sys.modules.get("voice_mode.provider_discovery")
+    if provider_discovery is not None:
+        provider_discovery.provider_registry.invalidate_discovery_cache()
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
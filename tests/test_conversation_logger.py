@@ -0,0 +1,88 @@
+"""Tests for the JSONL conversation logger."""
+
+import json
+from datetime import date
+from unittest.mock import patch
+
+from voice_mode.conversation_logger import ConversationLogger
+
+
+def test_log_utterance_appends_jsonl(tmp_path):
+    """Test that each utterance is appended as one JSON line."""
+    logger = ConversationLogger(base_dir=tmp_path)
+    logger.log_tts("hello", voice="af_sky")
+    logger.log_stt("hi there", model="whisper-1")
+    logger.flush()
+
+    log_file = next(tmp_path.glob("exchanges_*.jsonl"))
+    entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert [e["text"] for e in entries] == ["hello", "hi there"]
+    assert entries[0]["metadata"]["voice"] == "af_sky"
+    assert all(e["conversation_id"] == logger.conversation_id for e in entries)
+
+
+def test_last_entry_reused_without_rereading(tmp_path):
+    """Test that our own last write is returned without reopening the log."""
+    logger = ConversationLogger(base_dir=tmp_path)
+    logger.log_tts("hello")
+    logger.flush()
+
+    with patch("builtins.open", side_effect=AssertionError("log file reopened")):
+        last_entry = logger._get_last_log_entry()
+    assert last_entry["text"] == "hello"
+
+
+def test_last_entry_reread_after_external_append(tmp_path):
+    """Test that entries appended by another process are picked up."""
+    logger = ConversationLogger(base_dir=tmp_path)
+    logger.log_tts("hello")
+
+    other = ConversationLogger(base_dir=tmp_path)
+    other.conversation_id = "conv_other"
+    other.log_tts("from another process")
+    logger.flush()
+    other.flush()
+
+    last_entry = logger._get_last_log_entry()
+    assert last_entry["text"] == "from another process"
+    assert last_entry["conversation_id"] == "conv_other"
+
+
+def test_log_file_follows_date_rollover(tmp_path):
+    """Test that the cached log path switches to the new day's file."""
+    logger = ConversationLogger(base_dir=tmp_path)
+    assert logger._get_current_log_file(date(2025, 1, 1)) == tmp_path / "exchanges_2025-01-01.jsonl"
+    assert logger._get_current_log_file(date(2025, 1, 1)) is logger._log_file
+    assert logger._get_current_log_file(date(2025, 1, 2)) == tmp_path / "exchanges_2025-01-02.jsonl"
+
+
+def test_queued_entry_visible_before_it_is_written(tmp_path):
+    """Test that continuity checks see an entry the writer hasn't appended yet."""
+    logger = ConversationLogger(base_dir=tmp_path)
+    with patch.object(logger, "_write_entry") as write:
+        logger.log_tts("pending")
+        logger.flush()
+
+    write.assert_called_once()
+    assert not list(tmp_path.glob("exchanges_*.jsonl"))
+    assert logger._get_last_log_entry()["text"] == "pending"
+
+
+def test_close_writes_queued_entries_and_stops_writer(tmp_path):
+    """Test that close drains the queue, stops the thread and drops the atexit hook."""
+    logger = ConversationLogger(base_dir=tmp_path)
+    writer_thread = logger._writer_thread
+    logger.log_tts("hello")
+
+    with patch("voice_mode.conversation_logger.atexit.unregister") as unregister:
+        logger.close()
+        logger.close()
+
+    assert not writer_thread.is_alive()
+    unregister.assert_called_once_with(logger.close)
+
+    # Entries logged after closing are written straight away
+    logger.log_tts("after close")
+    log_file = next(tmp_path.glob("exchanges_*.jsonl"))
+    entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert [e["text"] for e in entries] == ["hello", "after close"]
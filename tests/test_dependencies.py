@@ -189,3 +189,57 @@ class TestPackageManagerSelection:
 
         with pytest.raises(RuntimeError, match="No supported package manager found"):
             get_package_manager()
+
+
+class TestBatchedChecks:
+    """Test checking several packages with one package manager query."""
+
+    @patch('subprocess.run')
+    def test_apt_check_packages_single_query(self, mock_run):
+        """Test that APT checks all packages with one dpkg-query call."""
+        mock_run.return_value = Mock(
+            returncode=1,
+            stdout='ffmpeg install ok installed\nlibsdl2-dev deinstall ok config-files\n'
+        )
+        manager = AptManager()
+        result = manager.check_packages(["ffmpeg", "libsdl2-dev", "missing-pkg"])
+
+        assert result == {"ffmpeg": True, "libsdl2-dev": False, "missing-pkg": False}
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0][-3:] == ["ffmpeg", "libsdl2-dev", "missing-pkg"]
+
+    @patch('subprocess.run')
+    def test_dnf_check_packages_single_query(self, mock_run):
+        """Test that DNF checks all packages with one rpm call."""
+        mock_run.return_value = Mock(
+            returncode=1,
+            stdout='portaudio\npackage missing-pkg is not installed\n'
+        )
+        manager = DnfManager()
+        assert manager.check_packages(["portaudio", "missing-pkg"]) == {
+            "portaudio": True,
+            "missing-pkg": False,
+        }
+        assert mock_run.call_count == 1
+
+    def test_check_dependencies_batches_package_manager_lookups(self):
+        """Test that packages without a check_command share one package manager call."""
+        from voice_mode.utils.dependencies.checker import check_dependencies
+
+        manager = Mock()
+        manager.check_packages.return_value = {"libfoo-dev": True, "libbar-dev": False}
+        packages = [
+            {"name": "libfoo-dev"},
+            {"name": "tool", "check_command": "tool --version"},
+            {"name": "libbar-dev"},
+        ]
+
+        with patch('voice_mode.utils.dependencies.checker.get_cache', return_value=DependencyCache()), \
+             patch('voice_mode.utils.dependencies.checker.get_package_manager', return_value=manager), \
+             patch('voice_mode.utils.dependencies.checker.check_dependency', return_value=True) as mock_check:
+            results = check_dependencies(packages, "debian")
+
+        assert results == {"libfoo-dev": True, "tool": True, "libbar-dev": False}
+        assert list(results) == ["libfoo-dev", "tool", "libbar-dev"]
+        manager.check_packages.assert_called_once_with(["libfoo-dev", "libbar-dev"])
+        mock_check.assert_called_once()
@@ -0,0 +1,142 @@
+"""Tests for download utilities."""
+
+import asyncio
+import functools
+import re
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from voice_mode.utils import download
+
+
+def _range_server(payload: bytes, seen_ranges: list):
+    """Mock transport serving payload with HEAD and byte-range support."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = {"Accept-Ranges": "bytes"}
+        if request.method == "HEAD":
+            return httpx.Response(200, headers={**headers, "Content-Length": str(len(payload))})
+        start, end = map(int, re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers["Range"]).groups())
+        seen_ranges.append((start, end))
+        return httpx.Response(206, headers=headers, content=payload[start:end + 1])
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_parallel_download_reassembles_ranges(tmp_path, monkeypatch):
+    """Test that ranged chunks are written back at their offsets."""
+    payload = bytes(range(256)) * 40
+    seen_ranges = []
+    monkeypatch.setattr(download, "PARALLEL_DOWNLOAD_MIN_SIZE", 1024)
+    client = functools.partial(httpx.AsyncClient, transport=_range_server(payload, seen_ranges))
+
+    with patch("httpx.AsyncClient", client):
+        ok = await download.download_parallel_async(
+            "https://example.com/ggml-base.bin", tmp_path / "ggml-base.bin", connections=3, quiet=True
+        )
+
+    assert ok
+    assert (tmp_path / "ggml-base.bin").read_bytes() == payload
+    assert sorted(seen_ranges) == [(0, 3413), (3414, 6827), (6828, 10239)]
+    assert not (tmp_path / "ggml-base.bin.part").exists()
+
+
+@pytest.mark.asyncio
+async def test_parallel_download_falls_back_for_small_files(tmp_path):
+    """Test that files below the threshold use the single-connection download."""
+    client = functools.partial(httpx.AsyncClient, transport=_range_server(b"tiny", []))
+
+    with patch("httpx.AsyncClient", client), \
+         patch.object(download, "download_with_progress_async", return_value=True) as fallback:
+        ok = await download.download_parallel_async("https://example.com/x.bin", tmp_path / "x.bin", quiet=True)
+
+    assert ok
+    fallback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_parallel_download_cancels_other_ranges_on_failure(tmp_path, monkeypatch):
+    """Test that a failed range stops the others before the .part file is removed."""
+    payload = bytes(4096)
+    cancelled = []
+
+    async def handler(request):
+        if request.method == "HEAD":
+            return httpx.Response(200, headers={"Accept-Ranges": "bytes", "Content-Length": str(len(payload))})
+        if request.headers["Range"].startswith("bytes=0-"):
+            return httpx.Response(500)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(request.headers["Range"])
+            raise
+        return httpx.Response(206, content=b"")
+
+    monkeypatch.setattr(download, "PARALLEL_DOWNLOAD_MIN_SIZE", 1024)
+    client = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+
+    with patch("httpx.AsyncClient", client):
+        ok = await asyncio.wait_for(download.download_parallel_async(
+            "https://example.com/ggml-base.bin", tmp_path / "ggml-base.bin", connections=3, quiet=True
+        ), timeout=5)
+
+    assert not ok
+    assert len(cancelled) == 2
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+    assert not (tmp_path / "ggml-base.bin.part").exists()
+
+
+@pytest.mark.asyncio
+async def test_parallel_download_reports_progress(tmp_path, monkeypatch, capsys):
+    """Test that ranged bytes feed the same progress output as single downloads."""
+    payload = bytes(10240)
+    monkeypatch.setattr(download, "PARALLEL_DOWNLOAD_MIN_SIZE", 1024)
+    client = functools.partial(httpx.AsyncClient, transport=_range_server(payload, []))
+
+    with patch("httpx.AsyncClient", client):
+        ok = await download.download_parallel_async(
+            "https://example.com/ggml-base.bin", tmp_path / "ggml-base.bin", connections=3, style="verbose"
+        )
+
+    assert ok
+    out = capsys.readouterr().out
+    assert "Progress: 100% (10.0 KB / 10.0 KB)" in out
+    assert "Download complete: ggml-base.bin" in out
+
+
+@pytest.mark.asyncio
+async def test_parallel_download_removes_part_file_when_cancelled(tmp_path, monkeypatch):
+    """Test that cancelling a download doesn't leave the preallocated .part file behind."""
+    started = asyncio.Event()
+
+    async def handler(request):
+        if request.method == "HEAD":
+            return httpx.Response(200, headers={"Accept-Ranges": "bytes", "Content-Length": "4096"})
+        started.set()
+        await asyncio.sleep(10)
+        return httpx.Response(206, content=b"")
+
+    monkeypatch.setattr(download, "PARALLEL_DOWNLOAD_MIN_SIZE", 1024)
+    client = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+
+    with patch("httpx.AsyncClient", client):
+        task = asyncio.create_task(download.download_parallel_async(
+            "https://example.com/ggml-base.bin", tmp_path / "ggml-base.bin", connections=3, quiet=True
+        ))
+        await asyncio.wait_for(started.wait(), timeout=5)
+        assert (tmp_path / "ggml-base.bin.part").exists()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert not (tmp_path / "ggml-base.bin.part").exists()
+    assert not (tmp_path / "ggml-base.bin").exists()
+
+
+def test_download_connections_from_env(monkeypatch):
+    """Test the VOICEMODE_DOWNLOAD_CONNECTIONS setting."""
+    monkeypatch.setenv("VOICEMODE_DOWNLOAD_CONNECTIONS", "4")
+    assert download.get_download_connections() == 4
+    monkeypatch.setenv("VOICEMODE_DOWNLOAD_CONNECTIONS", "lots")
+    assert download.get_download_connections() == 8
@@ -5,6 +5,7 @@ This test suite would have caught the bug reported in issue #68.
 
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
+from dataclasses import fields
 from datetime import datetime
 
 from voice_mode.provider_discovery import EndpointInfo, ProviderRegistry
@@ -209,7 +210,7 @@ class TestEndpointInfoCorrectStructure:
             voices=[]
         )
 
-        existing_fields = set(vars(endpoint).keys())
+        existing_fields = {f.name for f in fields(endpoint)}
         required_set = set(['base_url', 'models', 'voices', 'provider_type', 'last_check', 'last_error'])
 
         # These should be equal if all required fields exist
@@ -218,4 +219,17 @@ class TestEndpointInfoCorrectStructure:
         # Document missing fields
         missing_fields = ['healthy', 'last_health_check', 'response_time_ms', 'error']
         for field in missing_fields:
-            assert not hasattr(endpoint, field), f"Field {field} unexpectedly exists"
\ No newline at end of file
+            assert not hasattr(endpoint, field), f"Field {field} unexpectedly exists"
+
+
+def test_endpoint_info_rejects_unknown_attributes():
+    """Test that EndpointInfo is slotted, so typos in field names fail loudly."""
+    endpoint = EndpointInfo(
+        base_url="http://127.0.0.1:8880/v1",
+        models=["tts-1"],
+        voices=["af_sky"],
+    )
+
+    assert not hasattr(endpoint, "__dict__")
+    with pytest.raises(AttributeError):
+        endpoint.healthy = True
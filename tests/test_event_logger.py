@@ -0,0 +1,16 @@
+"""Tests for event logger timestamps."""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from voice_mode.utils import event_logger
+
+
+def test_utc_timestamp_matches_isoformat():
+    """Test that cached-second timestamps read back as the same instant."""
+    for now in (1736503200.25, 1736503200.75, 1736503201.0):
+        with patch("time.time", return_value=now):
+            stamp = event_logger._utc_timestamp()
+        expected = datetime.fromtimestamp(now, timezone.utc)
+        assert abs((datetime.fromisoformat(stamp) - expected).total_seconds()) < 1e-5
+        assert stamp.endswith("+00:00")
@@ -0,0 +1,137 @@
+"""Tests for reading exchange JSONL logs."""
+
+import io
+import json
+from datetime import date, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from voice_mode.exchanges.models import Exchange
+from voice_mode.exchanges.reader import ExchangeReader, _iter_lines
+
+
+def _entry(text, conversation_id="conv_1", timestamp="2025-01-02T10:00:00+00:00"):
+    return json.dumps({
+        "version": 3,
+        "timestamp": timestamp,
+        "conversation_id": conversation_id,
+        "type": "tts",
+        "text": text,
+    })
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 1 << 20])
+def test_iter_lines_across_chunk_boundaries(chunk_size):
+    """Test that lines are framed the same whatever the chunk size."""
+    data = b"first\n\nsecond line\nthird"
+    lines = list(_iter_lines(io.BytesIO(data), chunk_size=chunk_size))
+    assert lines == [b"first", b"", b"second line", b"third"]
+
+
+def test_iter_lines_trailing_newline():
+    """Test that a trailing newline does not produce an extra empty line."""
+    assert list(_iter_lines(io.BytesIO(b"a\nb\n"), chunk_size=2)) == [b"a", b"b"]
+    assert list(_iter_lines(io.BytesIO(b""))) == []
+
+
+def test_read_file_skips_bad_lines(tmp_path):
+    """Test that blank and malformed lines are skipped without losing the rest."""
+    reader = ExchangeReader(base_dir=tmp_path)
+    log_file = reader.logs_dir / "exchanges_2025-01-02.jsonl"
+    log_file.write_text("\n".join([_entry("héllo"), "", "not json", _entry("bye")]) + "\n")
+
+    assert [e.text for e in reader._read_file(log_file)] == ["héllo", "bye"]
+
+
+def test_read_file_skips_non_object_lines_without_parsing(tmp_path):
+    """Test that lines that can't be a JSON object never reach the parser."""
+    reader = ExchangeReader(base_dir=tmp_path)
+    log_file = reader.logs_dir / "exchanges_2025-01-02.jsonl"
+    log_file.write_text("\n".join(["garbage", _entry("kept"), "  ", '"partial']) + "\n")
+
+    with patch("voice_mode.exchanges.reader.Exchange.from_jsonl", wraps=Exchange.from_jsonl) as parse:
+        assert [e.text for e in reader._read_file(log_file)] == ["kept"]
+    assert parse.call_count == 1
+
+
+def test_read_all_since_skips_older_days(tmp_path):
+    """Test that log files for days before the cutoff are not read."""
+    reader = ExchangeReader(base_dir=tmp_path)
+    for day in ("2025-01-01", "2025-01-04", "2025-01-05"):
+        (reader.logs_dir / f"exchanges_{day}.jsonl").write_text(
+            _entry(day, timestamp=f"{day}T10:00:00+00:00") + "\n"
+        )
+    (reader.logs_dir / "exchanges_backup.jsonl").write_text(_entry("backup") + "\n")
+
+    texts = [e.text for e in reader._read_all(since=datetime(2025, 1, 5, 9, 0))]
+    assert texts == ["2025-01-04", "2025-01-05", "backup"]
+    assert len(list(reader._read_all())) == 4
+
+
+def test_iter_lines_long_line_spanning_chunks():
+    """Test that a line much longer than the chunk size is reassembled intact."""
+    long_line = b"x" * 10_000
+    data = b"a\n" + long_line + b"\nb"
+    assert list(_iter_lines(io.BytesIO(data), chunk_size=16)) == [b"a", long_line, b"b"]
+
+
+def test_compress_logs_keeps_entries_readable(tmp_path):
+    """Test that compressed past days are still read, and recent days stay plain."""
+    reader = ExchangeReader(base_dir=tmp_path)
+    for day in ("2025-01-01", "2025-01-04"):
+        (reader.logs_dir / f"exchanges_{day}.jsonl").write_text(
+            _entry(day, timestamp=f"{day}T10:00:00+00:00") + "\n"
+        )
+
+    compressed = reader.compress_logs(date(2025, 1, 4))
+
+    assert compressed == [reader.logs_dir / "exchanges_2025-01-01.jsonl.gz"]
+    assert sorted(p.name for p in reader.logs_dir.iterdir()) == [
+        "exchanges_2025-01-01.jsonl.gz", "exchanges_2025-01-04.jsonl",
+    ]
+    assert [e.text for e in reader.read_date(date(2025, 1, 1))] == ["2025-01-01"]
+    assert [e.text for e in reader._read_all()] == ["2025-01-01", "2025-01-04"]
+    assert [e.text for e in reader._read_all(since=datetime(2025, 1, 4))] == ["2025-01-04"]
+
+
+def test_compress_logs_appends_to_existing_archive(tmp_path):
+    """Test that a day compressed before keeps its entries when compressed again."""
+    reader = ExchangeReader(base_dir=tmp_path)
+    log_file = reader.logs_dir / "exchanges_2025-01-01.jsonl"
+    log_file.write_text(_entry("first", timestamp="2025-01-01T10:00:00+00:00") + "\n")
+    reader.compress_logs(date(2025, 1, 2))
+
+    log_file.write_text(_entry("second", timestamp="2025-01-01T11:00:00+00:00") + "\n")
+    reader.compress_logs(date(2025, 1, 2))
+
+    assert not log_file.exists()
+    assert [e.text for e in reader.read_date(date(2025, 1, 1))] == ["first", "second"]
+
+
+def test_compress_logs_rolls_back_when_source_cannot_be_removed(tmp_path):
+    """Test that an archive isn't left next to a plain file it duplicates."""
+    reader = ExchangeReader(base_dir=tmp_path)
+    log_file = reader.logs_dir / "exchanges_2025-01-01.jsonl"
+    log_file.write_text(_entry("first", timestamp="2025-01-01T10:00:00+00:00") + "\n")
+    reader.compress_logs(date(2025, 1, 2))
+    archive = reader.logs_dir / "exchanges_2025-01-01.jsonl.gz"
+    archived = archive.read_bytes()
+
+    other_day = reader.logs_dir / "exchanges_2024-12-31.jsonl"
+    other_day.write_text(_entry("older", timestamp="2024-12-31T10:00:00+00:00") + "\n")
+    log_file.write_text(_entry("second", timestamp="2025-01-01T11:00:00+00:00") + "\n")
+    original_unlink = Path.unlink
+
+    def unlink(path, missing_ok=False):
+        if path.suffix == ".jsonl":
+            raise PermissionError("busy")
+        original_unlink(path, missing_ok=missing_ok)
+
+    with patch.object(Path, "unlink", unlink):
+        assert reader.compress_logs(date(2025, 1, 2)) == []
+
+    assert archive.read_bytes() == archived
+    assert not (reader.logs_dir / "exchanges_2024-12-31.jsonl.gz").exists()
+    assert other_day.exists() and log_file.exists()
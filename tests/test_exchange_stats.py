@@ -0,0 +1,65 @@
+"""Tests for exchange statistics."""
+
+import json
+
+from voice_mode.exchanges.models import Exchange
+from voice_mode.exchanges.stats import ExchangeStats
+
+
+def _exchange(second, type_, timing=None, silence_detection=None, model=None, error=None):
+    return Exchange.from_jsonl(json.dumps({
+        "version": 3,
+        "timestamp": f"2025-01-02T10:00:{second:02d}+00:00",
+        "conversation_id": "conv_1",
+        "type": type_,
+        "text": "hello",
+        "metadata": {
+            "voice_mode_version": "2.0.0",
+            "timing": timing,
+            "silence_detection": silence_detection,
+            "model": model,
+            "error": error,
+        },
+    }))
+
+
+def test_timing_and_silence_detection_stats():
+    """Test timing metrics and VAD recording averages from one pass each."""
+    stats = ExchangeStats([
+        _exchange(0, "stt", "record 3.2s, stt 1.4s", {"enabled": True}),
+        _exchange(1, "tts", "ttfa 1.2s, gen 2.3s, play 5.6s"),
+        _exchange(2, "stt", "record 5.0s, stt 1.0s", {"enabled": False}),
+        _exchange(4, "tts", "ttfa 0.8s"),
+        _exchange(5, "stt", None, {"enabled": True}),
+    ])
+
+    timing = stats.timing_stats()
+    assert timing["stt"]["record"]["count"] == 2
+    assert timing["tts"]["ttfa"]["avg"] == 1.0
+    assert timing["tts"]["playback"]["max"] == 5.6
+    assert timing["overall"]["turnaround_count"] == 4
+    assert timing["overall"]["max_turnaround"] == 2.0
+
+    vad = stats.silence_detection_stats()
+    assert vad["vad_enabled_count"] == 2
+    assert vad["vad_disabled_count"] == 1
+    assert vad["avg_record_time_with_vad"] == 3.2
+    assert vad["avg_record_time_without_vad"] == 5.0
+
+
+def test_model_and_error_breakdowns():
+    """Test that models and error categories are counted per exchange."""
+    stats = ExchangeStats([
+        _exchange(0, "stt", model="whisper-1", error="Request timeout"),
+        _exchange(1, "tts", model="tts-1"),
+        _exchange(2, "stt", model="whisper-1", error="Rate limit exceeded"),
+        _exchange(3, "tts", error="boom"),
+    ])
+
+    assert stats.model_breakdown() == {
+        "stt": {"whisper-1": 2},
+        "tts": {"tts-1": 1, "unknown": 1},
+    }
+    errors = stats.error_stats()
+    assert errors["error_types"] == {"timeout": 1, "rate_limit": 1, "other": 1}
+    assert errors["errors_by_type"] == {"stt": 2, "tts": 1}
@@ -6,6 +6,7 @@ import sys
 import platform
 
 from voice_mode.utils.ffmpeg_check import (
+    _find_executable,
     check_ffmpeg,
     check_ffprobe,
     get_ffmpeg_version,
@@ -15,6 +16,14 @@ from voice_mode.utils.ffmpeg_check import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_executable_cache():
+    """Re-probe for executables in each test instead of reusing cached lookups."""
+    _find_executable.cache_clear()
+    yield
+    _find_executable.cache_clear()
+
+
 class TestFFmpegDetection:
     """Test FFmpeg detection functions."""
     
@@ -161,4 +170,17 @@ class TestManualTesting:
         2. Run with modified PATH: PATH=/tmp/empty-bin:$PATH uvx voice-mode
         3. Verify error message appears
         """
-        pass  # This is just documentation
\ No newline at end of file
+        pass  # This is just documentation
+
+
+def test_executable_lookup_cached_per_path(monkeypatch):
+    """Test that PATH is searched once until it changes."""
+    monkeypatch.setenv('PATH', '/usr/bin')
+    with patch('shutil.which', return_value='/usr/bin/ffmpeg') as which:
+        assert check_ffmpeg() == (True, '/usr/bin/ffmpeg')
+        assert check_ffmpeg() == (True, '/usr/bin/ffmpeg')
+        assert which.call_count == 1
+
+        monkeypatch.setenv('PATH', '/opt/bin:/usr/bin')
+        check_ffmpeg()
+        assert which.call_count == 2
@@ -0,0 +1,21 @@
+"""Tests for GPU detection caching."""
+
+from unittest.mock import patch, MagicMock
+
+from voice_mode.utils import gpu_detection
+
+
+def test_detect_gpu_probes_once_per_path(monkeypatch):
+    """Test that repeated detection reuses the probe until PATH changes."""
+    gpu_detection._detect_gpu.cache_clear()
+    monkeypatch.setenv("PATH", "/usr/bin")
+    with patch("platform.system", return_value="Linux"), \
+         patch("subprocess.run", return_value=MagicMock(returncode=0)) as mock_run:
+        assert gpu_detection.detect_gpu() == (True, "cuda")
+        assert gpu_detection.detect_gpu() == (True, "cuda")
+        assert mock_run.call_count == 1
+
+        monkeypatch.setenv("PATH", "/usr/local/bin:/usr/bin")
+        gpu_detection.detect_gpu()
+        assert mock_run.call_count == 2
+    gpu_detection._detect_gpu.cache_clear()
@@ -91,7 +91,7 @@ def discover_all_commands() -> List[List[str]]:
     # Pronunciation now uses environment variables (VOICEMODE_PRONOUNCE)
 
     # === EXCHANGES COMMANDS ===
-    exchanges_subcommands = ['export', 'search', 'stats', 'tail', 'view']
+    exchanges_subcommands = ['compress', 'export', 'search', 'stats', 'tail', 'view']
     for sub in exchanges_subcommands:
         commands.append(base_cmd + ['exchanges', sub, '--help'])
         commands.append(base_cmd + ['exchanges', sub, '-h'])
@@ -0,0 +1,34 @@
+"""Tests for the optional-orjson JSON helpers."""
+
+import pytest
+
+from voice_mode.utils import json_codec
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with and without orjson."""
+    if request.param and not json_codec.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(json_codec, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+def test_round_trip(backend):
+    """Test that dumps output parses back to the same object."""
+    data = {"voice": "af_sky", "count": 3, "ok": True, "text": "héllo"}
+    encoded = json_codec.dumps(data)
+    assert isinstance(encoded, bytes)
+    assert json_codec.loads(encoded) == data
+    assert json_codec.loads(encoded.decode("utf-8")) == data
+
+
+def test_loads_memoryview(backend):
+    """Test that memoryview input is accepted."""
+    assert json_codec.loads(memoryview(b'{"a": 1}')) == {"a": 1}
+
+
+def test_invalid_json_raises_decode_error(backend):
+    """Test that malformed input raises the shared JSONDecodeError."""
+    with pytest.raises(json_codec.JSONDecodeError):
+        json_codec.loads(b'{"a": ')
@@ -227,4 +227,67 @@ class TestOpenAIErrorParser:
 
         result = OpenAIErrorParser.parse_error(mock_exception, endpoint=endpoint)
 
-        assert result['endpoint'] == endpoint
\ No newline at end of file
+        assert result['endpoint'] == endpoint
+
+    def test_determine_error_type_by_exception_class(self):
+        """Test that known exception classes are classified without message checks."""
+        error_info = {
+            'type': 'AuthenticationError',
+            'message': 'Something unexpected'
+        }
+        assert OpenAIErrorParser._determine_error_type(error_info) == 'auth_failed'
+
+    def test_determine_error_type_unknown(self):
+        """Test that unmatched errors fall through to unknown."""
+        error_info = {
+            'type': 'Exception',
+            'message': 'Connection failed',
+            'status_code': 500
+        }
+        assert OpenAIErrorParser._determine_error_type(error_info) == 'unknown'
+
+    def test_parse_error_does_not_mutate_templates(self):
+        """Test that per-call fields are never written into the shared templates."""
+        mock_exception = Mock()
+        mock_exception.response = Mock()
+        mock_exception.response.status_code = 401
+        mock_exception.__str__ = Mock(return_value="Invalid API key")
+
+        result = OpenAIErrorParser.parse_error(mock_exception, endpoint="https://api.openai.com/v1")
+        result['title'] = 'changed'
+
+        template = OpenAIErrorParser.ERROR_MESSAGES['auth_failed']
+        assert template['title'] == '🔐 OpenAI Authentication Failed'
+        assert 'endpoint' not in template
+        assert 'raw_error' not in template
+
+    def test_determine_error_type_is_cached(self):
+        """Test that repeated errors are classified once and results stay distinct."""
+        OpenAIErrorParser._classify.cache_clear()
+        error_info = {
+            'type': 'RateLimitError',
+            'message': 'Rate limit reached',
+            'status_code': 429,
+            'response_text': 'You exceeded your current quota'
+        }
+
+        assert OpenAIErrorParser._determine_error_type(error_info) == 'quota_exceeded'
+        assert OpenAIErrorParser._determine_error_type(dict(error_info)) == 'quota_exceeded'
+        assert OpenAIErrorParser._classify.cache_info().hits == 1
+
+        # Same message with a different response body is classified separately
+        error_info['response_text'] = 'Too many requests'
+        assert OpenAIErrorParser._determine_error_type(error_info) == 'rate_limit'
+
+    def test_determine_error_type_unhashable_payload(self):
+        """Test that unhashable fields fall back to uncached classification."""
+        class UnhashableText(str):
+            __hash__ = None
+
+        error_info = {
+            'type': 'Exception',
+            'message': 'Connection failed',
+            'status_code': 429,
+            'response_text': UnhashableText('You exceeded your quota')
+        }
+        assert OpenAIErrorParser._determine_error_type(error_info) == 'quota_exceeded'
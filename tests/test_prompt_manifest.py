@@ -0,0 +1,19 @@
+"""Tests that the generated prompt manifest matches the prompt modules on disk."""
+
+from pathlib import Path
+
+from voice_mode.prompts._manifest import _PROMPT_MODULES
+
+
+def test_manifest_matches_prompt_modules():
+    """Fails when a prompt module was added or removed without regenerating the manifest.
+
+    Fix by running: python scripts/gen-prompt-manifest.py
+    """
+    prompts_dir = Path(__file__).parent.parent / "voice_mode" / "prompts"
+    on_disk = sorted(
+        file.stem
+        for file in prompts_dir.glob("*.py")
+        if file.name != "__init__.py" and not file.name.startswith("_")
+    )
+    assert list(_PROMPT_MODULES) == on_disk
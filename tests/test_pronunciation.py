@@ -213,3 +213,117 @@ def test_stt_processing():
             os.environ['VOICEMODE_PRONOUNCE'] = original
         else:
             os.environ.pop('VOICEMODE_PRONOUNCE', None)
+
+
+def test_prefilter_combines_rules():
+    """Test that the prefilter matches wherever any rule matches."""
+    from voice_mode.pronounce import build_prefilter
+
+    rules = parse_compact_rules('TTS \\bbag\\b carrier\nTTS foo bar')['tts']
+    prefilter = build_prefilter(rules)
+    assert prefilter is not None
+    assert prefilter.search('my bag')
+    assert prefilter.search('food')
+    assert not prefilter.search('bagging nothing')
+
+
+def test_prefilter_skips_backreferences():
+    """Test that rules with backreferences disable the prefilter."""
+    from voice_mode.pronounce import build_prefilter
+
+    rules = parse_compact_rules('TTS (\\w)\\1 x\nTTS foo bar')['tts']
+    assert build_prefilter(rules) is None
+    assert build_prefilter([]) is None
+
+
+def test_tts_processing_chains_rules():
+    """Test that later rules still see the output of earlier rules."""
+    original = os.environ.get('VOICEMODE_PRONOUNCE')
+
+    try:
+        os.environ['VOICEMODE_PRONOUNCE'] = 'TTS bag carrier\nTTS carrier truck'
+        manager = PronounceManager()
+        assert manager.process_tts('my bag') == 'my truck'
+        assert manager.process_tts('nothing here') == 'nothing here'
+    finally:
+        if original:
+            os.environ['VOICEMODE_PRONOUNCE'] = original
+        else:
+            os.environ.pop('VOICEMODE_PRONOUNCE', None)
+
+
+def test_get_manager_returns_single_instance():
+    """Test that the global manager is created once and reused."""
+    import voice_mode.pronounce as pronounce
+
+    original = pronounce._manager
+    try:
+        pronounce._manager = None
+        manager = pronounce.get_manager()
+        assert pronounce.get_manager() is manager
+    finally:
+        pronounce._manager = original
+
+
+def test_manager_skips_duplicate_rules():
+    """Test that a rule repeated across variables is only applied once."""
+    originals = {
+        'VOICEMODE_PRONOUNCE': os.environ.get('VOICEMODE_PRONOUNCE'),
+        'VOICEMODE_PRONOUNCE_TEST': os.environ.get('VOICEMODE_PRONOUNCE_TEST')
+    }
+
+    try:
+        os.environ['VOICEMODE_PRONOUNCE'] = 'TTS bag "bag carrier"'
+        os.environ['VOICEMODE_PRONOUNCE_TEST'] = 'TTS bag "bag carrier"\nSTT bag "bag carrier"'
+        manager = PronounceManager()
+        assert len(manager.rules['tts']) == 1
+        assert len(manager.rules['stt']) == 1
+        assert manager.process_tts('my bag') == 'my bag carrier'
+    finally:
+        for key, value in originals.items():
+            if value:
+                os.environ[key] = value
+            else:
+                os.environ.pop(key, None)
+
+
+@pytest.mark.parametrize("rule_part", [
+    'TTS bag carrier',
+    'TTS bag "bag carrier"',
+    r'TTS \bbag\b carrier',
+    "TTS 'x y' \"z w\"",
+    'TTS "ab"cd ef',
+    "TTS it's fine",
+    'TTS a"b c" d',
+    '  TTS   a\tb  ',
+    'TTS "" x',
+])
+def test_split_rule_tokens_matches_shlex(rule_part):
+    """Test that rule tokenizing matches shlex.split(posix=False)."""
+    import shlex
+    from voice_mode.pronounce import split_rule_tokens
+
+    assert split_rule_tokens(rule_part) == shlex.split(rule_part, posix=False)
+
+
+def test_split_rule_tokens_unclosed_quote():
+    """Test that an unclosed quote is rejected like shlex does."""
+    from voice_mode.pronounce import split_rule_tokens
+
+    with pytest.raises(ValueError):
+        split_rule_tokens('TTS "bag carrier')
+    assert parse_compact_rules('TTS "bag carrier')['tts'] == []
+
+
+def test_processing_without_rules_returns_text_untouched():
+    """Test that an empty rule set skips all per-call work."""
+    from unittest.mock import patch
+
+    manager = PronounceManager()
+    manager.rules = {'tts': [], 'stt': []}
+
+    with patch('voice_mode.pronounce.os.environ.get') as env_get:
+        assert manager.process_tts('my bag') == 'my bag'
+        assert manager.process_stt('my bag') == 'my bag'
+        assert manager.process_tts('') == ''
+    env_get.assert_not_called()
@@ -2,10 +2,14 @@
 
 import pytest
 import asyncio
-from unittest.mock import patch
+import io
+import time
+from unittest.mock import MagicMock, patch
 
 from voice_mode import config
-from voice_mode.provider_discovery import ProviderRegistry, is_local_provider, detect_provider_type
+from voice_mode.provider_discovery import (
+    DISCOVERY_FAILURE_TTL, ProviderRegistry, is_local_provider, detect_provider_type
+)
 
 
 class TestProviderResilience:
@@ -148,4 +152,139 @@ class TestProviderResilience:
                 if endpoint.base_url == test_urls[0]:
                     assert endpoint.last_error == "Local service down"
                 elif endpoint.base_url == test_urls[1]:
-                    assert endpoint.last_error == "API limit reached"
\ No newline at end of file
+                    assert endpoint.last_error == "API limit reached"
+
+    @pytest.mark.asyncio
+    async def test_discover_endpoints_shares_http_client(self):
+        """Test that concurrent discovery passes one HTTP client to every probe."""
+        registry = ProviderRegistry()
+        urls = ["http://127.0.0.1:8880/v1", "https://api.openai.com/v1"]
+        seen_clients = []
+
+        async def fake_discover(service_type, base_url, http_client=None):
+            seen_clients.append(http_client)
+            if base_url == urls[1]:
+                raise RuntimeError("boom")
+
+        with patch.object(registry, '_discover_endpoint', side_effect=fake_discover):
+            await registry._discover_endpoints("tts", urls, refresh=True)
+
+        assert len(seen_clients) == 2
+        assert seen_clients[0] is not None
+        assert seen_clients[0] is seen_clients[1]
+        # Errors are attributed to the URL that raised them
+        assert registry.registry["tts"][urls[1]].last_error == "boom"
+        assert urls[0] not in registry.registry["tts"]
+
+    @pytest.mark.asyncio
+    async def test_recently_failed_local_endpoint(self):
+        """Test that a failed local endpoint is reported as recently failed until reset."""
+        registry = ProviderRegistry()
+        url = "http://127.0.0.1:8880/v1"
+
+        with patch('voice_mode.provider_discovery.AsyncOpenAI', side_effect=RuntimeError("Connection refused")):
+            await registry._discover_endpoint("tts", url)
+        assert registry.registry["tts"][url].last_error == "Connection refused"
+        assert registry.recently_failed("tts", url)
+
+        # Explicit invalidation allows an immediate retry
+        registry.invalidate_discovery_cache("tts", url)
+        assert not registry.recently_failed("tts", url)
+
+        await registry.mark_failed("tts", url, "Connection refused")
+        assert registry.recently_failed("tts", url)
+        with patch('voice_mode.provider_discovery.time.monotonic', return_value=time.monotonic() + DISCOVERY_FAILURE_TTL):
+            assert not registry.recently_failed("tts", url)
+
+    @pytest.mark.asyncio
+    async def test_failover_skips_recently_failed_local_endpoint(self):
+        """Test that per-request failover doesn't retry a local endpoint that just failed."""
+        from voice_mode.simple_failover import simple_stt_failover
+
+        local_url = "http://127.0.0.1:2022/v1"
+        remote_url = "https://api.openai.com/v1"
+        registry = ProviderRegistry()
+        attempted = []
+
+        def make_client(base_url, **kwargs):
+            client = MagicMock()
+
+            async def create(**kwargs):
+                attempted.append(base_url)
+                if base_url == local_url:
+                    raise ConnectionError("Connection refused")
+                return "hello"
+
+            client.audio.transcriptions.create = create
+            return client
+
+        with patch('voice_mode.simple_failover.provider_registry', registry), \
+             patch('voice_mode.simple_failover.STT_BASE_URLS', [local_url, remote_url]), \
+             patch('voice_mode.simple_failover.AsyncOpenAI', side_effect=make_client):
+            first = await simple_stt_failover(io.BytesIO(b"audio"))
+            second = await simple_stt_failover(io.BytesIO(b"audio"))
+
+            # Once reset, the local endpoint is tried first again
+            registry.invalidate_discovery_cache()
+            await simple_stt_failover(io.BytesIO(b"audio"))
+
+        assert first["text"] == second["text"] == "hello"
+        assert attempted == [local_url, remote_url, remote_url, local_url, remote_url]
+
+    @pytest.mark.asyncio
+    async def test_failover_retries_when_every_endpoint_failed(self):
+        """Test that failover still tries local endpoints when none are left."""
+        from voice_mode.simple_failover import _failover_candidates
+
+        url = "http://127.0.0.1:2022/v1"
+        registry = ProviderRegistry()
+        await registry.mark_failed("stt", url, "Connection refused")
+
+        with patch('voice_mode.simple_failover.provider_registry', registry):
+            assert _failover_candidates("stt", [url]) == [url]
+
+    @pytest.mark.asyncio
+    async def test_refresh_tool_reprobes_recently_failed_endpoint(self):
+        """Test that an explicit refresh_provider_registry call ignores the failure TTL."""
+        from voice_mode.tools.providers import refresh_provider_registry
+
+        registry = ProviderRegistry()
+        url = "http://127.0.0.1:8880/v1"
+
+        with patch('voice_mode.provider_discovery.AsyncOpenAI', side_effect=RuntimeError("Connection refused")):
+            await registry._discover_endpoint("tts", url)
+
+        with patch('voice_mode.tools.providers.provider_registry', registry), \
+             patch('voice_mode.tools.providers.TTS_BASE_URLS', [url]), \
+             patch.object(registry, '_discover_endpoint') as mock_discover:
+            await refresh_provider_registry.fn(service_type="tts", optimistic=False)
+            assert mock_discover.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_remote_failures_are_not_skipped(self):
+        """Test that failures of remote endpoints are not remembered."""
+        registry = ProviderRegistry()
+        url = "https://api.openai.com/v1"
+
+        with patch('voice_mode.provider_discovery.AsyncOpenAI', side_effect=RuntimeError("boom")):
+            await registry._discover_endpoint("tts", url)
+        await registry.mark_failed("tts", url, "boom")
+
+        assert not registry.recently_failed("tts", url)
+
+    @pytest.mark.asyncio
+    async def test_probe_updates_existing_endpoint_in_place(self):
+        """Test that repeated probes update the registry entry rather than replace it."""
+        registry = ProviderRegistry()
+        url = "http://127.0.0.1:8880/v1"
+
+        with patch('voice_mode.provider_discovery.AsyncOpenAI', side_effect=RuntimeError("Connection refused")):
+            await registry._discover_endpoint("tts", url)
+        info = registry.registry["tts"][url]
+        assert info.provider_type == "kokoro"
+
+        with patch('voice_mode.provider_discovery.AsyncOpenAI', side_effect=RuntimeError("Timed out")):
+            await registry._discover_endpoint("tts", url)
+        assert registry.registry["tts"][url] is info
+        assert info.last_error == "Timed out"
+        assert info.models == [] and info.voices == []
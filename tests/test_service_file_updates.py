@@ -14,6 +14,7 @@ from voice_mode.tools.service import (
     update_service_files
 )
 from voice_mode.utils.gpu_detection import has_gpu_support
+from voice_mode.utils.services.common import fill_service_template, write_service_file
 
 
 def test_load_service_file_version():
@@ -64,7 +65,7 @@ async def test_update_service_files_needs_update():
         with patch('voice_mode.tools.service.load_service_file_version') as mock_template:
             with patch('voice_mode.tools.service.load_service_template') as mock_load:
                 with patch('pathlib.Path.exists') as mock_exists:
-                    with patch('pathlib.Path.write_text') as mock_write:
+                    with patch('pathlib.Path.write_text') as mock_write, patch('os.replace'):
                         with patch('pathlib.Path.rename') as mock_rename:
                             with patch('subprocess.run') as mock_run:
                                 with patch('voice_mode.tools.service.find_process_by_port') as mock_find:
@@ -231,4 +232,24 @@ def test_get_service_config_vars_selects_cpu_script_when_no_gpu():
                 
                 # Should select CPU script
                 assert "start-cpu.sh" in config_vars["START_SCRIPT"]
-                assert Path(config_vars["START_SCRIPT"]).exists()
\ No newline at end of file
+                assert Path(config_vars["START_SCRIPT"]).exists()
+
+
+def test_write_service_file_replaces_atomically(tmp_path):
+    """Test that service files are swapped in whole via a temp file."""
+    service_path = tmp_path / "voicemode-kokoro.service"
+    service_path.write_text("old")
+
+    with patch("os.replace", wraps=os.replace) as mock_replace:
+        write_service_file(service_path, "[Service]\nExecStart=/bin/true\n")
+
+    mock_replace.assert_called_once_with(tmp_path / "voicemode-kokoro.service.tmp", service_path)
+    assert service_path.read_text() == "[Service]\nExecStart=/bin/true\n"
+    assert not (tmp_path / "voicemode-kokoro.service.tmp").exists()
+
+
+def test_fill_service_template_single_pass():
+    """Test that placeholders are filled and unknown ones left intact."""
+    template = "ExecStart={START_SCRIPT}\nPort={KOKORO_PORT}\nKeep={UNKNOWN} ${HOME}\n"
+    content = fill_service_template(template, {"START_SCRIPT": "/opt/start.sh", "KOKORO_PORT": 8880})
+    assert content == "ExecStart=/opt/start.sh\nPort=8880\nKeep={UNKNOWN} ${HOME}\n"
@@ -0,0 +1,34 @@
+"""Tests for conversation statistics tracking."""
+
+import pytest
+
+from voice_mode.statistics import ConversationStatistics
+
+
+@pytest.mark.parametrize("timing_str,expected", [
+    ("ttfa 0.5s, tts_gen 1.2s, tts_play 2.1s, record 15.0s, stt 0.8s, total 19.1s",
+     {"ttfa": 0.5, "tts_gen": 1.2, "tts_play": 2.1, "record": 15.0, "stt": 0.8, "total": 19.1}),
+    ("gen 12s", {"gen": 12.0}),
+    ("ttfa 1.0s, broken, play 2.0ms, stt 0.4s", {"ttfa": 1.0, "stt": 0.4}),
+    ("ttfa 1.0s, ttfa 2.0s", {"ttfa": 2.0}),
+    # Anything float() accepts between the metric and the trailing "s"
+    ("ttfa 1e-3s, tts_gen -0.5s, tts_play  0.5s, stt 0.5 s",
+     {"ttfa": 0.001, "tts_gen": -0.5, "tts_play": 0.5, "stt": 0.5}),
+    ("ttfa, 0.5s, stt 0.4s", {"stt": 0.4}),
+    ("", {}),
+    (None, {}),
+])
+def test_parse_timing_string(timing_str, expected):
+    """Test parsing of timing strings from the conversation tools."""
+    assert ConversationStatistics().parse_timing_string(timing_str) == expected
+
+
+def test_add_conversation_result_uses_parsed_timings():
+    """Test that parsed timings end up on the recorded metric."""
+    stats = ConversationStatistics()
+    stats.add_conversation_result("hi", "hello", timing_str="ttfa 0.7s, stt 0.3s, total 4.0s")
+
+    metric = stats.get_recent_metrics(1)[0]
+    assert metric.ttfa == 0.7
+    assert metric.stt_processing == 0.3
+    assert metric.total_time == 4.0
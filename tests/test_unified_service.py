@@ -149,6 +149,7 @@ class TestUnifiedServiceTool:
              patch('pathlib.Path.exists', return_value=True), \
              patch('pathlib.Path.mkdir'), \
              patch('pathlib.Path.write_text'), \
+             patch('os.replace'), \
              patch('pathlib.Path.exists', return_value=True), \
              patch('pathlib.Path.home') as mock_home, \
              patch('subprocess.run') as mock_run:
@@ -194,6 +195,7 @@ class TestUnifiedServiceTool:
              patch('pathlib.Path.exists', return_value=True), \
              patch('pathlib.Path.mkdir'), \
              patch('pathlib.Path.write_text'), \
+             patch('os.replace'), \
              patch('subprocess.run') as mock_run:
 
             mock_run.return_value = MagicMock(returncode=0)
@@ -298,6 +300,7 @@ class TestUnifiedServiceTool:
              patch('pathlib.Path.exists', return_value=True), \
              patch('pathlib.Path.mkdir'), \
              patch('pathlib.Path.write_text') as mock_write, \
+             patch('os.replace'), \
              patch('subprocess.run') as mock_run:
 
             mock_run.return_value = MagicMock(returncode=0)
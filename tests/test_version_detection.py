@@ -1,6 +1,7 @@
 """Tests for version detection functionality."""
 
 import os
+import subprocess
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -15,6 +16,14 @@ from voice_mode.version import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    """Recompute the version in each test instead of reusing the cached one."""
+    get_version.cache_clear()
+    yield
+    get_version.cache_clear()
+
+
 def test_get_git_commit_hash():
     """Test getting git commit hash."""
     # Should return a hash in a real git repo
@@ -59,7 +68,8 @@ def test_version_format():
 
 def test_get_version_non_git():
     """Test version when not in a git repository."""
-    with patch('voice_mode.version.is_git_repository', return_value=False):
+    error = subprocess.CalledProcessError(128, "git describe")
+    with patch('subprocess.run', side_effect=error):
         version = get_version()
         # Should return base version without dev suffix
         assert "-dev." not in version
@@ -68,21 +78,32 @@ def test_get_version_non_git():
 
 def test_get_version_git_with_commit():
     """Test version in git repository with commit."""
-    with patch('voice_mode.version.is_git_repository', return_value=True):
-        with patch('voice_mode.version.get_git_commit_hash', return_value='abc1234'):
-            with patch('subprocess.run') as mock_run:
-                # Mock clean git status
-                mock_run.return_value = MagicMock(stdout='')
-                version = get_version()
-                assert version == f"{base_version}-dev.abc1234"
+    with patch('subprocess.run') as mock_run:
+        # Mock clean working tree
+        mock_run.return_value = MagicMock(stdout='abc1234\n')
+        version = get_version()
+        assert version == f"{base_version}-dev.abc1234"
+        assert mock_run.call_count == 1
 
 
 def test_get_version_git_with_changes():
     """Test version in git repository with uncommitted changes."""
-    with patch('voice_mode.version.is_git_repository', return_value=True):
-        with patch('voice_mode.version.get_git_commit_hash', return_value='abc1234'):
-            with patch('subprocess.run') as mock_run:
-                # Mock dirty git status
-                mock_run.return_value = MagicMock(stdout='M some_file.py')
-                version = get_version()
-                assert version == f"{base_version}-dev.abc1234-dirty"
\ No newline at end of file
+    with patch('subprocess.run') as mock_run:
+        # Mock dirty working tree
+        mock_run.return_value = MagicMock(stdout='abc1234-dirty\n')
+        version = get_version()
+        assert version == f"{base_version}-dev.abc1234-dirty"
+
+
+def test_get_version_git_unavailable():
+    """Test that a missing git binary falls back to the base version."""
+    with patch('subprocess.run', side_effect=FileNotFoundError):
+        assert get_version() == base_version
+
+
+def test_get_version_skip_git(monkeypatch):
+    """Test that VOICEMODE_SKIP_GIT_VERSION avoids running git."""
+    monkeypatch.setenv("VOICEMODE_SKIP_GIT_VERSION", "1")
+    with patch('subprocess.run') as mock_run:
+        assert get_version() == base_version
+    mock_run.assert_not_called()
@@ -0,0 +1,101 @@
+"""Tests for whisper service helpers."""
+
+import asyncio
+import functools
+import io
+import zipfile
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from voice_mode.utils.services import whisper_helpers
+
+
+def _zip_bytes(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_download_coreml_model_extracts_without_leaving_zip(tmp_path):
+    """Test that the Core ML archive is extracted and never written next to the models."""
+    models_dir = tmp_path / "models"
+    payload = _zip_bytes({"ggml-base-encoder.mlmodelc/model.mil": b"mil"})
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=payload))
+
+    with patch("httpx.AsyncClient", functools.partial(httpx.AsyncClient, transport=transport)):
+        result = await whisper_helpers.download_coreml_model("base", models_dir)
+
+    assert result["success"]
+    assert (models_dir / "ggml-base-encoder.mlmodelc" / "model.mil").read_bytes() == b"mil"
+    assert [p.name for p in models_dir.iterdir()] == ["ggml-base-encoder.mlmodelc"]
+
+
+@pytest.mark.asyncio
+async def test_download_coreml_model_reports_missing_model(tmp_path):
+    """Test that a 404 from Hugging Face is reported as not available."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(404))
+
+    with patch("httpx.AsyncClient", functools.partial(httpx.AsyncClient, transport=transport)):
+        result = await whisper_helpers.download_coreml_model("tiny", tmp_path)
+
+    assert not result["success"]
+    assert result["error_category"] == "not_available"
+
+
+@pytest.mark.asyncio
+async def test_download_whisper_model_fetches_core_ml_alongside_weights(tmp_path):
+    """Test that the Core ML download starts before the weights have finished."""
+    core_ml_started = asyncio.Event()
+
+    async def fake_ggml(url, destination, description=None):
+        # Only completes if the Core ML download is already running
+        await asyncio.wait_for(core_ml_started.wait(), timeout=1)
+        destination.write_bytes(b"ggml")
+        return True
+
+    async def fake_coreml(model, models_dir):
+        core_ml_started.set()
+        return {"success": True, "path": str(models_dir / f"ggml-{model}-encoder.mlmodelc")}
+
+    with patch.object(whisper_helpers, "download_parallel_async", fake_ggml), \
+         patch.object(whisper_helpers, "download_coreml_model", fake_coreml), \
+         patch("platform.system", return_value="Darwin"), \
+         patch("platform.machine", return_value="arm64"):
+        result = await whisper_helpers.download_whisper_model("base", tmp_path / "models")
+
+    assert result["success"]
+    assert result["acceleration"] == "coreml"
+
+
+@pytest.mark.asyncio
+async def test_download_whisper_model_cancels_core_ml_when_weights_fail(tmp_path):
+    """Test that a failed GGML download stops the Core ML download and leaves no encoder."""
+    models_dir = tmp_path / "models"
+    core_ml_cancelled = asyncio.Event()
+
+    async def fake_ggml(url, destination, description=None):
+        await asyncio.sleep(0)
+        return False
+
+    async def fake_coreml(model, models_dir):
+        (models_dir / f"ggml-{model}-encoder.mlmodelc").mkdir()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            core_ml_cancelled.set()
+            raise
+
+    with patch.object(whisper_helpers, "download_parallel_async", fake_ggml), \
+         patch.object(whisper_helpers, "download_coreml_model", fake_coreml), \
+         patch("platform.system", return_value="Darwin"), \
+         patch("platform.machine", return_value="arm64"):
+        result = await asyncio.wait_for(whisper_helpers.download_whisper_model("base", models_dir), timeout=5)
+
+    assert not result["success"]
+    assert core_ml_cancelled.is_set()
+    assert not (models_dir / "ggml-base-encoder.mlmodelc").exists()
@@ -19,6 +19,23 @@ class TestWhisperModelsCLI:
         assert result.exit_code == 0
         assert 'Available Whisper Models' in result.output or 'Whisper Models' in result.output
 
+    def test_whisper_models_ignores_dangling_symlink(self, tmp_path):
+        """Test that a model symlink whose target was removed isn't listed as installed."""
+        from voice_mode.whisper_model_unified import whisper_model_unified
+
+        model_dir = tmp_path / "models"
+        model_dir.mkdir()
+        (model_dir / "ggml-base.bin").write_bytes(b"")
+        (model_dir / "ggml-small.bin").symlink_to(model_dir / "gone.bin")
+
+        with patch('voice_mode.tools.whisper.models.get_model_directory', return_value=model_dir):
+            result = CliRunner().invoke(whisper_model_unified, ['--all'])
+
+        assert result.exit_code == 0, result.output
+        installed = [line.lstrip("→ ").split()[0]
+                     for line in result.output.splitlines() if "[✓ Installed" in line]
+        assert installed == ["base"]
+
 
 class TestWhisperModelActiveCLI:
     """Test whisper model active command."""
@@ -0,0 +1,193 @@
+"""Tests for the Whisper model registry helpers."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from voice_mode.tools.whisper import model_install, models
+
+
+@pytest.fixture(autouse=True)
+def reset_model_caches():
+    models._model_directory = None
+    models._active_model = None
+    yield
+    models._model_directory = None
+    models._active_model = None
+
+
+def test_model_directory_cached_once_it_exists(tmp_path):
+    """Test that an existing configured directory is only checked once."""
+    with patch.object(models, "WHISPER_MODEL_PATH", tmp_path):
+        assert models.get_model_directory() == tmp_path
+        with patch("pathlib.Path.exists", side_effect=AssertionError("stat again")):
+            assert models.get_model_directory() == tmp_path
+
+
+def test_missing_model_directory_rechecked(tmp_path):
+    """Test that a directory created after the first lookup is picked up."""
+    configured = tmp_path / "models"
+    with patch.object(models, "WHISPER_MODEL_PATH", configured), \
+         patch("pathlib.Path.home", return_value=tmp_path / "home"):
+        assert models.get_model_directory() == configured
+        assert models._model_directory is None
+
+        configured.mkdir()
+        assert models.get_model_directory() == configured
+        assert models._model_directory == configured
+
+
+def test_installed_models_from_one_listing(tmp_path):
+    """Test that installed models come from the directory listing, in registry order."""
+    for filename in ("ggml-small.bin", "ggml-base.en.bin", "notes.txt"):
+        (tmp_path / filename).write_bytes(b"")
+
+    with patch.object(models, "WHISPER_MODEL_PATH", tmp_path):
+        assert models.get_installed_whisper_models() == ["base.en", "small"]
+        with patch.object(models, "WHISPER_MODEL_PATH", tmp_path / "missing"):
+            models._model_directory = None
+            with patch("pathlib.Path.home", return_value=tmp_path / "home"):
+                assert models.get_installed_whisper_models() == []
+
+
+def test_scan_skips_dangling_symlinks(tmp_path):
+    """Test that a symlink to a removed model is not reported as installed."""
+    model_dir = tmp_path / "models"
+    model_dir.mkdir()
+    (model_dir / "ggml-base.bin").write_bytes(b"")
+    (model_dir / "ggml-small.bin").symlink_to(model_dir / "gone.bin")
+
+    files, dirs = models.scan_model_directory(model_dir)
+
+    assert files == {"ggml-base.bin"}
+    assert dirs == set()
+
+
+@pytest.mark.asyncio
+async def test_whisper_models_status_from_one_scan(tmp_path):
+    """Test that installed and Core ML status come from a single directory scan."""
+    from voice_mode.tools.whisper.list_models import whisper_models
+
+    (tmp_path / "ggml-base.bin").write_bytes(b"")
+    (tmp_path / "ggml-base-encoder.mlmodelc").mkdir()
+    (tmp_path / "coreml-encoder-small.mlpackage").mkdir()
+
+    with patch.object(models, "WHISPER_MODEL_PATH", tmp_path), \
+         patch("voice_mode.tools.whisper.list_models.is_apple_silicon", return_value=True), \
+         patch.object(models, "is_macos", return_value=True), \
+         patch("os.scandir", wraps=models.os.scandir) as scandir:
+        result = await whisper_models()
+
+    assert scandir.call_count == 1
+    status = {m["name"]: m for m in result["models"]}
+    assert status["base"]["installed"] and status["base"]["has_coreml"]
+    assert not status["small"]["installed"] and status["small"]["has_coreml"]
+    assert not status["tiny"]["installed"] and not status["tiny"]["has_coreml"]
+    assert result["installed_count"] == 1
+
+
+def test_installed_models_ignore_unknown_files_and_keep_registry_order(tmp_path):
+    """Test that only registry filenames count, reported in registry order."""
+    for name in ("ggml-small.bin", "ggml-tiny.bin", "ggml-custom.bin", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+
+    with patch.object(models, "WHISPER_MODEL_PATH", tmp_path):
+        assert models.get_installed_whisper_models() == ["tiny", "small"]
+    assert models.COREML_DIRNAME_TO_MODEL["coreml-encoder-base.mlpackage"] == "base"
+
+
+def test_remove_model_reports_coreml_size(tmp_path):
+    """Test that removing Core ML bundles counts their real size."""
+    (tmp_path / "ggml-base.bin").write_bytes(b"x" * 10)
+    bundle = tmp_path / "ggml-base-encoder.mlmodelc"
+    (bundle / "weights").mkdir(parents=True)
+    (bundle / "weights" / "weight.bin").write_bytes(b"x" * 300)
+    (bundle / "model.mil").write_bytes(b"x" * 40)
+
+    with patch.object(models, "WHISPER_MODEL_PATH", tmp_path), \
+         patch("platform.system", return_value="Darwin"):
+        result = models.remove_whisper_model("base")
+
+    assert result["space_freed"] == 350
+    assert not bundle.exists()
+
+
+def test_active_model_follows_set_active_model(tmp_path):
+    """Test that the cached active model is replaced when a new one is set."""
+    with patch.object(models, "WHISPER_MODEL", "not-a-model"), \
+         patch("pathlib.Path.home", return_value=tmp_path):
+        assert models.get_active_model() == "base"
+        models.set_active_model("small")
+        assert models.get_active_model() == "small"
+
+    assert "VOICEMODE_WHISPER_MODEL=small" in (tmp_path / ".voicemode" / "voicemode.env").read_text()
+
+
+@pytest.mark.asyncio
+async def test_benchmark_parses_timings_from_stderr_tail(tmp_path):
+    """Test that timings are read from the end of stderr without capturing stdout."""
+    whisper_dir = tmp_path / ".voicemode" / "services" / "whisper"
+    (whisper_dir / "build" / "bin").mkdir(parents=True)
+    (whisper_dir / "build" / "bin" / "whisper-cli").touch()
+    (whisper_dir / "samples").mkdir()
+    (whisper_dir / "samples" / "jfk.wav").touch()
+    (tmp_path / "ggml-base.bin").touch()
+    stderr = b"whisper_init: loading model\n" * 1000 + (
+        b"whisper_print_timings:     load time =   120.50 ms\n"
+        b"whisper_print_timings:   encode time =   300.25 ms\n"
+        b"whisper_print_timings:    total time =  1100.00 ms\n"
+    )
+    process = MagicMock()
+    process.communicate = AsyncMock(return_value=(None, stderr))
+
+    with patch.object(models, "WHISPER_MODEL_PATH", tmp_path), \
+         patch("pathlib.Path.home", return_value=tmp_path), \
+         patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as spawn:
+        result = await models.benchmark_whisper_model("base")
+
+    assert spawn.call_args.kwargs["stdout"] == asyncio.subprocess.DEVNULL
+    assert result["load_time_ms"] == 120.5
+    assert result["encode_time_ms"] == 300.25
+    assert result["real_time_factor"] == 10.0
+
+
+def test_is_installed_checks_scan_snapshot(tmp_path):
+    """Test that a scanned file list answers the check without touching the disk."""
+    files = {"ggml-base.bin"}
+    with patch.object(models, "WHISPER_MODEL_PATH", tmp_path):
+        assert models.is_whisper_model_installed("base", files)
+        assert not models.is_whisper_model_installed("small", files)
+        assert not models.is_whisper_model_installed("base")
+
+
+@pytest.mark.parametrize("incomplete,expected", [
+    ("large-v3", ["large-v3", "large-v3-turbo"]),
+    ("base", ["base", "base.en"]),
+    ("", sorted(models.WHISPER_MODEL_REGISTRY)),
+    ("nope", []),
+])
+def test_model_name_completion(incomplete, expected):
+    """Test that completion returns every registry name with the prefix."""
+    from voice_mode.whisper_model_unified import model_name_completion
+
+    assert model_name_completion(None, [], incomplete) == expected
+
+
+@pytest.mark.asyncio
+async def test_install_skips_models_found_in_one_scan(tmp_path):
+    """Test that installed models are answered from the scan, not downloaded."""
+    models_dir = tmp_path / ".voicemode" / "services" / "whisper" / "models"
+    models_dir.mkdir(parents=True)
+    (models_dir / "ggml-base.bin").touch()
+
+    async def fake_download(model_name, models_dir, **kwargs):
+        return {"success": True, "message": "downloaded"}
+
+    with patch("pathlib.Path.home", return_value=tmp_path), \
+         patch.object(model_install, "download_whisper_model", side_effect=fake_download) as download:
+        result = json.loads(await model_install.whisper_model_install.fn(["base", "tiny"]))
+
+    assert [call.args[0] for call in download.call_args_list] == ["tiny"]
+    assert [r["message"] for r in result["results"]] == ["Model already exists", "downloaded"]
@@ -576,22 +576,27 @@ def whisper_model_list():
         WHISPER_MODEL_REGISTRY,
         get_model_directory,
         get_active_model,
-        is_whisper_model_installed,
         get_installed_whisper_models,
-        format_size,
-        has_whisper_coreml_model
+        get_coreml_models,
+        scan_model_directory,
+        format_size
     )
 
     model_dir = get_model_directory()
     current_model = get_active_model()
-    installed_models = get_installed_whisper_models()
+    files, dirs = scan_model_directory(model_dir)
+    installed_models = get_installed_whisper_models(files)
+    coreml_models = get_coreml_models(dirs)
 
     # Calculate totals
-    total_installed_size = sum(
-        (model_dir / f"ggml-{name}.bin").stat().st_size
-        for name in installed_models
-        if (model_dir / f"ggml-{name}.bin").exists()
-    )
+    # Installed models come from the directory scan, which only lists regular
+    # files, but one can still be removed before we stat it
+    total_installed_size = 0
+    for name in installed_models:
+        try:
+            total_installed_size += os.stat(model_dir / f"ggml-{name}.bin").st_size
+        except FileNotFoundError:
+            pass
 
     total_available_size = sum(
         info["size_mb"] * 1024 * 1024
@@ -603,8 +608,8 @@ def whisper_model_list():
     # Display each model
     for model_name, model_info in WHISPER_MODEL_REGISTRY.items():
         # Check installation status
-        is_installed = is_whisper_model_installed(model_name)
-        has_coreml = has_whisper_coreml_model(model_name)
+        is_installed = model_name in installed_models
+        has_coreml = model_name in coreml_models
 
         # Status indicator
         if is_installed and has_coreml:
@@ -745,15 +750,17 @@ def whisper_models():
         WHISPER_MODEL_REGISTRY, 
         get_model_directory,
         get_active_model,
-        is_whisper_model_installed,
         get_installed_whisper_models,
-        format_size,
-        has_whisper_coreml_model
+        get_coreml_models,
+        scan_model_directory,
+        format_size
     )
     
     model_dir = get_model_directory()
     current_model = get_active_model()
-    installed_models = get_installed_whisper_models()
+    files, dirs = scan_model_directory(model_dir)
+    installed_models = get_installed_whisper_models(files)
+    coreml_models = get_coreml_models(dirs)
     
     # Calculate totals
     total_installed_size = sum(
@@ -770,7 +777,7 @@ def whisper_models():
     # Print models table
     for model_name, info in WHISPER_MODEL_REGISTRY.items():
         # Check status
-        is_installed = is_whisper_model_installed(model_name)
+        is_installed = model_name in installed_models
         is_current = model_name == current_model
         
         # Format status
@@ -784,7 +791,7 @@ def whisper_models():
         # Format installation status
         if is_installed:
             # Check for Core ML model
-            if has_whisper_coreml_model(model_name):
+            if model_name in coreml_models:
                 install_status = click.style("[✓ Installed+ML]", fg="green")
             else:
                 install_status = click.style("[✓ Installed]", fg="green")
@@ -259,82 +259,85 @@ def stats(days, by_hour, by_provider, by_transport, timing, conversations,
         print(stats_obj.get_summary_report())
         return
     
-    # Show specific stats
+    # Show specific stats, collected and written out in one go
+    lines = []
     if by_hour or show_all:
-        print("\nHourly Distribution:")
-        print("-" * 30)
+        lines.append("\nHourly Distribution:")
+        lines.append("-" * 30)
         hourly = stats_obj.hourly_distribution()
         for hour, count in sorted(hourly.items()):
             bar = '█' * (count // 5) if count > 0 else ''
-            print(f"{hour:02d}:00  {count:4d}  {bar}")
+            lines.append(f"{hour:02d}:00  {count:4d}  {bar}")
     
     if by_provider or show_all:
-        print("\nProvider Breakdown:")
-        print("-" * 30)
+        lines.append("\nProvider Breakdown:")
+        lines.append("-" * 30)
         for provider, count in stats_obj.provider_breakdown().items():
-            print(f"{provider:20s} {count:6d}")
+            lines.append(f"{provider:20s} {count:6d}")
     
     if by_transport or show_all:
-        print("\nTransport Breakdown:")
-        print("-" * 30)
+        lines.append("\nTransport Breakdown:")
+        lines.append("-" * 30)
         for transport, count in stats_obj.transport_breakdown().items():
-            print(f"{transport:20s} {count:6d}")
+            lines.append(f"{transport:20s} {count:6d}")
     
     if timing or show_all:
-        print("\nTiming Statistics:")
-        print("-" * 30)
+        lines.append("\nTiming Statistics:")
+        lines.append("-" * 30)
         timing_stats = stats_obj.timing_stats()
         
         if 'overall' in timing_stats and timing_stats['overall']:
-            print("Overall:")
+            lines.append("Overall:")
             if 'avg_turnaround' in timing_stats['overall']:
-                print(f"  Avg Turnaround: {timing_stats['overall']['avg_turnaround']:.2f}s")
+                lines.append(f"  Avg Turnaround: {timing_stats['overall']['avg_turnaround']:.2f}s")
         
         if 'tts' in timing_stats and timing_stats['tts']:
-            print("\nTTS:")
+            lines.append("\nTTS:")
             for metric, values in timing_stats['tts'].items():
                 if isinstance(values, dict) and 'avg' in values:
-                    print(f"  {metric}: avg={values['avg']:.2f}s, "
+                    lines.append(f"  {metric}: avg={values['avg']:.2f}s, "
                           f"min={values['min']:.2f}s, max={values['max']:.2f}s")
         
         if 'stt' in timing_stats and timing_stats['stt']:
-            print("\nSTT:")
+            lines.append("\nSTT:")
             for metric, values in timing_stats['stt'].items():
                 if isinstance(values, dict) and 'avg' in values:
-                    print(f"  {metric}: avg={values['avg']:.2f}s, "
+                    lines.append(f"  {metric}: avg={values['avg']:.2f}s, "
                           f"min={values['min']:.2f}s, max={values['max']:.2f}s")
     
     if conversations or show_all:
-        print("\nConversation Statistics:")
-        print("-" * 30)
+        lines.append("\nConversation Statistics:")
+        lines.append("-" * 30)
         conv_stats = stats_obj.conversation_stats()
-        print(f"Total Conversations: {conv_stats['total_conversations']}")
-        print(f"Avg Exchanges/Conv: {conv_stats['exchanges_per_conversation']['avg']:.1f}")
-        print(f"Avg Duration: {conv_stats['duration_seconds']['avg']:.1f}s")
-        print(f"Avg Word Count: {conv_stats['word_count']['avg']:.0f}")
+        lines.append(f"Total Conversations: {conv_stats['total_conversations']}")
+        lines.append(f"Avg Exchanges/Conv: {conv_stats['exchanges_per_conversation']['avg']:.1f}")
+        lines.append(f"Avg Duration: {conv_stats['duration_seconds']['avg']:.1f}s")
+        lines.append(f"Avg Word Count: {conv_stats['word_count']['avg']:.0f}")
     
     if errors or show_all:
-        print("\nError Statistics:")
-        print("-" * 30)
+        lines.append("\nError Statistics:")
+        lines.append("-" * 30)
         error_stats = stats_obj.error_stats()
-        print(f"Total Errors: {error_stats['total_errors']}")
-        print(f"Error Rate: {error_stats['error_rate']:.1%}")
+        lines.append(f"Total Errors: {error_stats['total_errors']}")
+        lines.append(f"Error Rate: {error_stats['error_rate']:.1%}")
         if error_stats['error_types']:
-            print("Error Types:")
+            lines.append("Error Types:")
             for error_type, count in error_stats['error_types'].items():
-                print(f"  {error_type}: {count}")
+                lines.append(f"  {error_type}: {count}")
     
     if silence or show_all:
-        print("\nSilence Detection Statistics:")
-        print("-" * 30)
+        lines.append("\nSilence Detection Statistics:")
+        lines.append("-" * 30)
         vad_stats = stats_obj.silence_detection_stats()
-        print(f"VAD Enabled: {vad_stats['vad_enabled_count']}")
-        print(f"VAD Disabled: {vad_stats['vad_disabled_count']}")
-        print(f"VAD Usage Rate: {vad_stats['vad_usage_rate']:.1%}")
+        lines.append(f"VAD Enabled: {vad_stats['vad_enabled_count']}")
+        lines.append(f"VAD Disabled: {vad_stats['vad_disabled_count']}")
+        lines.append(f"VAD Usage Rate: {vad_stats['vad_usage_rate']:.1%}")
         if 'avg_record_time_with_vad' in vad_stats:
-            print(f"Avg Record Time (VAD): {vad_stats['avg_record_time_with_vad']:.1f}s")
+            lines.append(f"Avg Record Time (VAD): {vad_stats['avg_record_time_with_vad']:.1f}s")
         if 'avg_record_time_without_vad' in vad_stats:
-            print(f"Avg Record Time (No VAD): {vad_stats['avg_record_time_without_vad']:.1f}s")
+            lines.append(f"Avg Record Time (No VAD): {vad_stats['avg_record_time_without_vad']:.1f}s")
+    
+    click.echo("\n".join(lines))
 
 
 @exchanges.command()
@@ -437,5 +440,27 @@ def export(conversation, date, days, format, include_audio, output):
     click.echo(f"Exported to {output}")
 
 
+@exchanges.command()
+@click.help_option('-h', '--help')
+@click.option('-k', '--keep-days', type=click.IntRange(min=1), default=7,
+              help='Leave logs for the last N days uncompressed')
+def compress(keep_days):
+    """Gzip older exchange logs to save disk space.
+    
+    Compressed logs are still read by view, search, stats and export.
+    """
+    reader = ExchangeReader()
+    before = datetime.now().date() - timedelta(days=keep_days - 1)
+    compressed = reader.compress_logs(before)
+    
+    if not compressed:
+        click.echo("No exchange logs to compress.")
+        return
+    
+    for path in compressed:
+        click.echo(f"Compressed {path.name}")
+    click.echo(f"Compressed {len(compressed)} log file(s)")
+
+
 if __name__ == '__main__':
     exchanges()
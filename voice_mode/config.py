@@ -338,6 +338,9 @@ TTS \\bAPI\\b A P I # API as individual letters
 # Download progress style: auto, rich, simple (default: auto)
 # VOICEMODE_PROGRESS_STYLE=auto
 
+# Connections used to download large model files in parallel (default: 8)
+# VOICEMODE_DOWNLOAD_CONNECTIONS=8
+
 #############
 # API Keys (set these in your environment for security)
 #############
@@ -2,20 +2,27 @@
 Conversation logging system using JSONL format.
 
 Tracks all utterances (STT and TTS) in a structured, append-only format
-for real-time conversation tracking and analysis.
+for real-time conversation tracking and analysis. Entries are appended by a
+background writer thread so logging never blocks the voice tools on disk I/O.
 """
 
+import atexit
 import json
+import logging
 import os
+import queue
 import random
 import string
-from datetime import datetime, timedelta
+import threading
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from voice_mode.__version__ import __version__
 from voice_mode.config import BASE_DIR
 
+logger = logging.getLogger("voicemode")
+
 
 class ConversationLogger:
     """Handles JSONL-based conversation logging."""
@@ -35,6 +42,27 @@ class ConversationLogger:
         self.conversation_id = None
         self.current_project_path = os.getcwd()
         
+        # (log file, file size after our append, entry) for the last entry this
+        # process wrote, so reading it back doesn't need to reopen the file
+        self._last_written: Optional[Tuple[Path, int, Dict[str, Any]]] = None
+        
+        # Newest queued entry that the writer thread hasn't appended yet
+        self._unwritten: Optional[Tuple[Path, Dict[str, Any]]] = None
+        self._write_lock = threading.Lock()
+        
+        # Appends happen on a background thread, off the converse path,
+        # until close() stops it
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = threading.Thread(
+            target=self._writer_loop, daemon=True
+        )
+        self._writer_thread.start()
+        atexit.register(self.close)
+        
+        # Today's log file path, rebuilt only when the date rolls over
+        self._log_file_date: Optional[date] = None
+        self._log_file: Optional[Path] = None
+        
         # Initialize conversation ID on startup
         self._initialize_conversation_id()
     
@@ -60,11 +88,11 @@ class ConversationLogger:
         # Generate new conversation ID
         self.conversation_id = self._generate_conversation_id()
     
-    def _get_last_log_entry(self) -> Optional[Dict[str, Any]]:
+    def _get_last_log_entry(self, today: Optional[date] = None) -> Optional[Dict[str, Any]]:
         """Get the last entry from today's or yesterday's log file."""
         # Try today's log first
-        today = datetime.now().date()
-        log_file = self._get_log_file_path(today)
+        today = today or datetime.now().date()
+        log_file = self._get_current_log_file(today)
         
         last_entry = self._read_last_line(log_file)
         if last_entry:
@@ -78,9 +106,24 @@ class ConversationLogger:
     
     def _read_last_line(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """Read the last line from a log file."""
-        if not file_path.exists() or file_path.stat().st_size == 0:
+        with self._write_lock:
+            unwritten = self._unwritten
+            last_written = self._last_written
+        # Our newest entry is still queued, so it is the last line to be
+        if unwritten and unwritten[0] == file_path:
+            return unwritten[1]
+        
+        try:
+            file_size = file_path.stat().st_size
+        except OSError:
+            return None
+        if file_size == 0:
             return None
         
+        # Unchanged since our own append, so the last line is the entry we wrote
+        if last_written and last_written[0] == file_path and last_written[1] == file_size:
+            return last_written[2]
+        
         try:
             # Read file backwards to get last line efficiently
             with open(file_path, 'rb') as f:
@@ -111,6 +154,13 @@ class ConversationLogger:
         filename = f"exchanges_{date.strftime('%Y-%m-%d')}.jsonl"
         return self.base_dir / filename
     
+    def _get_current_log_file(self, today: date) -> Path:
+        """Get the log file path for today, formatting it only on rollover."""
+        if today != self._log_file_date:
+            self._log_file = self._get_log_file_path(today)
+            self._log_file_date = today
+        return self._log_file
+    
     def log_utterance(self,
                      utterance_type: str,
                      text: str,
@@ -126,13 +176,16 @@ class ConversationLogger:
             duration_ms: Duration of the audio in milliseconds
             metadata: Additional metadata about the utterance
         """
+        # One clock read for the continuity check, the timestamp and the file
+        now = datetime.now().astimezone()
+        
         # Check if we need to start a new conversation
-        self._check_conversation_continuity()
+        self._check_conversation_continuity(now)
         
         # Build the log entry
         entry = {
             "version": self.SCHEMA_VERSION,
-            "timestamp": datetime.now().astimezone().isoformat(),
+            "timestamp": now.isoformat(),
             "conversation_id": self.conversation_id,
             "type": utterance_type,
             "text": text,
@@ -150,23 +203,79 @@ class ConversationLogger:
         if "metadata" in entry:
             entry["metadata"] = {k: v for k, v in entry["metadata"].items() if v is not None}
         
-        # Write to today's log file
-        log_file = self._get_log_file_path(datetime.now().date())
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(entry) + '\n')
+        # Queue for today's log file; the writer thread appends it
+        log_file = self._get_current_log_file(now.date())
+        if self._writer_thread is None:
+            # Closed, so there is no writer thread left to hand the entry to
+            try:
+                self._write_entry(log_file, entry)
+            except Exception as e:
+                logger.error(f"Failed to write conversation log entry: {e}")
+            return
+        with self._write_lock:
+            self._unwritten = (log_file, entry)
+        self._write_queue.put((log_file, entry))
+    
+    def _writer_loop(self) -> None:
+        """Background thread appending queued entries to their log files."""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                # Sentinel from close(); everything queued before it is written
+                self._write_queue.task_done()
+                return
+            log_file, entry = item
+            try:
+                self._write_entry(log_file, entry)
+            except Exception as e:
+                logger.error(f"Failed to write conversation log entry: {e}")
+            finally:
+                self._write_queue.task_done()
+    
+    def _write_entry(self, log_file: Path, entry: Dict[str, Any]) -> None:
+        """Append one entry to a log file."""
+        with open(log_file, 'ab') as f:
+            f.write((json.dumps(entry) + '\n').encode('utf-8'))
+            f.flush()
+            # Appends land at the end, so this is the file size including our line
+            size = f.tell()
+        
+        with self._write_lock:
+            self._last_written = (log_file, size, entry)
+            if self._unwritten and self._unwritten[1] is entry:
+                self._unwritten = None
+    
+    def flush(self) -> None:
+        """Block until every queued entry has been written."""
+        self._write_queue.join()
     
-    def _check_conversation_continuity(self):
+    def close(self) -> None:
+        """Write every queued entry and stop the writer thread.
+
+        Entries logged after closing are written synchronously. Called at
+        interpreter exit for loggers that were never closed.
+        """
+        writer_thread = self._writer_thread
+        if writer_thread is None:
+            return
+        self._writer_thread = None
+        self._write_queue.put(None)
+        writer_thread.join()
+        atexit.unregister(self.close)
+    
+    def _check_conversation_continuity(self, now: Optional[datetime] = None):
         """Check if we need to start a new conversation based on time gap."""
         # This could be called periodically to ensure conversations
         # are properly segmented even during long sessions
-        last_entry = self._get_last_log_entry()
+        now = now or datetime.now().astimezone()
+        last_entry = self._get_last_log_entry(now.date())
         
         if last_entry and last_entry['conversation_id'] == self.conversation_id:
             try:
                 last_timestamp = datetime.fromisoformat(
                     last_entry['timestamp'].replace('Z', '+00:00')
                 )
-                time_diff = (datetime.now().astimezone() - last_timestamp).total_seconds()
+                time_diff = (now - last_timestamp).total_seconds()
                 
                 # Start new conversation if gap is too large or project changed
                 if (time_diff >= self.CONVERSATION_GAP_MINUTES * 60 or
@@ -5,7 +5,9 @@ Exchange data models for voice mode conversation logs.
 import json
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional, Literal, Dict, Any, List
+from typing import Optional, Literal, Dict, Any, List, Union
+
+from voice_mode.utils import json_codec
 
 
 @dataclass
@@ -55,9 +57,9 @@ class Exchange:
     metadata: Optional[ExchangeMetadata] = None
     
     @classmethod
-    def from_jsonl(cls, line: str) -> 'Exchange':
-        """Parse from JSONL line."""
-        data = json.loads(line)
+    def from_jsonl(cls, line: Union[str, bytes]) -> 'Exchange':
+        """Parse from JSONL line (str, or raw bytes read from a log file)."""
+        data = json_codec.loads(line)
         
         # Parse timestamp
         timestamp_str = data['timestamp']
@@ -2,20 +2,57 @@
 Exchange reader for voice mode conversation logs.
 """
 
-import json
+import gzip
 import logging
 import os
+import shutil
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Iterator, List, Optional, Union, Dict
 import subprocess
 
 from voice_mode.exchanges.models import Exchange
+from voice_mode.utils import json_codec
 from voice_mode.config import BASE_DIR
 
 
 logger = logging.getLogger(__name__)
 
+# Bytes read per chunk when scanning a log file
+READ_CHUNK_SIZE = 1 << 20
+
+# Past days' logs may be gzip-compressed to save space; today's stays plain
+# JSONL so it can be appended to and followed with tail
+COMPRESSED_SUFFIX = ".gz"
+
+
+def _iter_lines(f, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the lines of a binary file, reading it in large chunks.
+
+    Each chunk is split on newlines in one C-level pass instead of framing
+    the file line by line. Pieces of a line that spans chunks are collected
+    and joined once, so long lines don't re-copy a growing buffer per chunk.
+    """
+    pending: List[bytes] = []
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        lines = chunk.split(b'\n')
+        if len(lines) == 1:
+            # No line ends in this chunk
+            pending.append(chunk)
+            continue
+        if pending:
+            pending.append(lines[0])
+            lines[0] = b''.join(pending)
+            pending = []
+        if lines[-1]:
+            pending.append(lines[-1])
+        yield from lines[:-1]
+    if pending:
+        yield b''.join(pending)
+
 
 class ExchangeReader:
     """Read and parse exchange JSONL files."""
@@ -40,6 +77,12 @@ class ExchangeReader:
         filename = f"exchanges_{date.strftime('%Y-%m-%d')}.jsonl"
         return self.logs_dir / filename
     
+    def _get_log_files(self) -> List[Path]:
+        """Get all log files, plain and compressed, sorted by date."""
+        log_files = list(self.logs_dir.glob("exchanges_*.jsonl"))
+        log_files.extend(self.logs_dir.glob(f"exchanges_*.jsonl{COMPRESSED_SUFFIX}"))
+        return sorted(log_files)
+    
     def read_date(self, target_date: Union[date, datetime]) -> Iterator[Exchange]:
         """Read exchanges for a specific date.
         
@@ -52,8 +95,10 @@ class ExchangeReader:
         log_file = self._get_log_file_path(target_date)
         
         if not log_file.exists():
-            logger.debug(f"No log file found for {target_date}")
-            return
+            log_file = log_file.with_name(log_file.name + COMPRESSED_SUFFIX)
+            if not log_file.exists():
+                logger.debug(f"No log file found for {target_date}")
+                return
         
         yield from self._read_file(log_file)
     
@@ -93,7 +138,7 @@ class ExchangeReader:
         exchanges = []
         
         # Search all log files
-        for log_file in sorted(self.logs_dir.glob("exchanges_*.jsonl")):
+        for log_file in self._get_log_files():
             for exchange in self._read_file(log_file):
                 if exchange.conversation_id == conversation_id:
                     exchanges.append(exchange)
@@ -124,7 +169,7 @@ class ExchangeReader:
                     if line:
                         try:
                             yield Exchange.from_jsonl(line)
-                        except json.JSONDecodeError as e:
+                        except json_codec.JSONDecodeError as e:
                             logger.warning(f"Failed to parse line: {e}")
                         except Exception as e:
                             logger.error(f"Error processing line: {e}")
@@ -196,15 +241,21 @@ class ExchangeReader:
             return
         
         try:
-            with open(file_path, 'r') as f:
-                for line_num, line in enumerate(f, 1):
+            # Binary mode hands raw bytes to the JSON parser without decoding them first
+            opener = gzip.open if file_path.suffix == COMPRESSED_SUFFIX else open
+            with opener(file_path, 'rb') as f:
+                for line_num, line in enumerate(_iter_lines(f), 1):
                     line = line.strip()
                     if not line:
                         continue
+                    if line[:1] != b'{':
+                        # Not a JSON object; skip it without paying for a parse error
+                        logger.warning(f"Skipping non-JSON line {line_num} in {file_path}")
+                        continue
                     
                     try:
                         yield Exchange.from_jsonl(line)
-                    except json.JSONDecodeError as e:
+                    except json_codec.JSONDecodeError as e:
                         logger.warning(f"Failed to parse line {line_num} in {file_path}: {e}")
                     except Exception as e:
                         logger.error(f"Error processing line {line_num} in {file_path}: {e}")
@@ -212,18 +263,114 @@ class ExchangeReader:
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {e}")
     
-    def _read_all(self) -> Iterator[Exchange]:
+    def _read_all(self, since: Optional[datetime] = None) -> Iterator[Exchange]:
         """Read all exchanges from all log files.
         
+        Args:
+            since: If given, skip log files for days that end before this time
+        
         Yields:
             All exchanges in chronological order
         """
         # Get all log files sorted by date
-        log_files = sorted(self.logs_dir.glob("exchanges_*.jsonl"))
+        log_files = self._get_log_files()
+        
+        if since is not None:
+            # Files are append-only and named by local date, so older days can't
+            # hold newer entries; one day of slack covers timezone offsets
+            cutoff = since.date() - timedelta(days=1)
+            log_files = [f for f in log_files if not self._is_log_file_before(f, cutoff)]
         
         for log_file in log_files:
             yield from self._read_file(log_file)
     
+    @staticmethod
+    def _get_log_file_date(log_file: Path) -> Optional[date]:
+        """Get the date a log file is named for, or None if unrecognized."""
+        name = log_file.name
+        if name.endswith(COMPRESSED_SUFFIX):
+            name = name[:-len(COMPRESSED_SUFFIX)]
+        try:
+            return date.fromisoformat(name[len("exchanges_"):-len(".jsonl")])
+        except ValueError:
+            return None
+    
+    @classmethod
+    def _is_log_file_before(cls, log_file: Path, cutoff: date) -> bool:
+        """Check whether a log file's date is earlier than cutoff."""
+        file_date = cls._get_log_file_date(log_file)
+        if file_date is None:
+            return False  # Unrecognized name, read it to be safe
+        return file_date < cutoff
+    
+    def compress_logs(self, before: Union[date, datetime]) -> List[Path]:
+        """Gzip the plain log files for days before a date.
+        
+        JSONL compresses well (keys and low-cardinality values such as
+        providers and voices repeat on every line), and compressed files
+        are still read transparently. Today's file is never compressed.
+        
+        Args:
+            before: Compress logs for days strictly before this date
+            
+        Returns:
+            Paths of the compressed files that were written
+        """
+        if isinstance(before, datetime):
+            before = before.date()
+        before = min(before, date.today())
+        
+        compressed = []
+        for log_file in sorted(self.logs_dir.glob("exchanges_*.jsonl")):
+            file_date = self._get_log_file_date(log_file)
+            if file_date is None or file_date >= before:
+                continue
+            
+            target = log_file.with_name(log_file.name + COMPRESSED_SUFFIX)
+            tmp_path = target.with_name(target.name + ".tmp")
+            try:
+                # Size of an existing archive, so a failed append can be undone
+                existing_size: Optional[int] = target.stat().st_size
+            except FileNotFoundError:
+                existing_size = None
+            try:
+                if existing_size is None:
+                    with open(log_file, 'rb') as src, gzip.open(tmp_path, 'wb') as dst:
+                        shutil.copyfileobj(src, dst, READ_CHUNK_SIZE)
+                    os.replace(tmp_path, target)
+                else:
+                    # The day was compressed before and its plain file came
+                    # back, so add a gzip member rather than overwrite it
+                    with open(log_file, 'rb') as src, gzip.open(target, 'ab') as dst:
+                        shutil.copyfileobj(src, dst, READ_CHUNK_SIZE)
+            except OSError as e:
+                logger.error(f"Failed to compress {log_file}: {e}")
+                tmp_path.unlink(missing_ok=True)
+                self._restore_archive(target, existing_size)
+                continue
+            
+            try:
+                log_file.unlink()
+            except OSError as e:
+                # Keeping both would read these entries twice
+                logger.error(f"Failed to remove {log_file} after compressing it: {e}")
+                self._restore_archive(target, existing_size)
+                continue
+            compressed.append(target)
+        
+        return compressed
+    
+    @staticmethod
+    def _restore_archive(target: Path, existing_size: Optional[int]) -> None:
+        """Undo a compression: drop a new archive or cut an appended member off."""
+        try:
+            if existing_size is None:
+                target.unlink(missing_ok=True)
+            else:
+                os.truncate(target, existing_size)
+        except OSError as e:
+            logger.error(f"Failed to restore {target}: {e}")
+    
     def get_latest_exchanges(self, count: int = 20) -> List[Exchange]:
         """Get the latest N exchanges.
         
@@ -10,6 +10,11 @@ import re
 from voice_mode.exchanges.models import Exchange
 
 
+# "<metric> <seconds>s" entries of a timing string, e.g. "record 3.2s, stt 1.4s"
+_TIMING_RE = re.compile(r'(\w+)\s+([\d.]+)s')
+_RECORD_TIME_RE = re.compile(r'record\s+([\d.]+)s')
+
+
 class ExchangeStats:
     """Calculate statistics from exchanges."""
     
@@ -40,10 +45,7 @@ class ExchangeStats:
         # Calculate overall turnaround times
         turnaround_times = []
         
-        for i in range(len(self.exchanges) - 1):
-            current = self.exchanges[i]
-            next_ex = self.exchanges[i + 1]
-            
+        for current, next_ex in zip(self.exchanges, self.exchanges[1:]):
             # Only count when switching between STT and TTS
             if current.type != next_ex.type:
                 turnaround = (next_ex.timestamp - current.timestamp).total_seconds()
@@ -61,16 +63,17 @@ class ExchangeStats:
         """Calculate STT-specific timing stats."""
         record_times = []
         stt_times = []
+        by_metric = {'record': record_times, 'stt': stt_times}
         
         for exchange in self.stt_exchanges:
-            if exchange.metadata and exchange.metadata.timing:
+            metadata = exchange.metadata
+            timing = metadata.timing if metadata else None
+            if timing:
                 # Parse timing string: "record 3.2s, stt 1.4s"
-                timing_match = re.findall(r'(\w+)\s+([\d.]+)s', exchange.metadata.timing)
-                for metric, value in timing_match:
-                    if metric == 'record':
-                        record_times.append(float(value))
-                    elif metric == 'stt':
-                        stt_times.append(float(value))
+                for metric, value in _TIMING_RE.findall(timing):
+                    times = by_metric.get(metric)
+                    if times is not None:
+                        times.append(float(value))
         
         stats = {}
         
@@ -97,18 +100,17 @@ class ExchangeStats:
         ttfa_times = []
         gen_times = []
         play_times = []
+        by_metric = {'ttfa': ttfa_times, 'gen': gen_times, 'play': play_times}
         
         for exchange in self.tts_exchanges:
-            if exchange.metadata and exchange.metadata.timing:
+            metadata = exchange.metadata
+            timing = metadata.timing if metadata else None
+            if timing:
                 # Parse timing string: "ttfa 1.2s, gen 2.3s, play 5.6s"
-                timing_match = re.findall(r'(\w+)\s+([\d.]+)s', exchange.metadata.timing)
-                for metric, value in timing_match:
-                    if metric == 'ttfa':
-                        ttfa_times.append(float(value))
-                    elif metric == 'gen':
-                        gen_times.append(float(value))
-                    elif metric == 'play':
-                        play_times.append(float(value))
+                for metric, value in _TIMING_RE.findall(timing):
+                    times = by_metric.get(metric)
+                    if times is not None:
+                        times.append(float(value))
         
         stats = {}
         
@@ -144,13 +146,9 @@ class ExchangeStats:
         Returns:
             Dictionary mapping provider names to counts
         """
-        provider_counts = Counter()
-        
-        for exchange in self.exchanges:
-            if exchange.metadata and exchange.metadata.provider:
-                provider_counts[exchange.metadata.provider] += 1
-            else:
-                provider_counts['unknown'] += 1
+        provider_counts = Counter(
+            (e.metadata and e.metadata.provider) or 'unknown' for e in self.exchanges
+        )
         
         return dict(provider_counts)
     
@@ -160,22 +158,20 @@ class ExchangeStats:
         Returns:
             Dictionary with 'stt' and 'tts' sub-dictionaries of model counts
         """
-        stt_models = Counter()
-        tts_models = Counter()
+        stt_models: Dict[str, int] = {}
+        tts_models: Dict[str, int] = {}
         
         for exchange in self.exchanges:
             model = 'unknown'
             if exchange.metadata and exchange.metadata.model:
                 model = exchange.metadata.model
             
-            if exchange.is_stt:
-                stt_models[model] += 1
-            else:
-                tts_models[model] += 1
+            counts = stt_models if exchange.is_stt else tts_models
+            counts[model] = counts.get(model, 0) + 1
         
         return {
-            'stt': dict(stt_models),
-            'tts': dict(tts_models)
+            'stt': stt_models,
+            'tts': tts_models
         }
     
     def voice_breakdown(self) -> Dict[str, int]:
@@ -184,13 +180,9 @@ class ExchangeStats:
         Returns:
             Dictionary mapping voice names to counts
         """
-        voice_counts = Counter()
-        
-        for exchange in self.tts_exchanges:
-            if exchange.metadata and exchange.metadata.voice:
-                voice_counts[exchange.metadata.voice] += 1
-            else:
-                voice_counts['unknown'] += 1
+        voice_counts = Counter(
+            (e.metadata and e.metadata.voice) or 'unknown' for e in self.tts_exchanges
+        )
         
         return dict(voice_counts)
     
@@ -200,13 +192,9 @@ class ExchangeStats:
         Returns:
             Dictionary mapping transport types to counts
         """
-        transport_counts = Counter()
-        
-        for exchange in self.exchanges:
-            if exchange.metadata and exchange.metadata.transport:
-                transport_counts[exchange.metadata.transport] += 1
-            else:
-                transport_counts['unknown'] += 1
+        transport_counts = Counter(
+            (e.metadata and e.metadata.transport) or 'unknown' for e in self.exchanges
+        )
         
         return dict(transport_counts)
     
@@ -216,11 +204,7 @@ class ExchangeStats:
         Returns:
             Dictionary mapping hour (0-23) to count
         """
-        hour_counts = defaultdict(int)
-        
-        for exchange in self.exchanges:
-            hour = exchange.timestamp.hour
-            hour_counts[hour] += 1
+        hour_counts = Counter(e.timestamp.hour for e in self.exchanges)
         
         # Ensure all hours are represented
         return {hour: hour_counts.get(hour, 0) for hour in range(24)}
@@ -231,11 +215,7 @@ class ExchangeStats:
         Returns:
             Dictionary mapping date string (YYYY-MM-DD) to count
         """
-        daily_counts = defaultdict(int)
-        
-        for exchange in self.exchanges:
-            date_str = exchange.timestamp.date().isoformat()
-            daily_counts[date_str] += 1
+        daily_counts = Counter(e.timestamp.date().isoformat() for e in self.exchanges)
         
         return dict(sorted(daily_counts.items()))
     
@@ -299,25 +279,26 @@ class ExchangeStats:
         """
         error_exchanges = [e for e in self.exchanges if e.metadata and e.metadata.error]
         
-        error_types = Counter()
+        error_types: Dict[str, int] = {}
         for exchange in error_exchanges:
             # Try to categorize error
             error_msg = exchange.metadata.error.lower()
             if 'timeout' in error_msg:
-                error_types['timeout'] += 1
+                error_type = 'timeout'
             elif 'auth' in error_msg or 'unauthorized' in error_msg:
-                error_types['authentication'] += 1
+                error_type = 'authentication'
             elif 'rate' in error_msg:
-                error_types['rate_limit'] += 1
+                error_type = 'rate_limit'
             elif 'network' in error_msg or 'connection' in error_msg:
-                error_types['network'] += 1
+                error_type = 'network'
             else:
-                error_types['other'] += 1
+                error_type = 'other'
+            error_types[error_type] = error_types.get(error_type, 0) + 1
         
         return {
             'total_errors': len(error_exchanges),
             'error_rate': len(error_exchanges) / len(self.exchanges) if self.exchanges else 0,
-            'error_types': dict(error_types),
+            'error_types': error_types,
             'errors_by_type': {
                 'stt': sum(1 for e in error_exchanges if e.is_stt),
                 'tts': sum(1 for e in error_exchanges if e.is_tts),
@@ -330,36 +311,34 @@ class ExchangeStats:
         Returns:
             Dictionary with silence detection metrics
         """
-        stt_with_vad = []
-        stt_without_vad = []
-        
-        for exchange in self.stt_exchanges:
-            if exchange.metadata and exchange.metadata.silence_detection:
-                if exchange.metadata.silence_detection.get('enabled'):
-                    stt_with_vad.append(exchange)
-                else:
-                    stt_without_vad.append(exchange)
-        
-        # Calculate average recording times
+        vad_enabled_count = 0
+        vad_disabled_count = 0
+        # Recording times, to compare averages with and without VAD
         with_vad_times = []
         without_vad_times = []
         
-        for exchange in stt_with_vad:
-            if exchange.metadata and exchange.metadata.timing:
-                match = re.search(r'record\s+([\d.]+)s', exchange.metadata.timing)
-                if match:
-                    with_vad_times.append(float(match.group(1)))
-        
-        for exchange in stt_without_vad:
-            if exchange.metadata and exchange.metadata.timing:
-                match = re.search(r'record\s+([\d.]+)s', exchange.metadata.timing)
+        for exchange in self.stt_exchanges:
+            metadata = exchange.metadata
+            silence_detection = metadata.silence_detection if metadata else None
+            if not silence_detection:
+                continue
+            
+            if silence_detection.get('enabled'):
+                vad_enabled_count += 1
+                record_times = with_vad_times
+            else:
+                vad_disabled_count += 1
+                record_times = without_vad_times
+            
+            if metadata.timing:
+                match = _RECORD_TIME_RE.search(metadata.timing)
                 if match:
-                    without_vad_times.append(float(match.group(1)))
+                    record_times.append(float(match.group(1)))
         
         stats = {
-            'vad_enabled_count': len(stt_with_vad),
-            'vad_disabled_count': len(stt_without_vad),
-            'vad_usage_rate': len(stt_with_vad) / len(self.stt_exchanges) if self.stt_exchanges else 0,
+            'vad_enabled_count': vad_enabled_count,
+            'vad_disabled_count': vad_disabled_count,
+            'vad_usage_rate': vad_enabled_count / len(self.stt_exchanges) if self.stt_exchanges else 0,
         }
         
         if with_vad_times:
@@ -386,9 +365,9 @@ class ExchangeStats:
         
         # Date range
         if self.exchanges:
-            sorted_exchanges = sorted(self.exchanges, key=lambda e: e.timestamp)
-            start = sorted_exchanges[0].timestamp
-            end = sorted_exchanges[-1].timestamp
+            timestamps = [e.timestamp for e in self.exchanges]
+            start = min(timestamps)
+            end = max(timestamps)
             lines.append(f"Date Range: {start.date()} to {end.date()}")
             lines.append(f"Duration: {end - start}")
             lines.append("")
@@ -86,8 +86,8 @@ class HistoryLoader:
                 since = datetime.fromisoformat(last_sync)
                 logger.info(f"Resuming from last sync: {since}")
 
-        # Read all exchanges
-        exchanges = self.reader._read_all()
+        # Read all exchanges, skipping whole days before the cutoff
+        exchanges = self.reader._read_all(since=since)
 
         for exchange in exchanges:
             stats["total"] += 1
@@ -5,7 +5,9 @@ This module parses OpenAI API errors and provides clear, actionable messages
 for common issues like quota limits, authentication problems, and rate limits.
 """
 
+import functools
 import logging
+from types import MappingProxyType
 from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
@@ -24,46 +26,80 @@ class OpenAIErrorParser:
         'access_terminated': 'access_terminated',
     }
 
+    # Exception class names that map directly to an error type
+    ERROR_CLASSES = {
+        'AuthenticationError': 'auth_failed',
+    }
+
+    # HTTP status codes that map directly to an error type
+    STATUS_CODES = {
+        401: 'auth_failed',
+    }
+
+    # Keywords distinguishing quota and billing errors from plain 429 rate limits
+    RATE_LIMIT_KEYWORDS = (
+        (('quota',), 'quota_exceeded'),
+        (('billing',), 'billing_limit'),
+    )
+
+    # Message keywords checked in order; every keyword in an entry must appear
+    MESSAGE_KEYWORDS = (
+        (('quota',), 'quota_exceeded'),
+        (('invalid', 'key'), 'auth_failed'),
+        (('unauthorized',), 'auth_failed'),
+        (('authentication',), 'auth_failed'),
+        (('rate', 'limit'), 'rate_limit'),
+        (('billing',), 'billing_limit'),
+        (('terminated',), 'access_terminated'),
+    )
+
     # User-friendly messages for each error type
     ERROR_MESSAGES = {
-        'quota_exceeded': {
+        'quota_exceeded': MappingProxyType({
             'title': '💳 OpenAI Quota Exceeded',
             'message': 'Your OpenAI API quota has been exceeded.',
             'suggestion': 'Check your OpenAI account at https://platform.openai.com/usage to review your usage and billing limits. Consider adding funds or upgrading your plan.',
             'fallback': 'You can use local voice services (Whisper/Kokoro) which don\'t require API credits.'
-        },
-        'auth_failed': {
+        }),
+        'auth_failed': MappingProxyType({
             'title': '🔐 OpenAI Authentication Failed',
             'message': 'The OpenAI API key is invalid or missing.',
             'suggestion': 'Set your OPENAI_API_KEY environment variable with a valid key from https://platform.openai.com/api-keys',
             'fallback': 'You can use local voice services (Whisper/Kokoro) without an API key.'
-        },
-        'rate_limit': {
+        }),
+        'rate_limit': MappingProxyType({
             'title': '⏱️ OpenAI Rate Limit',
             'message': 'You\'ve hit the OpenAI API rate limit.',
             'suggestion': 'Wait a moment and try again, or reduce the frequency of requests.',
             'fallback': 'Local services (Whisper/Kokoro) have no rate limits.'
-        },
-        'billing_limit': {
+        }),
+        'billing_limit': MappingProxyType({
             'title': '💰 OpenAI Billing Limit Reached',
             'message': 'Your OpenAI account has reached its billing hard limit.',
             'suggestion': 'Visit https://platform.openai.com/account/billing to increase your spending limit.',
             'fallback': 'Switch to local voice services which have no billing limits.'
-        },
-        'access_terminated': {
+        }),
+        'access_terminated': MappingProxyType({
             'title': '🚫 OpenAI Access Terminated',
             'message': 'Your OpenAI account access has been terminated.',
             'suggestion': 'Contact OpenAI support or create a new account if appropriate.',
             'fallback': 'Use local voice services (Whisper/Kokoro) instead.'
-        },
-        'invalid_request': {
+        }),
+        'invalid_request': MappingProxyType({
             'title': '❌ Invalid Request',
             'message': 'The request to OpenAI API was invalid.',
             'suggestion': 'This might be a bug. Please report it if it persists.',
             'fallback': 'Try using local services as an alternative.'
-        }
+        })
     }
 
+    # Template for errors that don't match a known type
+    GENERIC_ERROR = MappingProxyType({
+        'title': '⚠️ OpenAI API Error',
+        'suggestion': 'Check your API configuration and try again.',
+        'fallback': 'Consider using local voice services as an alternative.'
+    })
+
     @classmethod
     def parse_error(cls, exception: Exception, endpoint: str = "") -> Dict[str, str]:
         """
@@ -78,18 +114,15 @@ class OpenAIErrorParser:
         """
         error_info = cls._extract_error_info(exception)
         error_type = cls._determine_error_type(error_info)
+        raw_error = error_info['message']
 
-        # Get the appropriate message
-        if error_type in cls.ERROR_MESSAGES:
-            result = cls.ERROR_MESSAGES[error_type].copy()
+        # Copy the shared template for this error type into the result
+        template = cls.ERROR_MESSAGES.get(error_type)
+        if template is not None:
+            result = dict(template)
         else:
             # Generic error fallback
-            result = {
-                'title': '⚠️ OpenAI API Error',
-                'message': f"OpenAI API error: {error_info.get('message', str(exception))}",
-                'suggestion': 'Check your API configuration and try again.',
-                'fallback': 'Consider using local voice services as an alternative.'
-            }
+            result = {**cls.GENERIC_ERROR, 'message': f"OpenAI API error: {raw_error}"}
 
         # Add endpoint info if provided
         if endpoint:
@@ -100,7 +133,7 @@ class OpenAIErrorParser:
             result['status_code'] = error_info['status_code']
 
         # Add raw error for debugging
-        result['raw_error'] = str(exception)
+        result['raw_error'] = raw_error
 
         return result
 
@@ -141,57 +174,64 @@ class OpenAIErrorParser:
     @classmethod
     def _determine_error_type(cls, error_info: Dict) -> str:
         """Determine the type of error based on the extracted information."""
+        # Everything the classification reads, so repeated errors (e.g. during
+        # an outage) are classified once
+        key = (
+            error_info.get('type', ''),
+            error_info.get('message', ''),
+            error_info.get('error_message', ''),
+            error_info.get('status_code'),
+            error_info.get('response_text', ''),
+            error_info.get('error_code', ''),
+        )
+        try:
+            return cls._classify(*key)
+        except TypeError:
+            # Unhashable error payload; classify without caching
+            return cls._classify.__wrapped__(cls, *key)
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _classify(cls, type_name: str, message: str, error_message: str,
+                  status_code: Optional[int], response_text: str, error_code: str) -> str:
+        """Classify an error from its extracted fields; results are cached."""
+
+        # Exception classes that identify the error on their own
+        error_type = cls.ERROR_CLASSES.get(type_name)
+        if error_type:
+            return error_type
+
+        # Text is lowercased once, and only where a branch scans it
 
         # Check status codes first
-        status_code = error_info.get('status_code')
         if status_code:
-            if status_code == 401:
-                return 'auth_failed'
+            if status_code in cls.STATUS_CODES:
+                return cls.STATUS_CODES[status_code]
             elif status_code == 429:
                 # Could be rate limit or quota
-                message = error_info.get('message', '').lower()
-                response_text = error_info.get('response_text', '').lower()
-                error_message = error_info.get('error_message', '').lower()
-
-                all_text = f"{message} {response_text} {error_message}"
-
-                if 'quota' in all_text or 'insufficient_quota' in all_text:
-                    return 'quota_exceeded'
-                elif 'billing' in all_text:
-                    return 'billing_limit'
-                else:
-                    return 'rate_limit'
+                all_text = f"{message} {response_text} {error_message}".lower()
+                return cls._match_keywords(all_text, cls.RATE_LIMIT_KEYWORDS) or 'rate_limit'
             elif status_code == 403:
-                message = error_info.get('message', '').lower()
-                if 'terminated' in message:
+                if 'terminated' in message.lower():
                     return 'access_terminated'
                 return 'auth_failed'
 
         # Check error codes
-        error_code = error_info.get('error_code', '').lower()
+        error_code = error_code.lower()
         if error_code in cls.ERROR_CODES:
             return cls.ERROR_CODES[error_code]
 
         # Check message content
-        message = error_info.get('message', '').lower()
-        error_message = error_info.get('error_message', '').lower()
-        all_messages = f"{message} {error_message}"
-
-        if 'insufficient_quota' in all_messages or 'quota' in all_messages:
-            return 'quota_exceeded'
-        elif 'invalid' in all_messages and 'key' in all_messages:
-            return 'auth_failed'
-        elif 'unauthorized' in all_messages or 'authentication' in all_messages:
-            return 'auth_failed'
-        elif 'rate' in all_messages and 'limit' in all_messages:
-            return 'rate_limit'
-        elif 'billing' in all_messages:
-            return 'billing_limit'
-        elif 'terminated' in all_messages:
-            return 'access_terminated'
-
-        # Default to unknown
-        return 'unknown'
+        all_messages = f"{message} {error_message}" if error_message else message
+        return cls._match_keywords(all_messages.lower(), cls.MESSAGE_KEYWORDS) or 'unknown'
+
+    @staticmethod
+    def _match_keywords(text: str, table: Tuple[Tuple[Tuple[str, ...], str], ...]) -> Optional[str]:
+        """Return the error type of the first entry whose keywords all appear in text."""
+        for keywords, error_type in table:
+            if all(keyword in text for keyword in keywords):
+                return error_type
+        return None
 
     @classmethod
     def format_error_message(cls, error_dict: Dict[str, str], include_fallback: bool = True) -> str:
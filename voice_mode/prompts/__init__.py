@@ -1,13 +1,32 @@
-"""Auto-import all tools for registration with FastMCP."""
-import os
+"""Prompt modules for registration with FastMCP.
+
+Prompt modules register themselves with FastMCP when imported. Importing
+this package only lists them; call register_all() to import every prompt,
+or access a module as an attribute to import just that one.
+"""
 import importlib
-from pathlib import Path
 
-# Get the directory containing this file
-tools_dir = Path(__file__).parent
+from ._manifest import _PROMPT_MODULES
+
+# Names of all prompt modules. The list is generated ahead of time by
+# scripts/gen-prompt-manifest.py so startup doesn't scan the directory.
+_AVAILABLE = frozenset(_PROMPT_MODULES)
 
-# Import all Python files in this directory (except __init__.py)
-for file in tools_dir.glob("*.py"):
-    if file.name != "__init__.py" and not file.name.startswith("_"):
-        module_name = file.stem
+
+def register_all() -> None:
+    """Import every prompt module so its prompts are registered."""
+    for module_name in _PROMPT_MODULES:
         importlib.import_module(f".{module_name}", package=__name__)
+
+
+def __getattr__(name: str):
+    """Import a prompt module on first attribute access."""
+    if name in _AVAILABLE:
+        module = importlib.import_module(f".{name}", package=__name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _AVAILABLE)
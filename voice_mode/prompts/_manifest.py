@@ -0,0 +1,7 @@
+"""Prompt module names, generated by scripts/gen-prompt-manifest.py. Do not edit."""
+
+_PROMPT_MODULES = (
+    "converse",
+    "release_notes",
+    "services",
+)
@@ -11,7 +11,6 @@ Example: TTS \bTali\b Tar-lee # Dog name
 
 import logging
 import re
-import shlex
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
@@ -19,6 +18,15 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Backreferences and conditionals are numbered/named relative to the whole
+# pattern, so rules using them cannot be safely merged into one alternation.
+_GROUP_REFERENCE_RE = re.compile(r'\\(?:[1-9]|g<)|\(\?P=|\(\?\(')
+
+# Rule tokens, split like shlex.split(posix=False): a quote opens a quoted
+# token only at the start of a token, and backslashes are kept as-is.
+# The last alternative captures an opening quote that is never closed.
+_RULE_TOKEN_RE = re.compile(r'''"[^"]*"|'[^']*'|[^ \t\r\n"'][^ \t\r\n]*|(["'])''')
+
 
 @dataclass
 class PronounceRule:
@@ -50,6 +58,23 @@ class PronounceRule:
             return original, False
 
 
+def split_rule_tokens(rule_part: str) -> List[str]:
+    """
+    Split a rule into whitespace-separated tokens, keeping quoted tokens whole.
+
+    Equivalent to shlex.split(rule_part, posix=False) in one regex pass.
+
+    Raises:
+        ValueError: If a quoted token is not closed
+    """
+    tokens = []
+    for match in _RULE_TOKEN_RE.finditer(rule_part):
+        if match.group(1):
+            raise ValueError("No closing quotation")
+        tokens.append(match.group(0))
+    return tokens
+
+
 def parse_compact_rules(text: str) -> Dict[str, List[PronounceRule]]:
     """
     Parse pronunciation rules from compact format.
@@ -81,9 +106,9 @@ def parse_compact_rules(text: str) -> Dict[str, List[PronounceRule]]:
         description = parts[1].strip() if len(parts) > 1 else ""
 
         # Parse the rule part - split on whitespace but respect quotes
-        # Use shlex for quote handling but keep backslashes raw
+        # and keep backslashes raw
         try:
-            tokens = shlex.split(rule_part, posix=False)
+            tokens = split_rule_tokens(rule_part)
         except ValueError as e:
             logger.warning(f"Line {line_num}: Parse error in '{rule_part}': {e}")
             logger.warning(f"  Expected format: DIRECTION pattern replacement # description")
@@ -121,6 +146,33 @@ def parse_compact_rules(text: str) -> Dict[str, List[PronounceRule]]:
     return rules
 
 
+def build_prefilter(rules: List[PronounceRule]) -> Optional[re.Pattern]:
+    """
+    Build a single alternation matching wherever any rule could apply.
+
+    Rules are still applied one by one (each may see the output of the
+    previous one), but text that matches none of them can be returned after
+    a single scan instead of one scan per rule.
+
+    Args:
+        rules: Compiled rules for one direction
+
+    Returns:
+        Combined pattern, or None if the rules cannot be safely combined
+    """
+    if not rules:
+        return None
+
+    if any(_GROUP_REFERENCE_RE.search(rule.pattern) for rule in rules):
+        return None
+
+    try:
+        return re.compile('|'.join(f'(?:{rule.pattern})' for rule in rules))
+    except re.error:
+        # e.g. inline global flags or duplicate group names across rules
+        return None
+
+
 class PronounceManager:
     """Manages pronunciation rules for TTS and STT corrections."""
     
@@ -130,6 +182,10 @@ class PronounceManager:
             'tts': [],
             'stt': []
         }
+        self._prefilters: Dict[str, Optional[re.Pattern]] = {
+            'tts': None,
+            'stt': None
+        }
         self._load_all_rules()
     
     def _load_from_env_vars(self) -> List[str]:
@@ -160,13 +216,30 @@ class PronounceManager:
         # Load from environment variables
         rule_texts = self._load_from_env_vars()
 
+        # The same rule can appear in several variables; keep only its first
+        # occurrence so it is neither compiled into nor applied twice
+        seen = set()
+
         for rule_text in rule_texts:
             try:
                 parsed_rules = parse_compact_rules(rule_text)
-                self.rules['tts'].extend(parsed_rules['tts'])
-                self.rules['stt'].extend(parsed_rules['stt'])
             except Exception as e:
                 logger.error(f"Failed to parse pronunciation rules: {e}")
+                continue
+
+            for direction, rules in parsed_rules.items():
+                for rule in rules:
+                    key = (direction, rule.pattern, rule.replacement)
+                    if key in seen:
+                        logger.debug(f"Skipping duplicate {direction.upper()} rule: {rule.pattern} → {rule.replacement}")
+                        continue
+                    seen.add(key)
+                    self.rules[direction].append(rule)
+
+        self._prefilters = {
+            direction: build_prefilter(rules)
+            for direction, rules in self.rules.items()
+        }
 
         logger.info(f"Loaded {len(self.rules['tts'])} TTS rules and {len(self.rules['stt'])} STT rules")
     
@@ -180,6 +253,13 @@ class PronounceManager:
         Returns:
             Modified text with pronunciation improvements
         """
+        if not text or not self.rules['tts']:
+            return text
+
+        prefilter = self._prefilters.get('tts')
+        if prefilter is not None and not prefilter.search(text):
+            return text
+
         log_substitutions = os.environ.get('VOICEMODE_PRONUNCIATION_LOG_SUBSTITUTIONS', '').lower() == 'true'
 
         for rule in self.rules['tts']:
@@ -200,6 +280,13 @@ class PronounceManager:
         Returns:
             Corrected text
         """
+        if not text or not self.rules['stt']:
+            return text
+
+        prefilter = self._prefilters.get('stt')
+        if prefilter is not None and not prefilter.search(text):
+            return text
+
         log_substitutions = os.environ.get('VOICEMODE_PRONUNCIATION_LOG_SUBSTITUTIONS', '').lower() == 'true'
 
         for rule in self.rules['stt']:
@@ -11,7 +11,8 @@ This module handles automatic discovery of TTS/STT endpoints, including:
 import asyncio
 import logging
 import time
-from typing import Dict, List, Optional, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 
@@ -20,9 +21,14 @@ from openai import AsyncOpenAI
 
 from . import config
 from .config import TTS_BASE_URLS, STT_BASE_URLS, OPENAI_API_KEY
+from .utils import json_codec
 
 logger = logging.getLogger("voicemode")
 
+# Seconds a local endpoint that just failed is skipped by failover, so a
+# service that is not running doesn't cost a connection attempt on every request
+DISCOVERY_FAILURE_TTL = 5.0
+
 
 def detect_provider_type(base_url: str) -> str:
     """Detect provider type from base URL."""
@@ -57,7 +63,17 @@ def is_local_provider(base_url: str) -> bool:
            "localhost" in base_url
 
 
-@dataclass
+@asynccontextmanager
+async def _http_client_or_new(http_client: Optional[httpx.AsyncClient]) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the given shared client, or a short-lived one if none was passed."""
+    if http_client is not None:
+        yield http_client
+    else:
+        async with httpx.AsyncClient(timeout=5.0) as new_client:
+            yield new_client
+
+
+@dataclass(slots=True)
 class EndpointInfo:
     """Information about a discovered endpoint."""
     base_url: str
@@ -78,6 +94,8 @@ class ProviderRegistry:
         }
         self._discovery_lock = asyncio.Lock()
         self._initialized = False
+        # Monotonic time of the last failure of a local endpoint
+        self._failed_at: Dict[Tuple[str, str], float] = {}
     
     async def initialize(self):
         """Initialize the registry with configured endpoints."""
@@ -111,32 +129,86 @@ class ProviderRegistry:
                 )
 
             self._initialized = True
-            logger.info(f"Provider registry initialized with {len(self.registry['tts'])} TTS and {len(self.registry['stt'])} STT endpoints")
+            logger.info("Provider registry initialized with %d TTS and %d STT endpoints", len(self.registry['tts']), len(self.registry['stt']))
     
-    async def _discover_endpoints(self, service_type: str, base_urls: List[str]):
-        """Discover all endpoints for a service type."""
-        tasks = []
-        for url in base_urls:
-            if url not in self.registry[service_type]:
-                tasks.append(self._discover_endpoint(service_type, url))
-        
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for url, result in zip(base_urls, results):
-                if isinstance(result, Exception):
-                    logger.error(f"Failed to discover {service_type} endpoint {url}: {result}")
-                    self.registry[service_type][url] = EndpointInfo(
-                        base_url=url,
-                        models=[],
-                        voices=[],
-                        provider_type=detect_provider_type(url),
-                        last_check=datetime.now(timezone.utc).isoformat(),
-                        last_error=str(result)
-                    )
+    async def _discover_endpoints(self, service_type: str, base_urls: List[str], refresh: bool = False):
+        """Discover all endpoints for a service type.
+
+        Endpoints are probed concurrently and share a single HTTP connection
+        pool. Endpoints already in the registry are skipped unless refresh is
+        set.
+        """
+        urls = [url for url in base_urls if refresh or url not in self.registry[service_type]]
+        if not urls:
+            return
+
+        async with httpx.AsyncClient(timeout=5.0) as http_client:
+            results = await asyncio.gather(
+                *(self._discover_endpoint(service_type, url, http_client) for url in urls),
+                return_exceptions=True
+            )
+
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to discover %s endpoint %s: %s", service_type, url, result)
+                self._update_endpoint(service_type, url, [], [], str(result))
+
+    def _update_endpoint(
+        self,
+        service_type: str,
+        base_url: str,
+        models: List[str],
+        voices: List[str],
+        last_error: Optional[str]
+    ):
+        """Record a probe result, updating the existing entry in place when there is one."""
+        last_check = datetime.now(timezone.utc).isoformat()
+        info = self.registry[service_type].get(base_url)
+        if info is None:
+            self.registry[service_type][base_url] = EndpointInfo(
+                base_url=base_url,
+                models=models,
+                voices=voices,
+                provider_type=detect_provider_type(base_url),
+                last_check=last_check,
+                last_error=last_error
+            )
+            return
+
+        info.models = models
+        info.voices = voices
+        info.last_check = last_check
+        info.last_error = last_error
     
-    async def _discover_endpoint(self, service_type: str, base_url: str) -> None:
-        """Discover capabilities of a single endpoint."""
-        logger.debug(f"Discovering {service_type} endpoint: {base_url}")
+    def recently_failed(self, service_type: str, base_url: str) -> bool:
+        """Check whether a local endpoint failed within DISCOVERY_FAILURE_TTL seconds."""
+        failed_at = self._failed_at.get((service_type, base_url))
+        return failed_at is not None and time.monotonic() - failed_at < DISCOVERY_FAILURE_TTL
+
+    def invalidate_discovery_cache(self, service_type: Optional[str] = None, base_url: Optional[str] = None):
+        """Forget recent failures so failover tries the endpoints again immediately.
+
+        With no arguments the failures of every endpoint are cleared.
+        """
+        if service_type and base_url:
+            self._failed_at.pop((service_type, base_url), None)
+        else:
+            self._failed_at.clear()
+
+    async def _discover_endpoint(
+        self,
+        service_type: str,
+        base_url: str,
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> None:
+        """Discover capabilities of a single endpoint.
+
+        Args:
+            service_type: "tts" or "stt"
+            base_url: Endpoint base URL
+            http_client: Shared client for plain HTTP probes (one is created if omitted)
+        """
+        logger.debug("Discovering %s endpoint: %s", service_type, base_url)
         start_time = time.time()
         
         try:
@@ -152,9 +224,9 @@ class ProviderRegistry:
             try:
                 model_response = await client.models.list()
                 models = [model.id for model in model_response.data]
-                logger.debug(f"Found models at {base_url}: {models}")
+                logger.debug("Found models at %s: %s", base_url, models)
             except Exception as e:
-                logger.debug(f"Could not list models at {base_url}: {e}")
+                logger.debug("Could not list models at %s: %s", base_url, e)
                 # Not all endpoints support /v1/models, that's OK
                 # For STT endpoints, we'll do a more specific health check
                 if service_type == "stt":
@@ -163,21 +235,21 @@ class ProviderRegistry:
                         # For local whisper, check if it responds to basic requests
                         if "127.0.0.1" in base_url or "127.0.0.1" in base_url:
                             # Local whisper doesn't need auth, just check connectivity
-                            import httpx
-                            async with httpx.AsyncClient(timeout=5.0) as http_client:
-                                response = await http_client.get(base_url.rstrip('/v1'))
-                                if response.status_code == 200:
-                                    logger.debug(f"Local whisper endpoint {base_url} is responding")
-                                    models = ["whisper-1"]  # Default model name
-                                else:
-                                    raise Exception(f"Whisper endpoint returned status {response.status_code}")
+                            server_url = base_url[:-len("/v1")] if base_url.endswith("/v1") else base_url
+                            async with _http_client_or_new(http_client) as probe_client:
+                                response = await probe_client.get(server_url)
+                            if response.status_code == 200:
+                                logger.debug("Local whisper endpoint %s is responding", base_url)
+                                models = ["whisper-1"]  # Default model name
+                            else:
+                                raise Exception(f"Whisper endpoint returned status {response.status_code}")
                         else:
                             # For OpenAI, models.list failure likely means auth issue
                             # We'll still mark it as healthy since the endpoint exists
                             models = ["whisper-1"]  # OpenAI's whisper model
-                            logger.debug(f"Assuming OpenAI whisper endpoint {base_url} is available")
+                            logger.debug("Assuming OpenAI whisper endpoint %s is available", base_url)
                     except Exception as health_error:
-                        logger.debug(f"STT health check failed for {base_url}: {health_error}")
+                        logger.debug("STT health check failed for %s: %s", base_url, health_error)
                         raise health_error
             
             # Ensure STT endpoints have at least the default whisper model
@@ -187,54 +259,49 @@ class ProviderRegistry:
             # For TTS, discover voices
             voices = []
             if service_type == "tts":
-                voices = await self._discover_voices(base_url, client)
-                logger.debug(f"Found voices at {base_url}: {voices}")
+                voices = await self._discover_voices(base_url, client, http_client)
+                logger.debug("Found voices at %s: %s", base_url, voices)
             
             # Calculate response time
             response_time = (time.time() - start_time) * 1000
             
             # Store endpoint info
-            self.registry[service_type][base_url] = EndpointInfo(
-                base_url=base_url,
-                models=models,
-                voices=voices,
-                provider_type=detect_provider_type(base_url),
-                last_check=datetime.now(timezone.utc).isoformat(),
-                last_error=None
-            )
+            self._update_endpoint(service_type, base_url, models, voices, None)
             
-            logger.info(f"Successfully discovered {service_type} endpoint {base_url} with {len(models)} models and {len(voices)} voices")
+            self._failed_at.pop((service_type, base_url), None)
+            logger.info("Successfully discovered %s endpoint %s with %d models and %d voices", service_type, base_url, len(models), len(voices))
             
         except Exception as e:
-            logger.warning(f"Endpoint {base_url} discovery failed: {e}")
-            self.registry[service_type][base_url] = EndpointInfo(
-                base_url=base_url,
-                models=[],
-                voices=[],
-                provider_type=detect_provider_type(base_url),
-                last_check=datetime.now(timezone.utc).isoformat(),
-                last_error=str(e)
-            )
+            logger.warning("Endpoint %s discovery failed: %s", base_url, e)
+            if is_local_provider(base_url):
+                self._failed_at[(service_type, base_url)] = time.monotonic()
+            self._update_endpoint(service_type, base_url, [], [], str(e))
     
-    async def _discover_voices(self, base_url: str, client: AsyncOpenAI) -> List[str]:
+    async def _discover_voices(
+        self,
+        base_url: str,
+        client: AsyncOpenAI,
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> List[str]:
         """Discover available voices for a TTS endpoint."""
         # If it's OpenAI, use known voices (they don't expose a voices endpoint)
         if "openai.com" in base_url:
             return ["alloy", "echo", "fable", "nova", "onyx", "shimmer"]
         
         # Try standard OpenAI-compatible voices endpoint
+        voices_url = f"{base_url}/audio/voices"
         try:
             # Use httpx directly for the voices endpoint
-            async with httpx.AsyncClient(timeout=5.0) as http_client:
-                response = await http_client.get(f"{base_url}/audio/voices")
+            async with _http_client_or_new(http_client) as voices_client:
+                response = await voices_client.get(voices_url)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = json_codec.loads(response.content)
                     if isinstance(data, dict) and "voices" in data:
                         return [v["id"] if isinstance(v, dict) else v for v in data["voices"]]
                     elif isinstance(data, list):
                         return [v["id"] if isinstance(v, dict) else v for v in data]
         except Exception as e:
-            logger.debug(f"Could not fetch voices from {base_url}/audio/voices: {e}")
+            logger.debug("Could not fetch voices from %s: %s", voices_url, e)
         
         # If we can't determine voices but the endpoint is healthy, return empty list
         # The system will use configured defaults instead
@@ -300,14 +367,17 @@ class ProviderRegistry:
     async def mark_failed(self, service_type: str, base_url: str, error: str):
         """Record that an endpoint failed.
 
-        This updates the last_error and last_check fields for diagnostics,
-        but doesn't prevent the endpoint from being tried again.
+        This updates the last_error and last_check fields for diagnostics.
+        Local endpoints are also skipped by failover for DISCOVERY_FAILURE_TTL
+        seconds; remote endpoints are always tried again.
         """
+        if is_local_provider(base_url):
+            self._failed_at[(service_type, base_url)] = time.monotonic()
         if base_url in self.registry[service_type]:
             # Update error and last check time for diagnostics
             self.registry[service_type][base_url].last_error = error
             self.registry[service_type][base_url].last_check = datetime.now(timezone.utc).isoformat()
-            logger.info(f"{service_type} endpoint {base_url} failed: {error}")
+            logger.info("%s endpoint %s failed: %s", service_type, base_url, error)
 
 
 # Global registry instance
@@ -106,16 +106,21 @@ async def get_tts_client_and_voice(
     
     # No specific voice requested - iterate through voice preferences
     logger.info("  No specific voice requested, checking voice preferences...")
+
+    # Index each configured endpoint's voices once instead of scanning the
+    # voice lists for every (preference, endpoint) pair
+    endpoint_voice_sets = [
+        (url, endpoint_info, set(endpoint_info.voices))
+        for url in TTS_BASE_URLS
+        if (endpoint_info := provider_registry.registry["tts"].get(url))
+    ]
+
     for preferred_voice in combined_voice_list:
         logger.debug(f"  Looking for voice: {preferred_voice}")
 
         # Check each endpoint for this voice
-        for url in TTS_BASE_URLS:
-            endpoint_info = provider_registry.registry["tts"].get(url)
-            if not endpoint_info:
-                continue
-
-            if preferred_voice in endpoint_info.voices:
+        for url, endpoint_info, voice_set in endpoint_voice_sets:
+            if preferred_voice in voice_set:
                 logger.info(f"  Found voice '{preferred_voice}' at {url} ({endpoint_info.provider_type})")
                 selected_voice = preferred_voice
                 selected_model = _select_model_for_endpoint(endpoint_info, model)
@@ -2,6 +2,7 @@
 
 import os
 import json
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, List
 
@@ -37,20 +38,26 @@ async def list_whisper_models() -> str:
         models: List[Dict[str, Any]] = []
         
         if models_dir.exists():
-            for model_file in models_dir.glob("ggml-*.bin"):
-                model_name = model_file.stem.replace("ggml-", "")
+            with os.scandir(models_dir) as entries:
+                model_files = [
+                    entry for entry in entries
+                    if entry.name.startswith("ggml-") and entry.name.endswith(".bin") and entry.is_file()
+                ]
+            
+            for model_file in model_files:
+                model_name = model_file.name[len("ggml-"):-len(".bin")]
                 file_size = model_file.stat().st_size
                 
                 models.append({
                     "name": model_name,
-                    "path": str(model_file),
+                    "path": model_file.path,
                     "size_bytes": file_size,
                     "size_mb": round(file_size / (1024 * 1024), 1),
                     "size_gb": round(file_size / (1024 * 1024 * 1024), 2)
                 })
         
         # Sort models by name
-        models.sort(key=lambda x: x["name"])
+        models.sort(key=itemgetter("name"))
         
         # Get current configuration from config
         current_model = WHISPER_MODEL
@@ -69,7 +76,7 @@ async def list_whisper_models() -> str:
         # Add recommendations based on available models
         if not models:
             data["recommendation"] = "No models installed. Run 'install_whisper_cpp' tool to install models."
-        elif current_model not in [m["name"] for m in models]:
+        elif not any(m["name"] == current_model for m in models):
             data["recommendation"] = f"Configured model '{current_model}' not found. Available models: {', '.join(m['name'] for m in models)}"
         
         return json.dumps(data, indent=2, ensure_ascii=False)
@@ -32,7 +32,8 @@ def internal_list_tools() -> str:
     """List all registered tools in this server."""
     return str([t.name for t in mcp._tools]) if hasattr(mcp, '_tools') else "No _tools attr"
 
-from . import prompts 
+from . import prompts
+prompts.register_all()
 from . import resources
 
 # Main entry point
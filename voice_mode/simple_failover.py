@@ -6,16 +6,46 @@ Connection refused errors are instant, so there's no performance penalty.
 """
 
 import logging
+import time
 from typing import Optional, Tuple, Dict, Any
 from openai import AsyncOpenAI
 from .openai_error_parser import OpenAIErrorParser
-from .provider_discovery import is_local_provider
+from .provider_discovery import is_local_provider, provider_registry
 
 from .config import TTS_BASE_URLS, STT_BASE_URLS, OPENAI_API_KEY
 from .provider_discovery import detect_provider_type
 
 logger = logging.getLogger("voicemode")
 
+# Voices OpenAI accepts as-is
+OPENAI_VOICES = frozenset({"alloy", "echo", "fable", "nova", "onyx", "shimmer"})
+
+# Common Kokoro voices mapped to their closest OpenAI equivalents
+KOKORO_TO_OPENAI_VOICE = {
+    "af_sky": "nova",
+    "af_sarah": "nova",
+    "af_alloy": "alloy",
+    "am_adam": "onyx",
+    "am_echo": "echo",
+    "am_onyx": "onyx",
+    "bm_fable": "fable"
+}
+
+
+def _failover_candidates(service_type: str, base_urls) -> list:
+    """Endpoints to try in order, leaving out local endpoints that just failed.
+
+    When every endpoint failed recently they are all tried again, so a
+    request is never refused without an attempt.
+    """
+    candidates = [url for url in base_urls if not provider_registry.recently_failed(service_type, url)]
+    if not candidates:
+        return list(base_urls)
+    for url in base_urls:
+        if url not in candidates:
+            logger.info("Skipping recently failed %s endpoint: %s", service_type.upper(), url)
+    return candidates
+
 
 async def simple_tts_failover(
     text: str,
@@ -29,8 +59,8 @@ async def simple_tts_failover(
     Returns:
         Tuple of (success, metrics, config)
     """
-    logger.info(f"simple_tts_failover called with: text='{text[:50]}...', voice={voice}, model={model}")
-    logger.info(f"kwargs: {kwargs}")
+    logger.info("simple_tts_failover called with: text='%s...', voice=%s, model=%s", text[:50], voice, model)
+    logger.info("kwargs: %s", kwargs)
     
     from .core import text_to_speech
     from .conversation_logger import get_conversation_logger
@@ -43,9 +73,10 @@ async def simple_tts_failover(
     conversation_id = conversation_logger.conversation_id
 
     # Try each TTS endpoint in order
-    logger.info(f"simple_tts_failover: Starting with TTS_BASE_URLS = {TTS_BASE_URLS}")
-    for base_url in TTS_BASE_URLS:
-        logger.info(f"Trying TTS endpoint: {base_url}")
+    logger.info("simple_tts_failover: Starting with TTS_BASE_URLS = %s", TTS_BASE_URLS)
+    for base_url in _failover_candidates("tts", TTS_BASE_URLS):
+        logger.info("Trying TTS endpoint: %s", base_url)
+        speech_endpoint = f"{base_url}/audio/speech"
 
         # Create client for this endpoint
         provider_type = detect_provider_type(base_url)
@@ -54,22 +85,11 @@ async def simple_tts_failover(
         # Select appropriate voice for this provider
         if provider_type == "openai":
             # Map Kokoro voices to OpenAI equivalents, or use OpenAI default
-            openai_voices = ["alloy", "echo", "fable", "nova", "onyx", "shimmer"]
-            if voice in openai_voices:
+            if voice in OPENAI_VOICES:
                 selected_voice = voice
             else:
-                # Map common Kokoro voices to OpenAI equivalents
-                voice_mapping = {
-                    "af_sky": "nova",
-                    "af_sarah": "nova",
-                    "af_alloy": "alloy",
-                    "am_adam": "onyx",
-                    "am_echo": "echo",
-                    "am_onyx": "onyx",
-                    "bm_fable": "fable"
-                }
-                selected_voice = voice_mapping.get(voice, "alloy")  # Default to alloy
-                logger.info(f"Mapped voice {voice} to {selected_voice} for OpenAI")
+                selected_voice = KOKORO_TO_OPENAI_VOICE.get(voice, "alloy")  # Default to alloy
+                logger.info("Mapped voice %s to %s for OpenAI", voice, selected_voice)
         else:
             selected_voice = voice  # Use original voice for Kokoro
 
@@ -105,9 +125,9 @@ async def simple_tts_failover(
                     'provider': provider_type,
                     'voice': selected_voice,  # Return the voice actually used
                     'model': model,
-                    'endpoint': f"{base_url}/audio/speech"
+                    'endpoint': speech_endpoint
                 }
-                logger.info(f"TTS succeeded with {base_url} using voice {selected_voice}")
+                logger.info("TTS succeeded with %s using voice %s", base_url, selected_voice)
                 return True, metrics, config
             else:
                 # text_to_speech returned False, but we don't have exception details
@@ -120,22 +140,23 @@ async def simple_tts_failover(
         # Handle the error (either from exception or False return)
         if last_exception:
             error_message = str(last_exception)
-            logger.error(f"TTS failed for {base_url}: {error_message}")
-            logger.debug(f"Exception type: {type(last_exception).__name__}")  # Debug logging
+            logger.error("TTS failed for %s: %s", base_url, error_message)
+            logger.debug("Exception type: %s", type(last_exception).__name__)  # Debug logging
+            await provider_registry.mark_failed("tts", base_url, error_message)
 
             # Parse OpenAI errors for better user feedback
             error_details = None
             if provider_type == "openai":
-                error_details = OpenAIErrorParser.parse_error(last_exception, endpoint=f"{base_url}/audio/speech")
+                error_details = OpenAIErrorParser.parse_error(last_exception, endpoint=speech_endpoint)
                 # Log the user-friendly error message
                 if error_details and error_details.get('title'):
-                    logger.error(f"  {error_details['title']}: {error_details.get('message', '')}")
+                    logger.error("  %s: %s", error_details['title'], error_details.get('message', ''))
                     if error_details.get('suggestion'):
-                        logger.info(f"  💡 {error_details['suggestion']}")
+                        logger.info("  💡 %s", error_details['suggestion'])
 
             # Add to attempted endpoints with error details
             attempted_endpoints.append({
-                'endpoint': f"{base_url}/audio/speech",
+                'endpoint': speech_endpoint,
                 'provider': provider_type,
                 'voice': selected_voice,
                 'model': model,
@@ -147,7 +168,7 @@ async def simple_tts_failover(
             continue
 
     # All endpoints failed - return detailed error info
-    logger.error(f"All TTS endpoints failed after {len(attempted_endpoints)} attempts")
+    logger.error("All TTS endpoints failed after %d attempts", len(attempted_endpoints))
     error_config = {
         'error_type': 'all_providers_failed',
         'attempted_endpoints': attempted_endpoints
@@ -174,8 +195,6 @@ async def simple_stt_failover(
         - request_time_ms: Total time for the API request
         - is_local: Whether the endpoint is local (localhost/LAN)
     """
-    import time
-
     connection_errors = []
     successful_but_empty = False
     successful_provider = None
@@ -192,31 +211,33 @@ async def simple_stt_failover(
         if not isinstance(file_size_bytes, int):
             file_size_bytes = 0
     except Exception as e:
-        logger.debug(f"Could not get file size: {e}")
+        logger.debug("Could not get file size: %s", e)
         file_size_bytes = 0
 
     # Log STT request details
     logger.info("STT: Starting speech-to-text conversion")
-    logger.info(f"  Available endpoints: {STT_BASE_URLS}")
+    logger.info("  Available endpoints: %s", STT_BASE_URLS)
     if file_size_bytes > 0:
-        logger.info(f"  Audio file size: {file_size_bytes / 1024:.1f}KB")
+        logger.info("  Audio file size: %.1fKB", file_size_bytes / 1024)
 
     # Try each STT endpoint in order
-    for i, base_url in enumerate(STT_BASE_URLS):
-        try:
-            # Detect provider type for logging
-            provider_type = detect_provider_type(base_url)
+    endpoints = _failover_candidates("stt", STT_BASE_URLS)
+    for i, base_url in enumerate(endpoints):
+        # Classify the endpoint once; both the success and error paths need it
+        provider_type = detect_provider_type(base_url)
+        is_local = is_local_provider(base_url)
 
+        try:
             if i == 0:
-                logger.info(f"STT: Attempting primary endpoint: {base_url} ({provider_type})")
+                logger.info("STT: Attempting primary endpoint: %s (%s)", base_url, provider_type)
             else:
-                logger.warning(f"STT: Primary failed, attempting fallback #{i}: {base_url} ({provider_type})")
+                logger.warning("STT: Primary failed, attempting fallback #%d: %s (%s)", i, base_url, provider_type)
 
             # Create client for this endpoint
             api_key = OPENAI_API_KEY if provider_type == "openai" else (OPENAI_API_KEY or "dummy-key-for-local")
 
             # Disable retries for local endpoints - they either work or don't
-            max_retries = 0 if is_local_provider(base_url) else 2
+            max_retries = 0 if is_local else 2
             client = AsyncOpenAI(
                 api_key=api_key,
                 base_url=base_url,
@@ -236,7 +257,6 @@ async def simple_stt_failover(
             text = transcription.strip() if isinstance(transcription, str) else transcription.text.strip()
 
             # Build metrics dict
-            is_local = is_local_provider(base_url)
             metrics = {
                 "file_size_bytes": file_size_bytes,
                 "request_time_ms": round(request_time_ms, 1),
@@ -244,14 +264,14 @@ async def simple_stt_failover(
             }
 
             if text:
-                logger.info(f"✓ STT succeeded with {provider_type} at {base_url}")
-                logger.info(f"  Transcribed: {text[:100]}{'...' if len(text) > 100 else ''}")
-                logger.info(f"  Request time: {request_time_ms:.0f}ms, File size: {file_size_bytes/1024:.1f}KB")
+                logger.info("✓ STT succeeded with %s at %s", provider_type, base_url)
+                logger.info("  Transcribed: %s%s", text[:100], '...' if len(text) > 100 else '')
+                logger.info("  Request time: %.0fms, File size: %.1fKB", request_time_ms, file_size_bytes / 1024)
                 # Return both text and provider info for display, plus metrics
                 return {"text": text, "provider": provider_type, "endpoint": base_url, "metrics": metrics}
             else:
                 # Successful connection but no speech detected
-                logger.warning(f"STT returned empty result from {base_url} ({provider_type})")
+                logger.warning("STT returned empty result from %s (%s)", base_url, provider_type)
                 successful_but_empty = True
                 successful_provider = provider_type
                 # Store metrics for potential no_speech return
@@ -259,21 +279,20 @@ async def simple_stt_failover(
 
         except Exception as e:
             error_str = str(e)
-            provider_type = detect_provider_type(base_url)
+            full_endpoint = f"{base_url}/audio/transcriptions"
+            await provider_registry.mark_failed("stt", base_url, error_str)
 
             # Parse OpenAI errors for better user feedback
             error_details = None
             if provider_type == "openai":
-                full_endpoint = f"{base_url}/audio/transcriptions" if not base_url.endswith("/v1") else f"{base_url}/audio/transcriptions"
                 error_details = OpenAIErrorParser.parse_error(e, endpoint=full_endpoint)
                 # Log the user-friendly error message
                 if error_details.get('title'):
-                    logger.error(f"  {error_details['title']}: {error_details.get('message', '')}")
+                    logger.error("  %s: %s", error_details['title'], error_details.get('message', ''))
                     if error_details.get('suggestion'):
-                        logger.info(f"  💡 {error_details['suggestion']}")
+                        logger.info("  💡 %s", error_details['suggestion'])
 
             # Track connection/auth errors
-            full_endpoint = f"{base_url}/audio/transcriptions" if not base_url.endswith("/v1") else f"{base_url}/audio/transcriptions"
             connection_errors.append({
                 "endpoint": full_endpoint,
                 "provider": provider_type,
@@ -282,11 +301,11 @@ async def simple_stt_failover(
             })
 
             # Log failure with appropriate level based on whether we have fallbacks
-            if i < len(STT_BASE_URLS) - 1:
-                logger.warning(f"STT failed for {base_url} ({provider_type}): {e}")
+            if i < len(endpoints) - 1:
+                logger.warning("STT failed for %s (%s): %s", base_url, provider_type, e)
                 logger.info("  Will try next endpoint...")
             else:
-                logger.error(f"STT failed for final endpoint {base_url} ({provider_type}): {e}")
+                logger.error("STT failed for final endpoint %s (%s): %s", base_url, provider_type, e)
 
             # Continue to next endpoint
             continue
@@ -302,7 +321,7 @@ async def simple_stt_failover(
         return result
     elif connection_errors:
         # All endpoints failed with connection/auth errors
-        logger.error(f"✗ All STT endpoints failed after {len(STT_BASE_URLS)} attempts")
+        logger.error("✗ All STT endpoints failed after %d attempts", len(endpoints))
         return {"error_type": "connection_failed", "attempted_endpoints": connection_errors}
     else:
         # Should not reach here, but handle it gracefully
@@ -5,6 +5,7 @@ This module provides real-time tracking of voice conversation performance metric
 including turnaround times, processing speeds, and session statistics.
 """
 
+import re
 import time
 import json
 import threading
@@ -18,6 +19,11 @@ import logging
 
 logger = logging.getLogger("voicemode")
 
+# One "<metric> <value>s" entry of a ", "-separated timing string. The metric
+# runs to the first space and the value to the entry's trailing "s", so
+# float() gets the same text as when the string was split by hand
+_TIMING_RE = re.compile(r'(?:^|(?<=, ))((?:[^ ,]|,(?! ))*) ([^,]*)s(?=, |\Z)')
+
 
 @dataclass
 class ConversationMetric:
@@ -114,15 +120,11 @@ class ConversationStatistics:
             return timings
             
         # Example: "ttfa 0.5s, tts_gen 1.2s, tts_play 2.1s, tts_total 3.3s, record 15.0s, stt 0.8s, total 19.1s"
-        parts = timing_str.split(", ")
-        for part in parts:
-            if " " in part:
-                key, value = part.split(" ", 1)
-                if value.endswith("s"):
-                    try:
-                        timings[key] = float(value[:-1])
-                    except ValueError:
-                        continue
+        for key, value in _TIMING_RE.findall(timing_str):
+            try:
+                timings[key] = float(value)
+            except ValueError:
+                continue
         return timings
         
     def add_conversation_result(self, 
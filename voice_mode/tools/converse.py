@@ -704,7 +704,8 @@ def record_audio(duration: float) -> np.ndarray:
         )
         sd.wait()
         
-        flattened = recording.flatten()
+        # reshape view instead of flatten(), which would copy the whole recording
+        flattened = recording.reshape(-1)
         logger.info(f"✓ Recorded {len(flattened)} samples")
         
         if DEBUG:
@@ -847,6 +848,9 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
         import queue
         audio_queue = queue.Queue()
         
+        # Resampler for VAD, imported once rather than per chunk
+        from scipy import signal
+        
         # Save stdio state
         import sys
         original_stdin = sys.stdin
@@ -904,13 +908,13 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
                             # Raise an exception to trigger recovery logic
                             raise sd.PortAudioError("Audio device disconnected or unavailable")
                         
-                        # Flatten for consistency
-                        chunk_flat = chunk.flatten()
+                        # Flatten for consistency; the callback already copied
+                        # the chunk, so a view is enough
+                        chunk_flat = chunk.reshape(-1)
                         chunks.append(chunk_flat)
                         
                         # For VAD, we need to downsample from 24kHz to 16kHz
                         # Use scipy's resample for proper downsampling
-                        from scipy import signal
                         # Calculate the number of samples we need after resampling
                         resampled_length = int(len(chunk_flat) * vad_sample_rate / SAMPLE_RATE)
                         vad_chunk = signal.resample(chunk_flat, resampled_length)
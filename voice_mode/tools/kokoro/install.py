@@ -5,6 +5,7 @@ import sys
 import platform
 import subprocess
 import shutil
+import signal
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
@@ -18,10 +19,91 @@ from voice_mode.utils.version_helpers import (
     checkout_version, is_version_installed
 )
 from voice_mode.utils.migration_helpers import auto_migrate_if_needed
+from voice_mode.utils.services.common import write_service_file
 
 logger = logging.getLogger("voicemode")
 
 
+async def _run_checked(cmd, cwd: Optional[str] = None) -> None:
+    """Run a command without blocking the event loop, raising like check=True."""
+    proc = await asyncio.create_subprocess_exec(*cmd, cwd=cwd)
+    try:
+        returncode = await proc.wait()
+    except asyncio.CancelledError:
+        # Don't leave the command running once its result is no longer wanted
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+async def _run_pipeline_checked(*cmds, cwd: Optional[str] = None) -> None:
+    """Run commands as a pipeline, each one's stdout feeding the next one's stdin.
+
+    Every command is its own process rather than a child of a shell, so
+    cancelling kills all of them. Raises like check=True if any command
+    fails, as with set -o pipefail.
+    """
+    # On POSIX each command leads its own process group, so whatever it
+    # starts (an install script runs its own downloads) is killed with it
+    new_session = hasattr(os, "killpg")
+    procs = []
+    stdin = None
+    try:
+        for i, cmd in enumerate(cmds):
+            read_fd = write_fd = None
+            if i < len(cmds) - 1:
+                read_fd, write_fd = os.pipe()
+            try:
+                procs.append(await asyncio.create_subprocess_exec(
+                    *cmd, cwd=cwd, stdin=stdin, stdout=write_fd, start_new_session=new_session
+                ))
+            except BaseException:
+                if read_fd is not None:
+                    os.close(read_fd)
+                raise
+            finally:
+                # The child has its own copies of the pipe ends it was given
+                for fd in (stdin, write_fd):
+                    if fd is not None:
+                        os.close(fd)
+            stdin = read_fd
+        returncodes = await asyncio.gather(*(proc.wait() for proc in procs))
+    except BaseException:
+        # Don't leave any stage running once the result is no longer wanted
+        for proc in procs:
+            try:
+                if new_session:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                elif proc.returncode is None:
+                    proc.kill()
+            except (ProcessLookupError, PermissionError):
+                pass  # Already gone
+        for proc in procs:
+            await proc.wait()
+        raise
+    for cmd, returncode in zip(cmds, returncodes):
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, cmd)
+
+
+async def _run_all_checked(*steps) -> None:
+    """Run _run_checked steps concurrently, cancelling the rest when one fails."""
+    if not steps:
+        return
+    tasks = [asyncio.ensure_future(step) for step in steps]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def update_kokoro_service_files(
     install_dir: str,
     voicemode_dir: str,
@@ -56,7 +138,7 @@ async def update_kokoro_service_files(
 
         # Write service file
         service_path.parent.mkdir(parents=True, exist_ok=True)
-        service_path.write_text(content)
+        write_service_file(service_path, content)
 
         result["success"] = True
         result["updated"] = True
@@ -264,30 +346,43 @@ async def kokoro_install(
                 "error": "Git is required. Please install git and try again."
             }
         
-        # Install UV if not present
-        if not shutil.which("uv"):
-            logger.info("Installing UV package manager...")
-            subprocess.run(
-                "curl -LsSf https://astral.sh/uv/install.sh | sh",
-                shell=True,
-                check=True
-            )
-            # Add UV to PATH for this session
-            os.environ["PATH"] = f"{os.path.expanduser('~/.cargo/bin')}:{os.environ['PATH']}"
-        
+        install_uv = not shutil.which("uv")
+
         # Remove existing installation if force_reinstall
         if force_reinstall and os.path.exists(install_dir):
             logger.info(f"Removing existing installation at {install_dir}")
             shutil.rmtree(install_dir)
-        
-        # Clone repository if not exists
-        if not os.path.exists(install_dir):
+
+        # Installing UV and cloning the repository don't depend on each other,
+        # so run them concurrently
+        fresh_clone = not os.path.exists(install_dir)
+        pending = []
+        if install_uv:
+            logger.info("Installing UV package manager...")
+            pending.append(_run_pipeline_checked(
+                ["curl", "-LsSf", "https://astral.sh/uv/install.sh"],
+                ["sh"]
+            ))
+        if fresh_clone:
             logger.info(f"Cloning kokoro-fastapi repository (version {version})...")
-            subprocess.run([
+            pending.append(_run_checked([
                 "git", "clone", "https://github.com/remsky/kokoro-fastapi.git", install_dir
-            ], check=True)
+            ]))
+        try:
+            await _run_all_checked(*pending)
+        except BaseException:
+            # A clone cut short would be mistaken for an install on the next run
+            if fresh_clone and os.path.exists(install_dir):
+                shutil.rmtree(install_dir, ignore_errors=True)
+            raise
+
+        if install_uv:
+            # Add UV to PATH for this session
+            os.environ["PATH"] = f"{os.path.expanduser('~/.cargo/bin')}:{os.environ['PATH']}"
+
+        if fresh_clone:
             # Checkout the specific version
-            if not checkout_version(Path(install_dir), version):
+            if not await asyncio.to_thread(checkout_version, Path(install_dir), version):
                 shutil.rmtree(install_dir)
                 return {
                     "success": False,
@@ -296,9 +391,9 @@ async def kokoro_install(
         else:
             logger.info(f"Using existing kokoro-fastapi directory, switching to version {version}...")
             # Clean any local changes and checkout the version
-            subprocess.run(["git", "reset", "--hard"], cwd=install_dir, check=True)
-            subprocess.run(["git", "clean", "-fd"], cwd=install_dir, check=True)
-            if not checkout_version(Path(install_dir), version):
+            await _run_checked(["git", "reset", "--hard"], cwd=install_dir)
+            await _run_checked(["git", "clean", "-fd"], cwd=install_dir)
+            if not await asyncio.to_thread(checkout_version, Path(install_dir), version):
                 return {
                     "success": False,
                     "error": f"Failed to checkout version {version}"
@@ -309,7 +404,7 @@ async def kokoro_install(
         venv_path = os.path.join(install_dir, ".venv")
         if not os.path.exists(venv_path):
             logger.info("Creating virtual environment for kokoro...")
-            subprocess.run(["uv", "venv"], cwd=install_dir, check=True)
+            await _run_checked(["uv", "venv"], cwd=install_dir)
 
         # Determine system and select appropriate start script
         system = platform.system()
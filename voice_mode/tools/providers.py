@@ -55,6 +55,17 @@ async def refresh_provider_registry(
                     results.append(f"  ⚠️  {base_url} not in configured URLs")
                     continue
                 urls = [base_url]
+
+            discovery_error = None
+            if not optimistic:
+                # An explicit refresh always re-probes, even within the failure TTL
+                for url in urls:
+                    provider_registry.invalidate_discovery_cache(service, url)
+                # Probe all endpoints concurrently over one connection pool
+                try:
+                    await provider_registry._discover_endpoints(service, urls, refresh=True)
+                except Exception as e:
+                    discovery_error = str(e)
             
             for url in urls:
                 if optimistic:
@@ -72,23 +83,19 @@ async def refresh_provider_registry(
                     results.append(f"\n  ✅ {url}")
                     results.append(f"     Status: Available (optimistic mode)")
                 else:
-                    # Non-optimistic mode: Actually discover endpoint capabilities
-                    try:
-                        await provider_registry._discover_endpoint(service, url)
-                        endpoint_info = provider_registry.registry[service][url]
+                    # Non-optimistic mode: report the capabilities discovered above
+                    endpoint_info = provider_registry.registry.get(service, {}).get(url)
 
-                        if endpoint_info.last_error:
-                            results.append(f"\n  ❌ {url}")
-                            results.append(f"     Error: {endpoint_info.last_error}")
-                        else:
-                            results.append(f"\n  ✅ {url}")
-                            if endpoint_info.models:
-                                results.append(f"     Models: {', '.join(endpoint_info.models)}")
-                            if service == 'tts' and endpoint_info.voices:
-                                results.append(f"     Voices: {', '.join(endpoint_info.voices[:5])}{'...' if len(endpoint_info.voices) > 5 else ''}")
-                    except Exception as e:
+                    if discovery_error or endpoint_info is None or endpoint_info.last_error:
+                        error = discovery_error or (endpoint_info.last_error if endpoint_info else "Endpoint not discovered")
                         results.append(f"\n  ❌ {url}")
-                        results.append(f"     Error: {str(e)}")
+                        results.append(f"     Error: {error}")
+                    else:
+                        results.append(f"\n  ✅ {url}")
+                        if endpoint_info.models:
+                            results.append(f"     Models: {', '.join(endpoint_info.models)}")
+                        if service == 'tts' and endpoint_info.voices:
+                            results.append(f"     Voices: {', '.join(endpoint_info.voices[:5])}{'...' if len(endpoint_info.voices) > 5 else ''}")
         
         results.append("\n✨ Refresh complete!")
         return "\n".join(results)
@@ -14,7 +14,7 @@ import psutil
 
 from voice_mode.mcp_instance import mcp
 from voice_mode.config import WHISPER_PORT, KOKORO_PORT, SERVICE_AUTO_ENABLE
-from voice_mode.utils.services.common import find_process_by_port, check_service_status
+from voice_mode.utils.services.common import find_process_by_port, check_service_status, write_service_file, fill_service_template
 from voice_mode.utils.services.whisper_helpers import find_whisper_server, find_whisper_model
 from voice_mode.utils.services.kokoro_helpers import find_kokoro_fastapi, has_gpu_support, is_kokoro_starting_up
 
@@ -565,7 +565,7 @@ async def enable_service(service_name: str) -> str:
         service_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Write service file
-        service_path.write_text(content)
+        write_service_file(service_path, content)
 
         if system == "Darwin":
             # Load with launchctl
@@ -701,11 +701,9 @@ async def update_service_files(service_name: str) -> str:
             
             # Write new plist with current configuration
             config_vars = get_service_config_vars(service_name)
-            final_content = template_content
-            for key, value in config_vars.items():
-                final_content = final_content.replace(f"{{{key}}}", str(value))
+            final_content = fill_service_template(template_content, config_vars)
             
-            plist_path.write_text(final_content)
+            write_service_file(plist_path, final_content)
             
             # Also update wrapper script if it exists
             wrapper_name = f"start-{service_name}-with-health-check.sh"
@@ -713,9 +711,7 @@ async def update_service_files(service_name: str) -> str:
             if wrapper_template.exists():
                 wrapper_dest = Path(config_vars.get('KOKORO_DIR', config_vars.get('WORKING_DIR', ''))) / wrapper_name
                 if wrapper_dest.parent.exists():
-                    wrapper_content = wrapper_template.read_text()
-                    for key, value in config_vars.items():
-                        wrapper_content = wrapper_content.replace(f"{{{key}}}", str(value))
+                    wrapper_content = fill_service_template(wrapper_template.read_text(), config_vars)
                     wrapper_dest.write_text(wrapper_content)
                     wrapper_dest.chmod(0o755)
             
@@ -737,12 +733,10 @@ async def update_service_files(service_name: str) -> str:
             
             # Write new service file with current configuration
             config_vars = get_service_config_vars(service_name)
-            final_content = template_content
-            for key, value in config_vars.items():
-                final_content = final_content.replace(f"{{{key}}}", str(value))
+            final_content = fill_service_template(template_content, config_vars)
             
             service_path.parent.mkdir(parents=True, exist_ok=True)
-            service_path.write_text(final_content)
+            write_service_file(service_path, final_content)
             
             # Reload systemd daemon
             subprocess.run(["systemctl", "--user", "daemon-reload"], capture_output=True)
@@ -892,20 +886,19 @@ async def install_service(service_name: str) -> Dict[str, Any]:
         template_content = load_service_template(service_name)
         
         # Replace placeholders
-        for key, value in config_vars.items():
-            template_content = template_content.replace(f"{{{key}}}", str(value))
+        template_content = fill_service_template(template_content, config_vars)
         
         if system == "Darwin":
             # Install launchd plist
             plist_path = Path.home() / "Library" / "LaunchAgents" / f"com.voicemode.{service_name}.plist"
             plist_path.parent.mkdir(parents=True, exist_ok=True)
-            plist_path.write_text(template_content)
+            write_service_file(plist_path, template_content)
             return {"success": True, "service_file": str(plist_path)}
         else:
             # Install systemd service
             service_path = Path.home() / ".config" / "systemd" / "user" / f"voicemode-{service_name}.service"
             service_path.parent.mkdir(parents=True, exist_ok=True)
-            service_path.write_text(template_content)
+            write_service_file(service_path, template_content)
             
             # Reload systemd
             subprocess.run(["systemctl", "--user", "daemon-reload"], capture_output=True)
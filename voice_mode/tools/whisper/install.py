@@ -20,6 +20,7 @@ except ImportError:
 from voice_mode.mcp_instance import mcp
 from voice_mode.config import SERVICE_AUTO_ENABLE, DEFAULT_WHISPER_MODEL, WHISPER_PORT
 from voice_mode.utils.services.whisper_helpers import download_whisper_model
+from voice_mode.utils.services.common import fill_service_template, write_service_file
 from voice_mode.utils.version_helpers import (
     get_git_tags, get_latest_stable_tag, get_current_version,
     checkout_version, is_version_installed
@@ -29,6 +30,31 @@ from voice_mode.utils.gpu_detection import detect_gpu
 
 logger = logging.getLogger("voicemode")
 
+# Used when the packaged systemd template cannot be loaded
+_WHISPER_SYSTEMD_FALLBACK = """# voicemode-whisper.service v1.1.0
+# Last updated: 2025-11-12
+# Uses unified startup script for dynamic model selection
+
+[Unit]
+Description=Whisper.cpp Speech Recognition Server
+After=network.target
+
+[Service]
+Type=simple
+ExecStart={START_SCRIPT_PATH}
+# Wait for service to be ready by checking health endpoint
+ExecStartPost=/bin/sh -c 'while ! curl -sf http://127.0.0.1:{WHISPER_PORT}/health >/dev/null 2>&1; do echo "Waiting for Whisper to be ready..."; sleep 1; done; echo "Whisper is ready!"'
+Restart=on-failure
+RestartSec=10
+WorkingDirectory={INSTALL_DIR}
+StandardOutput=append:{LOG_DIR}/whisper/whisper.out.log
+StandardError=append:{LOG_DIR}/whisper/whisper.err.log
+Environment="PATH=/usr/local/bin:/usr/bin:/bin:/usr/local/cuda/bin"
+
+[Install]
+WantedBy=default.target
+"""
+
 
 async def update_whisper_service_files(
     install_dir: str,
@@ -180,9 +206,11 @@ exec "$SERVER_BIN" \\
             logger.info("Loaded plist template from package resources")
         
         # Replace placeholders with expanded paths
-        plist_content = plist_content.replace("{START_SCRIPT_PATH}", start_script_path)
-        plist_content = plist_content.replace("{LOG_DIR}", os.path.join(voicemode_dir, 'logs'))
-        plist_content = plist_content.replace("{INSTALL_DIR}", install_dir)
+        plist_content = fill_service_template(plist_content, {
+            "START_SCRIPT_PATH": start_script_path,
+            "LOG_DIR": os.path.join(voicemode_dir, 'logs'),
+            "INSTALL_DIR": install_dir,
+        })
         
         # Unload if already loaded (ignore errors)
         try:
@@ -191,8 +219,7 @@ exec "$SERVER_BIN" \\
             pass
         
         # Write updated plist
-        with open(plist_path, 'w') as f:
-            f.write(plist_content)
+        write_service_file(plist_path, plist_content)
         
         result["success"] = True
         result["updated"] = True
@@ -238,39 +265,18 @@ exec "$SERVER_BIN" \\
             except Exception as e:
                 logger.warning(f"Failed to load template: {e}. Using fallback inline template.")
                 # Fallback inline template if loading fails
-                service_content = f"""# voicemode-whisper.service v1.1.0
-# Last updated: 2025-11-12
-# Uses unified startup script for dynamic model selection
-
-[Unit]
-Description=Whisper.cpp Speech Recognition Server
-After=network.target
-
-[Service]
-Type=simple
-ExecStart={{START_SCRIPT_PATH}}
-# Wait for service to be ready by checking health endpoint
-ExecStartPost=/bin/sh -c 'while ! curl -sf http://127.0.0.1:{{WHISPER_PORT}}/health >/dev/null 2>&1; do echo "Waiting for Whisper to be ready..."; sleep 1; done; echo "Whisper is ready!"'
-Restart=on-failure
-RestartSec=10
-WorkingDirectory={{INSTALL_DIR}}
-StandardOutput=append:{{LOG_DIR}}/whisper/whisper.out.log
-StandardError=append:{{LOG_DIR}}/whisper/whisper.err.log
-Environment="PATH=/usr/local/bin:/usr/bin:/bin:/usr/local/cuda/bin"
-
-[Install]
-WantedBy=default.target
-"""
+                service_content = _WHISPER_SYSTEMD_FALLBACK
 
         # Replace placeholders with expanded paths
-        service_content = service_content.replace("{START_SCRIPT_PATH}", start_script_path)
-        service_content = service_content.replace("{LOG_DIR}", os.path.join(voicemode_dir, 'logs'))
-        service_content = service_content.replace("{INSTALL_DIR}", install_dir)
-        service_content = service_content.replace("{WHISPER_PORT}", str(WHISPER_PORT))
+        service_content = fill_service_template(service_content, {
+            "START_SCRIPT_PATH": start_script_path,
+            "LOG_DIR": os.path.join(voicemode_dir, 'logs'),
+            "INSTALL_DIR": install_dir,
+            "WHISPER_PORT": WHISPER_PORT,
+        })
 
         # Write systemd service file
-        with open(service_path, 'w') as f:
-            f.write(service_content)
+        write_service_file(service_path, service_content)
         
         # Reload systemd
         try:
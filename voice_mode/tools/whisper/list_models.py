@@ -5,10 +5,10 @@ from voice_mode.tools.whisper.models import (
     WHISPER_MODEL_REGISTRY,
     get_model_directory,
     get_active_model,
-    is_whisper_model_installed,
     get_installed_whisper_models,
+    get_coreml_models,
+    scan_model_directory,
     format_size,
-    has_whisper_coreml_model,
     is_apple_silicon
 )
 
@@ -22,11 +22,17 @@ async def whisper_models() -> Dict[str, Any]:
     try:
         model_dir = get_model_directory()
         current_model = get_active_model()
-        installed_models = get_installed_whisper_models()
+        
+        # One directory listing answers every installed/Core ML check below
+        files, dirs = scan_model_directory(model_dir)
+        installed_models = get_installed_whisper_models(files)
+        installed = set(installed_models)
+        
+        show_coreml = is_apple_silicon()  # Only show Core ML on Apple Silicon
+        coreml_models = get_coreml_models(dirs) if show_coreml else set()
         
         # Build models list with status
         models = []
-        show_coreml = is_apple_silicon()  # Only show Core ML on Apple Silicon
         
         for model_name, info in WHISPER_MODEL_REGISTRY.items():
             model_status = {
@@ -35,9 +41,9 @@ async def whisper_models() -> Dict[str, Any]:
                 "size": format_size(info["size_mb"]),
                 "languages": info["languages"],
                 "description": info["description"],
-                "installed": is_whisper_model_installed(model_name),
+                "installed": model_name in installed,
                 "current": model_name == current_model,
-                "has_coreml": has_whisper_coreml_model(model_name) if show_coreml else False
+                "has_coreml": model_name in coreml_models
             }
             models.append(model_status)
         
@@ -5,7 +5,7 @@ from voice_mode.tools.whisper.models import (
     get_installed_whisper_models,
     benchmark_whisper_model,
     is_whisper_model_installed,
-    WHISPER_MODEL_REGISTRY
+    scan_model_directory
 )
 
 
@@ -34,8 +34,7 @@ async def whisper_model_benchmark(
             }
     elif models == "all":
         # Only benchmark installed models from the full list
-        all_models = list(WHISPER_MODEL_REGISTRY.keys())
-        model_list = [m for m in all_models if is_whisper_model_installed(m)]
+        model_list = get_installed_whisper_models()
         if not model_list:
             return {
                 "success": False,
@@ -50,10 +49,11 @@ async def whisper_model_benchmark(
             }
         model_list = [models]
     elif isinstance(models, list):
-        # List of models specified
+        # List of models specified, checked against one directory listing
+        files, _ = scan_model_directory()
         model_list = []
         for model in models:
-            if is_whisper_model_installed(model):
+            if is_whisper_model_installed(model, files):
                 model_list.append(model)
             else:
                 # Model not installed, skip silently or could use logger.warning
@@ -77,7 +77,8 @@ async def whisper_model_benchmark(
         best_result = None
         
         for run_num in range(runs):
-            result = benchmark_whisper_model(model, sample_file)
+            # Runs stay sequential; concurrent runs would compete for the CPU/GPU and skew timings
+            result = await benchmark_whisper_model(model, sample_file)
             
             if result.get("success"):
                 # Keep the best (fastest) result from multiple runs
@@ -1,8 +1,8 @@
 """Download Whisper models with Core ML support."""
 
-import os
 import sys
 import json
+import asyncio
 import logging
 import platform
 import subprocess
@@ -12,9 +12,16 @@ from typing import Union, List, Dict, Any
 from voice_mode.mcp_instance import mcp
 from voice_mode.config import logger, MODELS_DIR, DEFAULT_WHISPER_MODEL
 from voice_mode.utils.services.whisper_helpers import download_whisper_model, get_available_models
+from voice_mode.tools.whisper.models import is_whisper_model_installed, scan_model_directory
 
 logger = logging.getLogger("voicemode")
 
+# Models downloaded at once; more connections don't help once bandwidth is saturated
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# Pre-built Core ML encoders only apply on Apple Silicon Macs
+IS_APPLE_SILICON = platform.system() == "Darwin" and platform.machine() == "arm64"
+
 
 @mcp.tool()
 async def whisper_model_install(
@@ -83,7 +90,7 @@ async def whisper_model_install(
         
         # CoreML dependencies no longer needed - using pre-built models from Hugging Face!
         # Just check if we're on Apple Silicon and should download Core ML models
-        if platform.system() == "Darwin" and platform.machine() == "arm64" and not skip_core_ml:
+        if IS_APPLE_SILICON and not skip_core_ml:
             logger.info("Apple Silicon detected - will download pre-built Core ML models for optimal performance")
         elif skip_core_ml:
             logger.info("Skipping Core ML models as requested")
@@ -97,29 +104,55 @@ async def whisper_model_install(
             else:
                 models_to_download = [model]
         else:
-            models_to_download = model
+            # Drop repeats (keeping order) so a model isn't downloaded twice at once
+            models_to_download = list(dict.fromkeys(model))
         
         # Validate models
-        invalid_models = [m for m in models_to_download if m not in available_models]
+        invalid_models = set(models_to_download).difference(available_models)
         if invalid_models:
             return json.dumps({
                 "success": False,
-                "error": f"Invalid models: {', '.join(invalid_models)}",
+                "error": f"Invalid models: {', '.join(sorted(invalid_models))}",
                 "available_models": available_models
             }, indent=2)
         
-        # Download models
+        # One listing tells which models are already there, so they don't
+        # wait for a download slot just to find their file exists
+        installed_files, _ = scan_model_directory(actual_models_dir)
+        
+        # Download models concurrently; each download is network bound
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+        
+        async def install_one(model_name: str) -> Dict[str, Any]:
+            if not force_download and is_whisper_model_installed(model_name, installed_files):
+                logger.info(f"Model {model_name} already exists in {actual_models_dir}")
+                return {
+                    "success": True,
+                    "path": str(actual_models_dir / f"ggml-{model_name}.bin"),
+                    "message": "Model already exists"
+                }
+            
+            async with semaphore:
+                logger.info(f"Processing model: {model_name}")
+                return await download_whisper_model(
+                    model_name,
+                    actual_models_dir,
+                    force_download=force_download,
+                    skip_core_ml=skip_core_ml
+                )
+        
+        downloads = await asyncio.gather(
+            *(install_one(model_name) for model_name in models_to_download),
+            return_exceptions=True
+        )
+        
         results = []
         success_count = 0
         
-        for model_name in models_to_download:
-            logger.info(f"Processing model: {model_name}")
-            result = await download_whisper_model(
-                model_name,
-                actual_models_dir,
-                force_download=force_download,
-                skip_core_ml=skip_core_ml
-            )
+        for model_name, result in zip(models_to_download, downloads):
+            if isinstance(result, Exception):
+                logger.error(f"Error downloading model {model_name}: {result}")
+                result = {"success": False, "error": str(result)}
             
             # Build comprehensive result entry
             model_result = {
@@ -186,7 +219,7 @@ async def whisper_model_install(
             "successful_downloads": success_count,
             "failed_downloads": total_models - success_count,
             "results": results,
-            "core_ml_available": not skip_core_ml and os.uname().machine == "arm64",
+            "core_ml_available": not skip_core_ml and IS_APPLE_SILICON,
         }
         
         # Add warnings and recommendations if present
@@ -3,7 +3,7 @@
 import os
 import warnings
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, Set, Tuple, TypedDict
 from voice_mode.config import WHISPER_MODEL_PATH, WHISPER_MODEL
 
 
@@ -91,38 +91,75 @@ WHISPER_MODEL_REGISTRY: Dict[str, ModelInfo] = {
     }
 }
 
+# Reverse lookups from names found in the model directory
+FILENAME_TO_MODEL: Dict[str, str] = {
+    info["filename"]: model_name for model_name, info in WHISPER_MODEL_REGISTRY.items()
+}
+
+# Configured model directory, remembered once it is known to exist
+_model_directory: Optional[Path] = None
+
 
 def get_model_directory() -> Path:
-    """Get the directory where Whisper models are stored."""
+    """Get the directory where Whisper models are stored.
+    
+    Once the configured directory exists it is cached for the process, so
+    per-model lookups don't stat it again. Until then it is re-checked on
+    each call, since an install may create it.
+    """
+    global _model_directory
+    if _model_directory is not None:
+        return _model_directory
+    
     # Use the configured path from config.py
     model_dir = Path(WHISPER_MODEL_PATH)
+    if model_dir.exists():
+        _model_directory = model_dir
+        return model_dir
     
     # If config path doesn't exist, check service installation
-    if not model_dir.exists():
-        service_models = Path.home() / ".voicemode" / "services" / "whisper" / "models"
-        if service_models.exists():
-            return service_models
+    service_models = Path.home() / ".voicemode" / "services" / "whisper" / "models"
+    if service_models.exists():
+        return service_models
     
     return model_dir
 
 
+# Active model, resolved on first use and updated by set_active_model()
+_active_model: Optional[str] = None
+
+
 def get_active_model() -> str:
     """Get the currently selected Whisper model."""
-    # Use the configured model from config.py
-    model = WHISPER_MODEL
+    global _active_model
     
-    # Validate it's a known model
-    if model not in WHISPER_MODEL_REGISTRY:
-        return "base"  # Default fallback
+    if _active_model is None:
+        # Use the configured model from config.py
+        model = WHISPER_MODEL
+        
+        # Validate it's a known model
+        if model not in WHISPER_MODEL_REGISTRY:
+            model = "base"  # Default fallback
+        
+        _active_model = model
     
-    return model
+    return _active_model
 
 
-def is_whisper_model_installed(model_name: str) -> bool:
-    """Check if a Whisper model is installed."""
+def is_whisper_model_installed(model_name: str, files: Optional[Set[str]] = None) -> bool:
+    """Check if a Whisper model is installed.
+    
+    Args:
+        model_name: Name of the model to check
+        files: File names from scan_model_directory(), so checking many
+            models doesn't stat the directory once per model
+    """
     if model_name not in WHISPER_MODEL_REGISTRY:
         return False
     
+    if files is not None:
+        return WHISPER_MODEL_REGISTRY[model_name]["filename"] in files
+    
     model_dir = get_model_directory()
     model_info = WHISPER_MODEL_REGISTRY[model_name]
     model_path = model_dir / model_info["filename"]
@@ -146,23 +183,70 @@ def has_whisper_coreml_model(model_name: str) -> bool:
         return False
     
     model_dir = get_model_directory()
-    model_info = WHISPER_MODEL_REGISTRY[model_name]
     
     # Core ML models can be either compiled (.mlmodelc) or package (.mlpackage)
     # Check for both formats
-    coreml_compiled = model_dir / f"ggml-{model_name}-encoder.mlmodelc"
-    coreml_package = model_dir / f"coreml-encoder-{model_name}.mlpackage"
+    return any((model_dir / name).exists() for name in get_coreml_dirnames(model_name))
+
+
+def get_coreml_dirnames(model_name: str) -> Tuple[str, str]:
+    """Get the compiled (.mlmodelc) and package (.mlpackage) Core ML names for a model."""
+    return (f"ggml-{model_name}-encoder.mlmodelc", f"coreml-encoder-{model_name}.mlpackage")
+
+
+COREML_DIRNAME_TO_MODEL: Dict[str, str] = {
+    dirname: model_name
+    for model_name in WHISPER_MODEL_REGISTRY
+    for dirname in get_coreml_dirnames(model_name)
+}
+
+
+def scan_model_directory(model_dir: Optional[Path] = None) -> Tuple[Set[str], Set[str]]:
+    """List the model directory once.
     
-    return coreml_compiled.exists() or coreml_package.exists()
+    Lets callers that check many models test set membership instead of
+    stat()ing a path per model.
+    
+    Returns:
+        Tuple of (file names, directory names); both empty if it doesn't exist.
+        Anything else, such as a dangling symlink, is in neither.
+    """
+    files: Set[str] = set()
+    dirs: Set[str] = set()
+    try:
+        with os.scandir(model_dir or get_model_directory()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    files.add(entry.name)
+                elif entry.is_dir():
+                    dirs.add(entry.name)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return files, dirs
+
+
+def get_coreml_models(dirs: Set[str]) -> Set[str]:
+    """Get the models with a Core ML encoder among scanned directory names.
+    
+    Like has_whisper_coreml_model, this is empty off macOS.
+    """
+    if not is_macos():
+        return set()
+    return {COREML_DIRNAME_TO_MODEL[name] for name in dirs if name in COREML_DIRNAME_TO_MODEL}
 
 
-def get_installed_whisper_models() -> List[str]:
-    """Get list of installed Whisper models."""
-    installed = []
-    for model_name in WHISPER_MODEL_REGISTRY:
-        if is_whisper_model_installed(model_name):
-            installed.append(model_name)
-    return installed
+def get_installed_whisper_models(files: Optional[Set[str]] = None) -> List[str]:
+    """Get list of installed Whisper models.
+    
+    Args:
+        files: File names from scan_model_directory(), scanned here if omitted
+    """
+    if files is None:
+        files, _ = scan_model_directory()
+    
+    installed = {FILENAME_TO_MODEL[name] for name in files if name in FILENAME_TO_MODEL}
+    # Keep registry order so listings stay stable
+    return [model_name for model_name in WHISPER_MODEL_REGISTRY if model_name in installed]
 
 
 def get_total_size(models: Optional[List[str]] = None) -> int:
@@ -276,6 +360,31 @@ def set_active_model(model_name: str) -> None:
     with open(config_path, 'w') as f:
         f.writelines(lines)
 
+    # Report the new model from now on, not the value read at import
+    global _active_model
+    _active_model = model_name
+
+
+def get_directory_size(path: Path) -> int:
+    """Get the total size in bytes of the files under a directory.
+    
+    Walks with os.scandir so each entry's type (and on Windows its size)
+    comes from the directory listing rather than a separate stat().
+    """
+    total = 0
+    pending = [path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
 
 def remove_whisper_model(model_name: str, remove_coreml: bool = True) -> Dict[str, Any]:
     """Remove a whisper model and optionally its Core ML version.
@@ -295,27 +404,23 @@ def remove_whisper_model(model_name: str, remove_coreml: bool = True) -> Dict[st
     model_info = WHISPER_MODEL_REGISTRY[model_name]
     model_file = model_dir / model_info["filename"]
     
-    if not model_file.exists():
+    # One stat both checks the file is there and gets its size
+    try:
+        space_freed = os.stat(model_file).st_size
+    except FileNotFoundError:
         return {"success": False, "error": f"Model {model_name} not found"}
     
-    space_freed = model_file.stat().st_size
     model_file.unlink()
     
     if remove_coreml and has_whisper_coreml_model(model_name):
-        # Remove both possible Core ML formats
-        coreml_compiled = model_dir / f"ggml-{model_name}-encoder.mlmodelc"
-        coreml_package = model_dir / f"coreml-encoder-{model_name}.mlpackage"
+        import shutil
         
-        if coreml_compiled.exists():
-            import shutil
-            shutil.rmtree(coreml_compiled)
-            # Estimate size since it's a directory
-            space_freed += 100 * 1024 * 1024  # Approximate 100MB
-            
-        if coreml_package.exists():
-            import shutil
-            shutil.rmtree(coreml_package)
-            space_freed += 100 * 1024 * 1024  # Approximate 100MB
+        # Remove both possible Core ML formats
+        for dirname in get_coreml_dirnames(model_name):
+            coreml_dir = model_dir / dirname
+            if coreml_dir.exists():
+                space_freed += get_directory_size(coreml_dir)
+                shutil.rmtree(coreml_dir)
     
     return {
         "success": True,
@@ -325,7 +430,11 @@ def remove_whisper_model(model_name: str, remove_coreml: bool = True) -> Dict[st
     }
 
 
-def benchmark_whisper_model(model_name: str, sample_file: Optional[str] = None) -> Dict[str, Any]:
+# Bytes at the end of whisper-cli's stderr that hold the timing summary
+BENCHMARK_STDERR_TAIL = 4096
+
+
+async def benchmark_whisper_model(model_name: str, sample_file: Optional[str] = None) -> Dict[str, Any]:
     """Run performance benchmark on a whisper model.
     
     Args:
@@ -335,7 +444,7 @@ def benchmark_whisper_model(model_name: str, sample_file: Optional[str] = None)
     Returns:
         Dict with benchmark results
     """
-    import subprocess
+    import asyncio
     import re
     from pathlib import Path
     
@@ -366,23 +475,28 @@ def benchmark_whisper_model(model_name: str, sample_file: Optional[str] = None)
     model_info = WHISPER_MODEL_REGISTRY[model_name]
     model_path = model_dir / model_info["filename"]
     
-    # Run benchmark
+    # Run benchmark without blocking the event loop
     try:
-        result = subprocess.run(
-            [
-                str(whisper_bin),
-                "--model", str(model_path),
-                "--file", str(sample_file),
-                "--threads", "8",
-                "--beam-size", "1"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60
+        process = await asyncio.create_subprocess_exec(
+            str(whisper_bin),
+            "--model", str(model_path),
+            "--file", str(sample_file),
+            "--threads", "8",
+            "--beam-size", "1",
+            # The transcript isn't needed, and the timings are the last
+            # lines of stderr, so only that tail is decoded
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
         )
+        try:
+            _, stderr = await asyncio.wait_for(process.communicate(), timeout=60)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
         
         # Parse timing information
-        output = result.stderr + result.stdout
+        output = stderr[-BENCHMARK_STDERR_TAIL:].decode("utf-8", "replace")
         
         # Extract timings using regex
         encode_match = re.search(r'encode time\s*=\s*([\d.]+)\s*ms', output)
@@ -406,7 +520,7 @@ def benchmark_whisper_model(model_name: str, sample_file: Optional[str] = None)
             "sample_duration_s": 11.0
         }
         
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return {
             "success": False,
             "error": "Benchmark timed out"
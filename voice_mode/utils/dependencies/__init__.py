@@ -6,6 +6,7 @@ required by VoiceMode and its service components (Whisper, Kokoro, etc.).
 
 from .checker import (
     check_component_dependencies,
+    check_dependencies,
     check_dependency,
     install_missing_dependencies,
     load_dependencies,
@@ -16,6 +17,7 @@ from .package_managers import get_package_manager, PackageManager
 
 __all__ = [
     "check_component_dependencies",
+    "check_dependencies",
     "check_dependency",
     "install_missing_dependencies",
     "load_dependencies",
@@ -134,6 +134,52 @@ def check_dependency(package: dict, platform_key: str) -> bool:
     return installed
 
 
+def check_dependencies(packages: List[dict], platform_key: str) -> Dict[str, bool]:
+    """Check several dependencies, querying the package manager once for all of them.
+
+    Packages with a check_command still run it individually; the rest are
+    looked up in a single package manager call instead of one per package.
+
+    Args:
+        packages: Package info dicts from dependencies.yaml
+        platform_key: Platform key ('darwin', 'debian', 'fedora', etc.)
+
+    Returns:
+        Dict mapping package name to installed status, in the given order
+    """
+    cache = get_cache()
+    results: Dict[str, bool] = {}
+    batch = []
+
+    for package in packages:
+        package_name = package["name"]
+        cached = cache.get(package_name)
+        if cached is not None:
+            logger.debug(f"Cache hit for {package_name}: installed")
+            results[package_name] = cached
+        elif "check_command" in package:
+            results[package_name] = check_dependency(package, platform_key)
+        else:
+            results[package_name] = False  # Filled in below, keeps the order
+            batch.append(package_name)
+
+    if batch:
+        try:
+            pm = get_package_manager()
+            checked = pm.check_packages(batch)
+            logger.debug(f"Package manager check for {batch}: {checked}")
+        except RuntimeError as e:
+            logger.warning(f"No package manager available: {e}")
+            checked = {}
+
+        for package_name in batch:
+            installed = checked.get(package_name, False)
+            results[package_name] = installed
+            cache.set(package_name, installed)
+
+    return results
+
+
 def check_component_dependencies(
     component: str,
     dependencies_yaml: Optional[dict] = None
@@ -157,7 +203,7 @@ def check_component_dependencies(
     is_wsl = platform_key.startswith("wsl-")
     package_platform_key = platform_key.replace("wsl-", "") if is_wsl else platform_key
 
-    results = {}
+    to_check = []
 
     component_deps = dependencies_yaml["voicemode"].get(component, {})
 
@@ -166,7 +212,7 @@ def check_component_dependencies(
     for package in common_deps:
         required = package.get("required", False)
         if required:
-            results[package["name"]] = check_dependency(package, "common")
+            to_check.append(package)
 
     # Check platform-specific packages
     platform_deps = component_deps.get(package_platform_key, {}).get("packages", [])
@@ -181,9 +227,9 @@ def check_component_dependencies(
 
         # Skip non-required packages unless explicitly required
         if required:
-            results[package["name"]] = check_dependency(package, package_platform_key)
+            to_check.append(package)
 
-    return results
+    return check_dependencies(to_check, package_platform_key)
 
 
 def _spinner(stop_event, message="Installing"):
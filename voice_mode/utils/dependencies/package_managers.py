@@ -1,7 +1,7 @@
 """Package manager abstraction for cross-platform dependency installation."""
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 import subprocess
 import shutil
 import logging
@@ -22,6 +22,10 @@ class PackageManager(ABC):
         """Check if a package is installed."""
         pass
 
+    def check_packages(self, package_names: List[str]) -> Dict[str, bool]:
+        """Check several packages. Managers that can query many at once override this."""
+        return {name: self.check_package(name) for name in package_names}
+
     @abstractmethod
     def install_packages(self, package_names: List[str], verbose: bool = False) -> Tuple[bool, str]:
         """Install packages. Returns (success, message)."""
@@ -79,6 +83,27 @@ class AptManager(PackageManager):
             logger.debug(f"Error checking package {package_name}: {e}")
             return False
 
+    def check_packages(self, package_names: List[str]) -> Dict[str, bool]:
+        installed = dict.fromkeys(package_names, False)
+        if not package_names:
+            return installed
+        try:
+            # One dpkg-query for all packages; exits non-zero if any is unknown
+            result = subprocess.run(
+                ["dpkg-query", "-W", "-f=${Package} ${Status}\n"] + package_names,
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.debug(f"Error checking packages {package_names}: {e}")
+            return installed
+        for line in result.stdout.splitlines():
+            name, _, status = line.partition(" ")
+            if name in installed and status == "install ok installed":
+                installed[name] = True
+        return installed
+
     def install_packages(self, package_names: List[str], verbose: bool = False) -> Tuple[bool, str]:
         # Need sudo for apt
         cmd = ["sudo", "apt-get", "install", "-y"] + package_names
@@ -112,6 +137,26 @@ class DnfManager(PackageManager):
             logger.debug(f"Error checking package {package_name}: {e}")
             return False
 
+    def check_packages(self, package_names: List[str]) -> Dict[str, bool]:
+        installed = dict.fromkeys(package_names, False)
+        if not package_names:
+            return installed
+        try:
+            # One rpm query for all packages; missing ones print "package X is not installed"
+            result = subprocess.run(
+                ["rpm", "-q", "--qf", "%{NAME}\n"] + package_names,
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.debug(f"Error checking packages {package_names}: {e}")
+            return installed
+        for line in result.stdout.splitlines():
+            if line in installed:
+                installed[line] = True
+        return installed
+
     def install_packages(self, package_names: List[str], verbose: bool = False) -> Tuple[bool, str]:
         # Need sudo for dnf
         cmd = ["sudo", "dnf", "install", "-y"] + package_names
@@ -5,10 +5,15 @@ import sys
 import time
 import urllib.request
 import urllib.error
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Iterator, Optional, Union
 import click
 
+# Bytes read per write while streaming a download; large enough that model
+# files aren't copied in thousands of tiny slices, small enough to bound memory
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def detect_progress_style() -> str:
     """Auto-detect best progress style based on environment."""
@@ -30,6 +35,98 @@ def format_size(bytes_size: int) -> str:
     return f"{bytes_size:.1f} TB"
 
 
+@contextmanager
+def _progress_reporter(
+    style: str,
+    url: str,
+    destination: Path,
+    description: str,
+    total_size: int
+) -> Iterator[Callable[[int], None]]:
+    """
+    Report download progress in one of the download_with_progress styles.
+
+    Yields a callback taking the size of each chunk as it is written. The
+    closing line is only printed when the download completes.
+    """
+    if style == 'quiet':
+        # Silent download
+        yield lambda size: None
+        return
+
+    if style == 'verbose':
+        # Verbose mode for CI/logging
+        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Starting download: {destination.name}")
+        print(f"URL: {url}")
+        if total_size > 0:
+            print(f"Size: {format_size(total_size)}")
+
+        downloaded = 0
+        start_time = time.time()
+        last_print = 0
+
+        def update(size: int) -> None:
+            nonlocal downloaded, start_time, last_print
+            downloaded += size
+
+            # Print progress every 5% or 5 seconds
+            current_time = time.time()
+            if total_size > 0:
+                percent = (downloaded / total_size) * 100
+                if percent - last_print >= 5 or current_time - start_time >= 5:
+                    speed = downloaded / (current_time - start_time)
+                    print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Progress: {percent:.0f}% ({format_size(downloaded)} / {format_size(total_size)}) - {format_size(speed)}/s")
+                    last_print = percent
+            elif current_time - start_time >= 5:
+                speed = downloaded / (current_time - start_time)
+                print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Downloaded: {format_size(downloaded)} - {format_size(speed)}/s")
+                start_time = current_time
+
+        yield update
+        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Download complete: {destination.name}")
+        return
+
+    if total_size == 0 or style == 'spinner':
+        # Unknown size - use spinner
+        with click.progressbar(
+            label=description,
+            length=None,
+            show_percent=False,
+            show_pos=True
+        ) as bar:
+            downloaded = 0
+
+            def update(size: int) -> None:
+                nonlocal downloaded
+                downloaded += size
+                bar.update(size)
+
+            yield update
+
+        click.echo(f" ✓ Downloaded {format_size(downloaded)}")
+        return
+
+    # style == 'bar' or default
+    # Known size - use progress bar
+    # Add size info to label
+    size_str = format_size(total_size)
+    full_label = f"{description} ({size_str})"
+
+    with click.progressbar(
+        length=total_size,
+        label=full_label,
+        show_eta=True,
+        show_percent=True,
+        show_pos=False,  # Disable raw byte position
+        width=40,
+        fill_char='█',
+        empty_char='░'
+    ) as bar:
+        yield bar.update
+
+    click.echo(" ✓ Complete")
+
+
 def download_with_progress(
     url: str,
     destination: Union[str, Path],
@@ -66,86 +163,12 @@ def download_with_progress(
         response = urllib.request.urlopen(url)
         total_size = int(response.headers.get('Content-Length', 0))
 
-        if style == 'quiet':
-            # Silent download
-            with open(destination, 'wb') as f:
-                while chunk := response.read(8192):
-                    f.write(chunk)
-            return True
-
-        elif style == 'verbose':
-            # Verbose mode for CI/logging
-            print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Starting download: {destination.name}")
-            print(f"URL: {url}")
-            if total_size > 0:
-                print(f"Size: {format_size(total_size)}")
-
-            downloaded = 0
-            start_time = time.time()
-            last_print = 0
-
-            with open(destination, 'wb') as f:
-                while chunk := response.read(8192):
-                    f.write(chunk)
-                    downloaded += len(chunk)
-
-                    # Print progress every 5% or 5 seconds
-                    current_time = time.time()
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        if percent - last_print >= 5 or current_time - start_time >= 5:
-                            speed = downloaded / (current_time - start_time)
-                            print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Progress: {percent:.0f}% ({format_size(downloaded)} / {format_size(total_size)}) - {format_size(speed)}/s")
-                            last_print = percent
-                    elif current_time - start_time >= 5:
-                        speed = downloaded / (current_time - start_time)
-                        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Downloaded: {format_size(downloaded)} - {format_size(speed)}/s")
-                        start_time = current_time
-
-            print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Download complete: {destination.name}")
-            return True
-
-        elif total_size == 0 or style == 'spinner':
-            # Unknown size - use spinner
-            with click.progressbar(
-                label=description,
-                length=None,
-                show_percent=False,
-                show_pos=True
-            ) as bar:
-                downloaded = 0
-                with open(destination, 'wb') as f:
-                    while chunk := response.read(8192):
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        bar.update(len(chunk))
-
-            click.echo(f" ✓ Downloaded {format_size(downloaded)}")
-            return True
-
-        else:  # style == 'bar' or default
-            # Known size - use progress bar
-            # Add size info to label
-            size_str = format_size(total_size)
-            full_label = f"{description} ({size_str})"
-
-            with click.progressbar(
-                length=total_size,
-                label=full_label,
-                show_eta=True,
-                show_percent=True,
-                show_pos=False,  # Disable raw byte position
-                width=40,
-                fill_char='█',
-                empty_char='░'
-            ) as bar:
-                with open(destination, 'wb') as f:
-                    while chunk := response.read(8192):
-                        f.write(chunk)
-                        bar.update(len(chunk))
-
-            click.echo(" ✓ Complete")
-            return True
+        with _progress_reporter(style, url, destination, description, total_size) as update, \
+                open(destination, 'wb') as f:
+            while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                update(len(chunk))
+        return True
 
     except urllib.error.HTTPError as e:
         if not quiet:
@@ -185,3 +208,120 @@ async def download_with_progress_async(
         download_with_progress,
         url, destination, description, style, quiet
     )
+
+
+# Files at least this big are fetched over several ranged connections
+PARALLEL_DOWNLOAD_MIN_SIZE = 200 * 1024 * 1024
+
+
+def get_download_connections() -> int:
+    """Get the number of connections for ranged downloads.
+
+    Set with VOICEMODE_DOWNLOAD_CONNECTIONS (default 8).
+    """
+    try:
+        return max(1, int(os.environ.get('VOICEMODE_DOWNLOAD_CONNECTIONS', '8')))
+    except ValueError:
+        return 8
+
+
+async def download_parallel_async(
+    url: str,
+    destination: Union[str, Path],
+    description: Optional[str] = None,
+    connections: Optional[int] = None,
+    style: str = "auto",
+    quiet: bool = False
+) -> bool:
+    """
+    Download a large file over several HTTP range requests at once.
+
+    A single connection to the Hugging Face CDN tops out well below a fast
+    link, so large files are split into byte ranges that are fetched
+    concurrently and written at their offsets in a preallocated file.
+    Falls back to download_with_progress_async when the server reports no
+    size or no range support, the file is small, or one connection is set.
+    Progress is reported in the same styles as download_with_progress.
+
+    Returns:
+        True if successful, False otherwise
+    """
+    import asyncio
+    import httpx
+
+    if quiet:
+        style = 'quiet'
+    elif style == 'auto':
+        style = detect_progress_style()
+
+    destination = Path(destination)
+    connections = connections or get_download_connections()
+    if not description:
+        description = f"Downloading {destination.name}"
+
+    async with httpx.AsyncClient(follow_redirects=True, timeout=httpx.Timeout(30.0, read=60.0)) as client:
+        try:
+            head = await client.head(url)
+            head.raise_for_status()
+            total_size = int(head.headers.get('Content-Length', 0))
+            ranged = head.headers.get('Accept-Ranges', '').lower() == 'bytes'
+        except (httpx.HTTPError, ValueError):
+            total_size, ranged = 0, False
+
+        if connections < 2 or not ranged or total_size < PARALLEL_DOWNLOAD_MIN_SIZE:
+            return await download_with_progress_async(url, destination, description, style, quiet)
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        part_path = destination.with_name(destination.name + '.part')
+        step = -(-total_size // connections)
+        ranges = [(start, min(start + step, total_size) - 1) for start in range(0, total_size, step)]
+
+        async def fetch_range(start: int, end: int, update: Callable[[int], None]) -> None:
+            headers = {'Range': f'bytes={start}-{end}'}
+            async with client.stream('GET', url, headers=headers) as response:
+                if response.status_code != 206:
+                    raise IOError(f"Range request not honoured (HTTP {response.status_code})")
+                # Each range has its own handle, so writes need no locking
+                with open(part_path, 'r+b') as f:
+                    f.seek(start)
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        update(len(chunk))
+                    if f.tell() != end + 1:
+                        raise IOError(f"Incomplete range {start}-{end}")
+
+        async def fetch_all(update: Callable[[int], None]) -> None:
+            tasks = [asyncio.create_task(fetch_range(start, end, update)) for start, end in ranges]
+            try:
+                # Stop at the first failed range instead of letting the rest run on
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    task.result()
+            finally:
+                # Wait for cancelled ranges too, so every handle is closed before
+                # the .part file is replaced or removed (Windows can't unlink open files)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Ranges all report to one progress display, so it shows the whole file
+        label = f"{description} ({len(ranges)} connections)"
+        replaced = False
+        try:
+            # Allocate the whole file up front so ranges can land in any order
+            with open(part_path, 'wb') as f:
+                f.truncate(total_size)
+            with _progress_reporter(style, url, destination, label, total_size) as update:
+                await fetch_all(update)
+                os.replace(part_path, destination)
+                replaced = True
+        except Exception as e:
+            if not quiet:
+                click.echo(f"\n❌ Download failed: {e}", err=True)
+            return False
+        finally:
+            # Also runs on cancellation, which the except above doesn't catch
+            if not replaced:
+                part_path.unlink(missing_ok=True)
+
+    return True
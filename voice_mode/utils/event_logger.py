@@ -18,6 +18,27 @@ import atexit
 
 logger = logging.getLogger("voicemode.event-logger")
 
+# (whole second, its ISO prefix) for the most recent event timestamp
+_timestamp_second: tuple = (None, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time in ISO format, formatting the date part once per second.
+
+    Events arrive in bursts within the same second, so only the microseconds
+    change between most calls. Output matches datetime.isoformat() except that
+    the microseconds are always present.
+    """
+    global _timestamp_second
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _timestamp_second
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _timestamp_second = (second, prefix)
+    microsecond = min(int((now - second) * 1_000_000), 999_999)
+    return f"{prefix}.{microsecond:06d}+00:00"
+
 
 @dataclass
 class VoiceEvent:
@@ -125,7 +146,7 @@ class EventLogger:
             return
             
         event = VoiceEvent(
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=_utc_timestamp(),
             event_type=event_type,
             session_id=self.session_id,
             data=data or {}
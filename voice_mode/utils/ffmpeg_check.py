@@ -1,5 +1,6 @@
 """FFmpeg detection and installation helper for voice-mode."""
 
+import functools
 import os
 import platform
 import shutil
@@ -14,7 +15,7 @@ def check_ffmpeg() -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_installed, path_to_ffmpeg)
     """
-    ffmpeg_path = shutil.which('ffmpeg')
+    ffmpeg_path = _find_executable('ffmpeg', os.environ.get('PATH', ''))
     return (ffmpeg_path is not None, ffmpeg_path)
 
 
@@ -24,10 +25,20 @@ def check_ffprobe() -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_installed, path_to_ffprobe)
     """
-    ffprobe_path = shutil.which('ffprobe')
+    ffprobe_path = _find_executable('ffprobe', os.environ.get('PATH', ''))
     return (ffprobe_path is not None, ffprobe_path)
 
 
+@functools.lru_cache(maxsize=8)
+def _find_executable(name: str, path: str) -> Optional[str]:
+    """Look up an executable; `path` only keys the cache so a changed PATH re-probes.
+    
+    Call _find_executable.cache_clear() to re-probe after installing FFmpeg
+    into a directory already on PATH.
+    """
+    return shutil.which(name)
+
+
 def get_ffmpeg_version() -> Optional[str]:
     """Get FFmpeg version if installed.
     
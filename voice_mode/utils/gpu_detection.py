@@ -1,5 +1,7 @@
 """GPU detection utilities for voice mode."""
 
+import functools
+import os
 import platform
 import subprocess
 from typing import Tuple, Optional
@@ -17,9 +19,16 @@ def detect_gpu() -> Tuple[bool, Optional[str]]:
         - "cuda" for NVIDIA CUDA
         - "rocm" for AMD ROCm
         - "cpu" or None if no GPU detected
+
+    The probe forks nvidia-smi/rocm-smi/lspci, so its result is cached per
+    platform and PATH; installers and service setup call this repeatedly.
     """
-    system = platform.system()
-    
+    return _detect_gpu(platform.system(), os.environ.get("PATH", ""))
+
+
+@functools.lru_cache(maxsize=8)
+def _detect_gpu(system: str, path: str) -> Tuple[bool, Optional[str]]:
+    """Probe for a GPU; `path` only keys the cache so a changed PATH re-probes."""
     if system == "Darwin":
         # macOS always has Metal support on modern systems
         try:
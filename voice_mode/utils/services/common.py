@@ -1,12 +1,17 @@
 """Common utilities for service management tools."""
 
+import os
+import re
 import psutil
 import socket
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import Any, Mapping, Optional, Tuple, Union
 import logging
 
 logger = logging.getLogger("voicemode")
 
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
 
 def find_process_by_port(port: int) -> Optional[psutil.Process]:
     """Find a process listening on the specified port.
@@ -78,3 +83,27 @@ def check_service_status(port: int) -> Tuple[str, Optional[psutil.Process]]:
     
     # Not accessible at all
     return ("not_available", None)
+
+
+def write_service_file(path: Union[str, Path], content: str) -> None:
+    """Write a plist/unit file atomically.
+
+    The content goes to a sibling temp file that is then renamed over the
+    target, so launchd/systemd never see a half-written service file.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(content)
+    os.replace(tmp_path, path)
+
+
+def fill_service_template(template: str, values: Mapping[str, Any]) -> str:
+    """Substitute {KEY} placeholders in a service template in a single pass.
+
+    Placeholders without a value are left as they are.
+    """
+    def substitute(match: re.Match) -> str:
+        key = match.group(1)
+        return str(values[key]) if key in values else match.group(0)
+
+    return _PLACEHOLDER_RE.sub(substitute, template)
@@ -1,5 +1,6 @@
 """Helper functions for whisper service management."""
 
+import asyncio
 import os
 import re
 import subprocess
@@ -12,7 +13,7 @@ from typing import Optional, List, Dict, Union
 # Core ML setup no longer needed - using pre-built models from Hugging Face
 # from .coreml_setup import setup_coreml_venv, get_coreml_python
 
-from voice_mode.utils.download import download_with_progress_async
+from voice_mode.utils.download import DOWNLOAD_CHUNK_SIZE, download_parallel_async
 
 logger = logging.getLogger("voicemode")
 
@@ -117,19 +118,45 @@ async def download_whisper_model(
 
     logger.info(f"Downloading model: {model}")
 
+    # Check for Core ML support on Apple Silicon (unless explicitly skipped)
+    use_core_ml = platform.system() == "Darwin" and platform.machine() == "arm64" and not skip_core_ml
+
     try:
-        # Download with progress bar
-        success = await download_with_progress_async(
+        # Large models are fetched over several ranged connections
+        ggml_download = download_parallel_async(
             url=model_url,
             destination=model_path,
             description=f"Downloading Whisper model {model}"
         )
 
+        core_ml_task = None
+        if use_core_ml:
+            # Download pre-built Core ML model from Hugging Face alongside the
+            # weights, so the link stays busy while either one finishes.
+            # No Python dependencies or Xcode required!
+            coreml_dir = models_dir / f"ggml-{model}-encoder.mlmodelc"
+            coreml_existed = coreml_dir.exists()
+            core_ml_task = asyncio.ensure_future(download_coreml_model(model, models_dir))
+
+        success = False
+        try:
+            success = await ggml_download
+        finally:
+            if core_ml_task is not None and not success:
+                # An encoder is no use without the weights, so stop it and
+                # drop anything it already extracted
+                core_ml_task.cancel()
+                await asyncio.gather(core_ml_task, return_exceptions=True)
+                if not coreml_existed:
+                    shutil.rmtree(coreml_dir, ignore_errors=True)
+
         if not success:
             return {
                 "success": False,
                 "error": f"Failed to download model {model}"
             }
+
+        core_ml_result = await core_ml_task if core_ml_task is not None else None
         
         # Verify download
         if not model_path.exists():
@@ -138,14 +165,7 @@ async def download_whisper_model(
                 "error": f"Model file not found after download: {model_path}"
             }
         
-        # Initialize core_ml_result
-        core_ml_result = None
-        
-        # Check for Core ML support on Apple Silicon (unless explicitly skipped)
-        if platform.system() == "Darwin" and platform.machine() == "arm64" and not skip_core_ml:
-            # Download pre-built Core ML model from Hugging Face
-            # No Python dependencies or Xcode required!
-            core_ml_result = await download_coreml_model(model, models_dir)
+        if core_ml_result:
             if core_ml_result["success"]:
                 logger.info(f"Core ML conversion completed for {model}")
             else:
@@ -186,6 +206,46 @@ async def download_whisper_model(
         }
 
 
+# Core ML archives up to this size are held in memory while downloading
+COREML_SPOOL_MAX_SIZE = 256 * 1024 * 1024
+
+
+async def _download_and_extract_zip(url: str, dest_dir: Path) -> None:
+    """Stream a zip archive into a spooled temp file and extract it into dest_dir.
+    
+    The archive never lands next to the models, so there is no .zip to clean
+    up, and extraction runs in a thread so other downloads keep going.
+    
+    Raises:
+        httpx.HTTPStatusError: If the server returns an error status
+        zipfile.BadZipFile: If the download is not a valid zip archive
+    """
+    import tempfile
+    import zipfile
+    import httpx
+    
+    with tempfile.SpooledTemporaryFile(max_size=COREML_SPOOL_MAX_SIZE) as spool:
+        async with httpx.AsyncClient(follow_redirects=True, timeout=httpx.Timeout(30.0, read=60.0)) as client:
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    spool.write(chunk)
+        
+        def extract() -> None:
+            spool.seek(0)
+            with zipfile.ZipFile(spool) as archive:
+                archive.extractall(dest_dir)
+        
+        extraction = asyncio.ensure_future(asyncio.to_thread(extract))
+        try:
+            await asyncio.shield(extraction)
+        except asyncio.CancelledError:
+            # The thread can't be interrupted; let it finish (with the spool
+            # still open) so a caller cleaning up doesn't race its writes
+            await asyncio.gather(extraction, return_exceptions=True)
+            raise
+
+
 async def download_coreml_model(
     model: str,
     models_dir: Union[str, Path]
@@ -205,7 +265,6 @@ async def download_coreml_model(
     """
     models_dir = Path(models_dir)
     coreml_dir = models_dir / f"ggml-{model}-encoder.mlmodelc"
-    coreml_zip = models_dir / f"ggml-{model}-encoder.mlmodelc.zip"
 
     # Check if already exists
     if coreml_dir.exists():
@@ -222,23 +281,8 @@ async def download_coreml_model(
     logger.info(f"Downloading pre-built Core ML model for {model} from Hugging Face...")
 
     try:
-        # Download with progress bar
-        success = await download_with_progress_async(
-            url=coreml_url,
-            destination=coreml_zip,
-            description=f"Downloading Core ML model for {model}"
-        )
-
-        if not success:
-            return {
-                "success": False,
-                "error": "Failed to download Core ML model"
-            }
-
-        logger.info(f"Download complete. Extracting Core ML model...")
-
-        # Extract the zip file
-        shutil.unpack_archive(coreml_zip, models_dir, 'zip')
+        models_dir.mkdir(parents=True, exist_ok=True)
+        await _download_and_extract_zip(coreml_url, models_dir)
 
         # Handle large-v2 naming mismatch
         # The large-v2 zip contains "ggml-large-encoder.mlmodelc" instead of "ggml-large-v2-encoder.mlmodelc"
@@ -248,8 +292,6 @@ async def download_coreml_model(
                 logger.info(f"Fixing large-v2 naming: renaming {legacy_dir.name} to {coreml_dir.name}")
                 shutil.move(str(legacy_dir), str(coreml_dir))
 
-        # Clean up zip file
-        coreml_zip.unlink()
         logger.info(f"Core ML model extracted to {coreml_dir}")
 
         # Verify extraction
@@ -1,5 +1,6 @@
 """Enhanced version detection for voice mode."""
 
+import functools
 import os
 import subprocess
 from pathlib import Path
@@ -43,36 +44,43 @@ def is_git_repository() -> bool:
         return False
 
 
+def get_git_describe() -> Optional[str]:
+    """Get the short commit hash with a -dirty suffix for uncommitted changes.
+    
+    One `git describe` call covers both the commit and the dirty check, and
+    fails (returning None) when not run from a git checkout. Tags are
+    excluded so the output is always just the hash. Only changes to tracked
+    files count as dirty; untracked files do not.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "describe", "--always", "--dirty", "--abbrev=7", "--exclude=*"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return result.stdout.strip() or None
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
-    """Get the version string, including dev suffix if running from git."""
-    # Start with base version
-    version = base_version
+    """Get the version string, including dev suffix if running from git.
+    
+    Set VOICEMODE_SKIP_GIT_VERSION=1 to skip the git lookup entirely, e.g. in
+    deployments without git installed.
+    """
+    if os.getenv("VOICEMODE_SKIP_GIT_VERSION", "").lower() in ("true", "1", "yes", "on"):
+        return base_version
     
-    # Check if we're in a git repository
-    if is_git_repository():
-        commit = get_git_commit_hash()
-        if commit:
-            # Check if we have uncommitted changes
-            try:
-                module_dir = Path(__file__).parent
-                result = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    cwd=module_dir,
-                    capture_output=True,
-                    text=True
-                )
-                has_changes = bool(result.stdout.strip())
-                
-                # Format: 2.16.0-dev.abc1234 or 2.16.0-dev.abc1234-dirty
-                version = f"{base_version}-dev.{commit}"
-                if has_changes:
-                    version += "-dirty"
-                    
-            except Exception:
-                # Fallback to just commit if status check fails
-                version = f"{base_version}-dev.{commit}"
+    # Format: 2.16.0-dev.abc1234 or 2.16.0-dev.abc1234-dirty
+    describe = get_git_describe()
+    if describe:
+        return f"{base_version}-dev.{describe}"
     
-    return version
+    return base_version
 
 
 # Export the enhanced version
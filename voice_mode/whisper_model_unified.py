@@ -2,14 +2,26 @@
 
 import click
 import asyncio
+import bisect
+import functools
 import json
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
+def _sorted_model_names() -> tuple:
+    """Get the registry's model names, sorted once for prefix lookups."""
+    from voice_mode.tools.whisper.models import WHISPER_MODEL_REGISTRY
+    return tuple(sorted(WHISPER_MODEL_REGISTRY))
+
+
 def model_name_completion(ctx, args, incomplete):
     """Provide shell completion for model names."""
-    from voice_mode.tools.whisper.models import WHISPER_MODEL_REGISTRY
-    return [name for name in WHISPER_MODEL_REGISTRY.keys() if name.startswith(incomplete)]
+    names = _sorted_model_names()
+    # Names sharing the prefix form one contiguous run in sorted order
+    start = bisect.bisect_left(names, incomplete)
+    end = bisect.bisect_left(names, incomplete + "\uffff", start)
+    return list(names[start:end])
 
 
 @click.command("model",
@@ -39,8 +51,9 @@ def whisper_model_unified(model_name, all, no_install, no_activate, no_restart):
         get_active_model,
         is_whisper_model_installed,
         get_installed_whisper_models,
+        get_coreml_models,
+        scan_model_directory,
         format_size,
-        has_whisper_coreml_model,
         set_active_model
     )
     import subprocess
@@ -49,7 +62,9 @@ def whisper_model_unified(model_name, all, no_install, no_activate, no_restart):
     if all:
         model_dir = get_model_directory()
         current_model = get_active_model()
-        installed_models = get_installed_whisper_models()
+        files, dirs = scan_model_directory(model_dir)
+        installed_models = get_installed_whisper_models(files)
+        coreml_models = get_coreml_models(dirs)
 
         # Calculate totals in MB (format_size expects MB)
         total_installed_size = sum(
@@ -66,8 +81,8 @@ def whisper_model_unified(model_name, all, no_install, no_activate, no_restart):
 
         # Display each model
         for name, info in WHISPER_MODEL_REGISTRY.items():
-            is_installed = is_whisper_model_installed(name)
-            has_coreml = has_whisper_coreml_model(name)
+            is_installed = name in installed_models
+            has_coreml = name in coreml_models
 
             # Status indicator
             if is_installed and has_coreml: